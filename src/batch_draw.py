@@ -0,0 +1,129 @@
+#
+# Desenho de pontos em lote
+#
+# Desenhar milhares de agentes com uma chamada de pyxel.pset (ou camera.pset)
+# por ponto custa tanto quanto simulá-los. Aqui as posições e cores chegam
+# como vetores, a transformação da câmera é feita de uma vez com o NumPy e
+# os pontos são rasterizados em uma camada que é copiada para a tela com um
+# único blt.
+#
+# StaticLayer faz o mesmo para formas que quase nunca mudam (blocos, paredes):
+# elas são desenhadas uma vez em um banco de imagens e só o retângulo de uma
+# forma removida é apagado depois.
+#
+import numpy as np
+import pyxel
+
+HEX_DIGITS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+
+
+def hex_rows(block):
+    """
+    Linhas de um bloco de cores como strings de dígitos hexadecimais, o
+    formato de pyxel.image(n).set().
+    """
+    block = np.ascontiguousarray(block)
+    rows = HEX_DIGITS[block].view(f"S{block.shape[1]}").ravel()
+    return [row.decode() for row in rows]
+
+
+def to_screen(x, y, offset=(0, 0), flip_y=False, height=None):
+    """
+    Converte coordenadas do mundo em pixels da tela.
+
+    Com flip_y=True o eixo y aponta para cima, como em
+    easymunk.pyxel.Camera(flip_y=True), e offset é o canto inferior esquerdo
+    da região visível. Sem flip_y, offset=(0, 0) corresponde às coordenadas
+    de tela usuais do pyxel.
+    """
+    ox, oy = offset
+    sx = np.floor(np.asarray(x) - ox).astype(np.int64)
+    if flip_y:
+        height = pyxel.height if height is None else height
+        sy = np.floor(height - 1 - (np.asarray(y) - oy)).astype(np.int64)
+    else:
+        sy = np.floor(np.asarray(y) - oy).astype(np.int64)
+    return sx, sy
+
+
+class PointLayer:
+    """
+    Camada do tamanho da tela onde os pontos são desenhados em lote.
+
+    A camada é transferida para o banco de imagens `bank` e desenhada com
+    pyxel.blt usando `colkey` como cor transparente (pontos com essa cor não
+    aparecem). No pyxel sem janela de headless.py, a camada é copiada
+    diretamente para o framebuffer.
+    """
+
+    def __init__(self, width=None, height=None, bank=2, colkey=0):
+        self.width = pyxel.width if width is None else width
+        self.height = pyxel.height if height is None else height
+        self.bank = bank
+        self.colkey = colkey
+        self.layer = np.full((self.height, self.width), colkey, dtype=np.uint8)
+
+    def draw(self, x, y, colors, offset=(0, 0), flip_y=False):
+        """
+        Desenha os pontos (x[k], y[k]) com as cores colors[k] (índices da
+        paleta ou uma única cor para todos).
+        """
+        sx, sy = to_screen(x, y, offset, flip_y, self.height)
+        visible = (sx >= 0) & (sx < self.width) & (sy >= 0) & (sy < self.height)
+        colors = np.broadcast_to(np.asarray(colors, dtype=np.uint8), visible.shape)
+
+        self.layer.fill(self.colkey)
+        self.layer[sy[visible], sx[visible]] = colors[visible]
+        self.blit()
+
+    def draw_camera(self, x, y, colors, camera):
+        """
+        Como draw(), mas usando o deslocamento de uma easymunk.pyxel.Camera.
+        """
+        self.draw(x, y, colors, tuple(camera.offset), getattr(camera, "flip_y", True))
+
+    def blit(self):
+        screen = getattr(pyxel, "screen", None)
+        if isinstance(screen, np.ndarray):
+            mask = self.layer != self.colkey
+            screen[: self.height, : self.width][mask] = self.layer[mask]
+            return
+
+        pyxel.image(self.bank).set(0, 0, hex_rows(self.layer))
+        pyxel.blt(0, 0, self.bank, 0, 0, self.width, self.height, self.colkey)
+
+
+class StaticLayer:
+    """
+    Camada retida no banco de imagens `bank`.
+
+    As formas são desenhadas uma vez com rect(); cada quadro só faz um blit().
+    Ao remover uma forma, erase() apaga o seu retângulo (pinta com `colkey`,
+    a cor transparente), sem redesenhar o resto. Uma cópia da camada fica em
+    um array e só o retângulo alterado é enviado ao banco com image(n).set(),
+    que é o que o Image do pyxel 1.x oferece.
+    """
+
+    def __init__(self, width=None, height=None, bank=1, colkey=0):
+        self.width = pyxel.width if width is None else width
+        self.height = pyxel.height if height is None else height
+        self.bank = bank
+        self.colkey = colkey
+        self.layer = np.full((self.height, self.width), colkey, dtype=np.uint8)
+        self.upload(0, 0, self.width, self.height)
+
+    def rect(self, x, y, w, h, col):
+        x0, y0 = min(max(int(x), 0), self.width), min(max(int(y), 0), self.height)
+        x1, y1 = min(max(int(x + w), x0), self.width), min(max(int(y + h), y0), self.height)
+        self.layer[y0:y1, x0:x1] = col
+        self.upload(x0, y0, x1, y1)
+
+    def erase(self, x, y, w, h):
+        self.rect(x, y, w, h, self.colkey)
+
+    def upload(self, x0, y0, x1, y1):
+        if x0 < x1 and y0 < y1:
+            pyxel.image(self.bank).set(x0, y0, hex_rows(self.layer[y0:y1, x0:x1]))
+
+    def blit(self):
+        pyxel.blt(0, 0, self.bank, 0, 0, self.width, self.height, self.colkey)
@@ -0,0 +1,404 @@
+#
+# Benchmarks dos motores de física
+#
+# Roda os mesmos cenários (bolas em uma caixa, uma fileira de bolas como no
+# pêndulo de Newton e um nível de plataforma) no motor escrito à mão em
+# motor-simples.py, no pymunk puro e no easymunk, sem abrir janela. Para cada
+# combinação de motor, cenário e número de corpos N, mede passos por
+# segundo, percentis da duração de cada passo e a variação relativa da
+# energia. Cada motor declara os cenários que consegue montar; os outros
+# são ignorados.
+#
+# Uso:
+#
+#   $ python benchmark.py --sizes 10 100 1000 --output bench.json
+#   $ python benchmark.py --compare bench.json   # compara com execução anterior
+#
+import json
+import time
+import random
+import platform
+import argparse
+import subprocess
+import importlib.util
+from pathlib import Path
+import numpy as np
+import headless
+
+FPS = 30
+RADIUS = 5
+SPEED = 50
+GRAVITY = (0, 50)
+SCENARIO = """
+|
+|
+|
+|
+|                                              =
+|                                              ==
+|                     ===                      ===
+|                                              ====
+|            ===   ===             ===         =====
+|                                  ===
+|=====    ===                      ===
+|X
+|X
+"""
+
+
+def load_script(name):
+    """
+    Importa um dos exemplos com hífen no nome (ex.: motor-simples.py).
+    """
+    path = Path(__file__).parent / name
+    spec = importlib.util.spec_from_file_location(path.stem.replace("-", "_"), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def box_size(n):
+    # Caixa quadrada com densidade constante de bolas
+    return max(int(np.ceil(np.sqrt(n))) * 4 * RADIUS, 20 * RADIUS)
+
+
+def ball_states(n, seed=0):
+    """
+    Posições em uma grade com ruído (sem sobreposição) e velocidades
+    aleatórias para n bolas.
+    """
+    rng = random.Random(seed)
+    size = box_size(n)
+    cols = int(np.ceil(np.sqrt(n)))
+    step = size / cols
+    for k in range(n):
+        i, j = divmod(k, cols)
+        x = (j + 0.5) * step + rng.uniform(-1, 1)
+        y = (i + 0.5) * step + rng.uniform(-1, 1)
+        yield x, y, rng.uniform(-SPEED, SPEED), rng.uniform(-SPEED, SPEED)
+
+
+def cradle_states(n):
+    """
+    Cenário "cradle": n bolas encostadas em fila, sem gravidade e sem
+    juntas, e uma bola a mais chegando pela esquerda. Retorna a largura e a
+    altura da caixa e os estados (x, y, vx, vy).
+    """
+    d = 2 * RADIUS
+    balls = [(50 + k * d, 50, 0, 0) for k in range(n)]
+    balls[0] = (50 - d, 50, SPEED, 0)
+    return n * d + 100, 100, balls
+
+
+def level_boxes(scenario=SCENARIO, scale=8):
+    """
+    Converte o mapa em texto em retângulos (x, y, largura, altura) juntando
+    os "=" consecutivos de cada linha.
+    """
+    boxes = []
+    for row, line in enumerate(scenario.strip("\n").splitlines()):
+        col = 0
+        while col < len(line):
+            if line[col] == "=":
+                end = col
+                while end < len(line) and line[end] == "=":
+                    end += 1
+                boxes.append((2 * col * scale, row * scale, 2 * (end - col) * scale, scale))
+                col = end
+            else:
+                col += 1
+    return boxes
+
+
+#
+# Motores
+#
+class MotorEngine:
+    """
+    Motor de motor-simples.py. A classe do espaço define a implementação
+    (Space, ArraySpace ou EventSpace). Não há geometria estática, então o
+    cenário de plataforma não é suportado.
+    """
+
+    scenarios = ("balls", "cradle")
+
+    def __init__(self, space_class_name):
+        self.module = load_script("motor-simples.py")
+        self.space_class = getattr(self.module, space_class_name)
+
+    def make(self, width, height, balls, gravity=GRAVITY):
+        space = self.space_class(width, height)
+        for x, y, vx, vy in balls:
+            ball = self.module.Ball(x, y, vx, vy, radius=RADIUS)
+            ball.fx, ball.fy = gravity
+            space.add(ball)
+
+        def step():
+            n = space.sub_steps
+            for _ in range(n):
+                space.update(1 / FPS / n)
+
+        def energy():
+            return sum(
+                0.5 * b.mass * (b.vx**2 + b.vy**2) - b.fx * b.x - b.fy * b.y
+                for b in space.objects
+            )
+
+        return step, energy
+
+    def balls(self, n):
+        size = box_size(n)
+        return self.make(size, size, ball_states(n))
+
+    def cradle(self, n):
+        width, height, balls = cradle_states(n)
+        return self.make(width, height, balls, gravity=(0, 0))
+
+
+class PymunkEngine:
+    """
+    Pymunk puro, como em pymunk-simples.py e pendulo-newton.py.
+    """
+
+    scenarios = ("balls", "cradle", "platformer")
+
+    def __init__(self):
+        import pymunk
+
+        self.pymunk = pymunk
+
+    def new_space(self, gravity=GRAVITY):
+        space = self.pymunk.Space()
+        space.gravity = gravity
+        return space
+
+    def add_ball(self, space, x, y, vx, vy):
+        body = self.pymunk.Body(mass=1, moment=1)
+        circle = self.pymunk.Circle(body, RADIUS)
+        circle.elasticity = 1.0
+        body.position = (x, y)
+        body.velocity = (vx, vy)
+        space.add(body, circle)
+        return body
+
+    def add_walls(self, space, w, h):
+        body = space.static_body
+        walls = [
+            self.pymunk.Segment(body, (0, h), (w, h), 1),
+            self.pymunk.Segment(body, (0, 0), (w, 0), 1),
+            self.pymunk.Segment(body, (0, 0), (0, h), 1),
+            self.pymunk.Segment(body, (w, 0), (w, h), 1),
+        ]
+        for shape in walls:
+            shape.elasticity = 1.0
+        space.add(*walls)
+
+    def add_box(self, space, x, y, w, h):
+        shape = self.pymunk.Poly(space.static_body, [(x, y), (x + w, y), (x + w, y + h), (x, y + h)])
+        shape.elasticity = 1.0
+        space.add(shape)
+
+    def run(self, space):
+        gx, gy = space.gravity
+
+        def step():
+            space.step(1 / FPS)
+
+        def energy():
+            return sum(
+                0.5 * b.mass * b.velocity.dot(b.velocity)
+                + 0.5 * b.moment * b.angular_velocity**2
+                - b.mass * (gx * b.position.x + gy * b.position.y)
+                for b in space.bodies
+            )
+
+        return step, energy
+
+    def balls(self, n):
+        space = self.new_space()
+        size = box_size(n)
+        self.add_walls(space, size, size)
+        for state in ball_states(n):
+            self.add_ball(space, *state)
+        return self.run(space)
+
+    def cradle(self, n):
+        width, height, balls = cradle_states(n)
+        space = self.new_space((0, 0))
+        self.add_walls(space, width, height)
+        for state in balls:
+            self.add_ball(space, *state)
+        return self.run(space)
+
+    def platformer(self, n):
+        # O nível se repete na horizontal para manter a densidade de inimigos
+        space = self.new_space()
+        rng = random.Random(0)
+        level_width = 2 * len(max(SCENARIO.splitlines(), key=len)) * 8
+        height = len(SCENARIO.strip("\n").splitlines()) * 8
+        tiles = -(-n // 50)
+        width = tiles * level_width
+        self.add_walls(space, width, height)
+        for k in range(tiles):
+            for x, y, w, h in level_boxes():
+                self.add_box(space, x + k * level_width, y, w, h)
+        for _ in range(n):
+            x = rng.uniform(RADIUS, width - RADIUS)
+            y = rng.uniform(RADIUS, height / 3)
+            self.add_ball(space, x, y, rng.uniform(-SPEED, SPEED), 0)
+        return self.run(space)
+
+
+class EasymunkEngine(PymunkEngine):
+    """
+    Easymunk, criando o espaço com phys.space() como nos exemplos.
+    """
+
+    def __init__(self):
+        import easymunk
+        from easymunk import pyxel as phys
+
+        self.pymunk = easymunk
+        self.phys = phys
+
+    def new_space(self, gravity=GRAVITY):
+        return self.phys.space(gravity=gravity, elasticity=1.0)
+
+    def add_ball(self, space, x, y, vx, vy):
+        return space.create_circle(
+            RADIUS, mass=1, moment=1, position=(x, y), velocity=(vx, vy), elasticity=1.0
+        )
+
+    def add_walls(self, space, w, h):
+        body = space.static_body
+        for a, b in [((0, h), (w, h)), ((0, 0), (w, 0)), ((0, 0), (0, h)), ((w, 0), (w, h))]:
+            body.create_segment(a, b, 1, elasticity=1.0)
+
+    def add_box(self, space, x, y, w, h):
+        space.static_body.create_poly(
+            [(x, y), (x + w, y), (x + w, y + h), (x, y + h)], elasticity=1.0
+        )
+
+
+ENGINES = {
+    "motor": lambda: MotorEngine("Space"),
+    "motor-array": lambda: MotorEngine("ArraySpace"),
+    "motor-event": lambda: MotorEngine("EventSpace"),
+    "pymunk": PymunkEngine,
+    "easymunk": EasymunkEngine,
+}
+SCENARIOS = ["balls", "cradle", "platformer"]
+
+
+#
+# Medidas
+#
+def measure(step, energy, steps=100, warmup=5):
+    for _ in range(warmup):
+        step()
+
+    e0 = energy()
+    times = np.empty(steps)
+    clock = time.perf_counter
+    for k in range(steps):
+        start = clock()
+        step()
+        times[k] = clock() - start
+    e1 = energy()
+
+    p50, p90, p99 = np.percentile(times, [50, 90, 99]) * 1e3
+    return {
+        "steps_per_sec": steps / times.sum(),
+        "p50_ms": p50,
+        "p90_ms": p90,
+        "p99_ms": p99,
+        "energy_drift": (e1 - e0) / abs(e0) if e0 else 0.0,
+    }
+
+
+def run(engines=None, scenarios=SCENARIOS, sizes=(10, 100, 1000), steps=100, log=print):
+    # Os exemplos importam pyxel: usa a versão sem janela
+    headless.install()
+
+    results = []
+    for name in engines or ENGINES:
+        try:
+            engine = ENGINES[name]()
+        except ImportError as ex:
+            log(f"{name}: ignorado ({ex})")
+            continue
+
+        for scenario in scenarios:
+            if scenario not in engine.scenarios:
+                log(f"{name}: cenário {scenario} não suportado")
+                continue
+            for n in sizes:
+                step, energy = getattr(engine, scenario)(n)
+                row = {"engine": name, "scenario": scenario, "n": n, "steps": steps}
+                row.update(measure(step, energy, steps))
+                results.append(row)
+                log(format_row(row))
+    return results
+
+
+def metadata():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "commit": commit,
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+    }
+
+
+def format_row(row, ref=None):
+    msg = (
+        f"{row['engine']:>12} {row['scenario']:>10} N={row['n']:<6} "
+        f"{row['steps_per_sec']:10.1f} passos/s  "
+        f"p50={row['p50_ms']:.3f}ms p99={row['p99_ms']:.3f}ms  "
+        f"dE={row['energy_drift']:+.2e}"
+    )
+    if ref is not None:
+        msg += f"  ({row['steps_per_sec'] / ref['steps_per_sec']:.2f}x)"
+    return msg
+
+
+def compare(results, path):
+    """
+    Mostra a razão de passos por segundo em relação a um arquivo anterior.
+    """
+    old = json.loads(Path(path).read_text())
+    key = lambda r: (r["engine"], r["scenario"], r["n"])
+    reference = {key(r): r for r in old["results"]}
+    print(f"Comparação com {path} (commit {old['meta'].get('commit') or '?'}):")
+    for row in results:
+        print(format_row(row, reference.get(key(row))))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks dos motores de física.")
+    parser.add_argument("--engines", nargs="+", choices=list(ENGINES), default=None)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10, 100, 1000])
+    parser.add_argument("--steps", type=int, default=100)
+    parser.add_argument("--output", default="bench.json", help="arquivo JSON com os resultados")
+    parser.add_argument("--compare", default=None, help="JSON de uma execução anterior")
+    args = parser.parse_args(argv)
+
+    results = run(args.engines, args.scenarios, args.sizes, args.steps)
+    data = {"meta": metadata(), "results": results}
+    Path(args.output).write_text(json.dumps(data, indent=2))
+    print(f"Resultados salvos em {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
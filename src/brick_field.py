@@ -0,0 +1,269 @@
+#
+# Campo de tijolos em grade
+#
+# Em vez de um corpo estático e um polígono por tijolo no motor de física, os
+# tijolos de um breakout ficam em uma grade regular e cada um é só um bit em
+# uma matriz de ocupação. A colisão com a bola é resolvida diretamente: o
+# caminho do centro em um passo é recortado à grade inflada pelo raio e
+# percorrido célula a célula (DDA de Amanatides e Woo). Em cada célula, os
+# tijolos presentes ao alcance do raio são testados de forma exata contra o
+# círculo em movimento (o centro contra o retângulo inflado pelo raio, de
+# cantos arredondados), e o contato mais cedo vence. Remover um tijolo é
+# apagar um bit. A plataforma e as paredes continuam no pymunk.
+#
+# Uso (ver pymunk-breakout.py):
+#
+#   field = BrickField(origin=(7.5, 12), pitch=(26, 7), size=(25, 6), shape=(10, 9))
+#   hit = field.sweep(previous, position, radius)
+#   if hit:
+#       field.remove(hit.row, hit.col)
+#       velocity = reflect(velocity, hit.normal)
+#
+from math import floor, hypot, inf, sqrt
+from typing import NamedTuple, Tuple
+import numpy as np
+
+
+# Recuo (em pixels) da posição livre em relação ao ponto de contato
+EPSILON = 1e-3
+
+
+class Hit(NamedTuple):
+    row: int
+    col: int
+    position: Tuple[float, float]
+    normal: Tuple[float, float]
+
+
+def reflect(velocity, normal):
+    """
+    Reflete a velocidade na direção da normal, se estiver indo contra ela.
+    """
+    vx, vy = velocity
+    nx, ny = normal
+    dot = vx * nx + vy * ny
+    if dot >= 0:
+        return vx, vy
+    return vx - 2 * dot * nx, vy - 2 * dot * ny
+
+
+def slab(x, y, dx, dy, left, top, right, bottom):
+    """
+    Intervalo (t_in, t_out) em que o ponto (x, y) + t * (dx, dy) fica dentro
+    da caixa, ou None se a reta não a cruza.
+    """
+    t_in, t_out = -inf, inf
+    for p, d, lo, hi in ((x, dx, left, right), (y, dy, top, bottom)):
+        if d == 0:
+            if p < lo or p > hi:
+                return None
+            continue
+        a, b = (lo - p) / d, (hi - p) / d
+        t_in, t_out = max(t_in, min(a, b)), min(t_out, max(a, b))
+    if t_in > t_out:
+        return None
+    return t_in, t_out
+
+
+def swept_circle_rect(x, y, dx, dy, radius, rect):
+    """
+    Primeiro instante t em [0, 1] em que o círculo, indo de (x, y) até
+    (x + dx, y + dy), encosta no retângulo, como (t, normal), ou None.
+
+    Equivale a lançar o centro contra o retângulo inflado pelo raio, com os
+    cantos arredondados.
+    """
+    left, top, w, h = rect
+    right, bottom = left + w, top + h
+    span = slab(x, y, dx, dy, left - radius, top - radius, right + radius, bottom + radius)
+    if span is None or span[0] > 1 or span[1] < 0:
+        return None
+
+    t = max(span[0], 0.0)
+    px, py = x + dx * t, y + dy * t
+    cx = left if px < left else right if px > right else None
+    cy = top if py < top else bottom if py > bottom else None
+
+    if cx is None or cy is None:
+        # Entrou por uma face
+        if cx is None:
+            normal = (0.0, -1.0) if py < top + h / 2 else (0.0, 1.0)
+        else:
+            normal = (-1.0, 0.0) if px < left + w / 2 else (1.0, 0.0)
+        if dx * normal[0] + dy * normal[1] >= 0:
+            return None
+        return t, normal
+
+    # Região de um canto: só o círculo de raio `radius` em volta dele
+    fx, fy = x - cx, y - cy
+    a = dx * dx + dy * dy
+    b = fx * dx + fy * dy
+    c = fx * fx + fy * fy - radius * radius
+    disc = b * b - a * c
+    if a == 0 or disc < 0:
+        return None
+    t = (-b - sqrt(disc)) / a
+    if not 0 <= t <= 1:
+        return None
+    return t, ((fx + dx * t) / radius, (fy + dy * t) / radius)
+
+
+class BrickField:
+    """
+    Grade com shape = (linhas, colunas) tijolos de tamanho `size`.
+
+    O canto superior esquerdo do tijolo (row, col) fica em
+    origin + (col, row) * pitch. Todos começam presentes.
+    """
+
+    def __init__(self, origin, pitch, size, shape):
+        self.x0, self.y0 = map(float, origin)
+        self.px, self.py = map(float, pitch)
+        self.w, self.h = map(float, size)
+        if self.w > self.px or self.h > self.py:
+            raise ValueError("os tijolos não podem ser maiores que o espaçamento da grade.")
+        self.alive = np.ones(shape, dtype=bool)
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive))
+
+    def rect(self, row, col):
+        """
+        Retângulo (x, y, largura, altura) do tijolo.
+        """
+        return self.x0 + col * self.px, self.y0 + row * self.py, self.w, self.h
+
+    def bricks(self):
+        """
+        Índices (row, col) dos tijolos presentes.
+        """
+        for row, col in np.argwhere(self.alive):
+            yield int(row), int(col)
+
+    def remove(self, row, col):
+        self.alive[row, col] = False
+
+    def span(self, left, top, right, bottom):
+        """
+        Intervalos (r0, r1, c0, c1) das células que a caixa cobre.
+        """
+        rows, cols = self.alive.shape
+        c0 = max(floor((left - self.x0) / self.px), 0)
+        c1 = min(floor((right - self.x0) / self.px) + 1, cols)
+        r0 = max(floor((top - self.y0) / self.py), 0)
+        r1 = min(floor((bottom - self.y0) / self.py) + 1, rows)
+        return r0, r1, c0, c1
+
+    def cells(self, x, y, radius):
+        """
+        Intervalos (r0, r1, c0, c1) das células cobertas pela caixa do
+        círculo.
+        """
+        return self.span(x - radius, y - radius, x + radius, y + radius)
+
+    def overlap(self, x, y, radius):
+        """
+        Tijolo mais próximo que intercepta o círculo, como (row, col, normal),
+        ou None. A normal aponta do tijolo para o centro do círculo.
+        """
+        r0, r1, c0, c1 = self.cells(x, y, radius)
+        if r0 >= r1 or c0 >= c1:
+            return None
+
+        best = None
+        for row, col in np.argwhere(self.alive[r0:r1, c0:c1]):
+            row, col = int(row) + r0, int(col) + c0
+            left, top, w, h = self.rect(row, col)
+            qx = min(max(x, left), left + w)
+            qy = min(max(y, top), top + h)
+            dist = hypot(x - qx, y - qy)
+            if dist >= radius or (best and dist >= best[0]):
+                continue
+            if dist > 0:
+                normal = ((x - qx) / dist, (y - qy) / dist)
+            else:
+                # Centro dentro do tijolo: sai pelo lado mais próximo
+                sides = [
+                    (x - left, (-1.0, 0.0)),
+                    (left + w - x, (1.0, 0.0)),
+                    (y - top, (0.0, -1.0)),
+                    (top + h - y, (0.0, 1.0)),
+                ]
+                normal = min(sides)[1]
+            best = (dist, row, col, normal)
+        return best and best[1:]
+
+    def sweep(self, start, end, radius):
+        """
+        Primeiro tijolo atingido pelo círculo ao ir de start até end.
+
+        Retorna um Hit com a posição livre logo antes do contato, ou None.
+        """
+        x, y = map(float, start)
+        x1, y1 = map(float, end)
+        found = self.overlap(x, y, radius)
+        if found:
+            row, col, normal = found
+            return Hit(row, col, (x, y), normal)
+
+        dx, dy = x1 - x, y1 - y
+        length = hypot(dx, dy)
+        if length == 0:
+            return None
+
+        # Trecho do caminho dentro da grade inflada pelo raio
+        rows, cols = self.alive.shape
+        right, bottom = self.x0 + cols * self.px, self.y0 + rows * self.py
+        span = slab(x, y, dx, dy, self.x0 - radius, self.y0 - radius, right + radius, bottom + radius)
+        if span is None or span[0] > 1 or span[1] < 0:
+            return None
+        t, t_end = max(span[0], 0.0), min(span[1], 1.0)
+
+        # Célula do centro no início do trecho e instantes em que ele cruza
+        # a próxima divisória vertical (t_x) e horizontal (t_y)
+        col = floor((x + dx * t - self.x0) / self.px)
+        row = floor((y + dy * t - self.y0) / self.py)
+        step_c, step_r = (1 if dx > 0 else -1), (1 if dy > 0 else -1)
+        if dx:
+            t_x = (self.x0 + (col + (dx > 0)) * self.px - x) / dx
+            dt_x = self.px / abs(dx)
+        else:
+            t_x = dt_x = inf
+        if dy:
+            t_y = (self.y0 + (row + (dy > 0)) * self.py - y) / dy
+            dt_y = self.py / abs(dy)
+        else:
+            t_y = dt_y = inf
+
+        tested = set()
+        best = None
+        while True:
+            # Tijolos ao alcance do círculo enquanto o centro está na célula
+            left, top = self.x0 + col * self.px, self.y0 + row * self.py
+            r0, r1, c0, c1 = self.span(left - radius, top - radius, left + self.px + radius, top + self.py + radius)
+            for i in range(r0, r1):
+                for j in range(c0, c1):
+                    if not self.alive[i, j] or (i, j) in tested:
+                        continue
+                    tested.add((i, j))
+                    found = swept_circle_rect(x, y, dx, dy, radius, self.rect(i, j))
+                    if found and (best is None or found[0] < best[0]):
+                        best = (found[0], i, j, found[1])
+
+            # Um contato anterior à saída da célula não pode ser superado
+            # pelos tijolos das próximas
+            t_exit = min(t_x, t_y, t_end)
+            if (best and best[0] <= t_exit) or t_exit >= t_end:
+                break
+            if t_x < t_y:
+                col += step_c
+                t_x += dt_x
+            else:
+                row += step_r
+                t_y += dt_y
+
+        if best is None:
+            return None
+        t, row, col, normal = best
+        t = max(t - EPSILON / length, 0.0)
+        return Hit(row, col, (x + dx * t, y + dy * t), normal)
@@ -0,0 +1,357 @@
+#
+# Pyxel sem janela
+#
+# Implementa as funções do pyxel usadas pelos exemplos (desenho, entrada e
+# laço principal) sem abrir uma janela. O desenho é ignorado ou feito em um
+# framebuffer na memória e pyxel.run() chama update/draw o mais rápido
+# possível até atingir o número de quadros ou o tempo limite.
+#
+# Uso:
+#
+#   $ python headless.py motor-simples.py --frames 300
+#
+# ou, dentro de outro programa, antes de importar pyxel ou easymunk:
+#
+#   import headless
+#   headless.install(frames=300)
+#
+# Os submódulos do pyxel (pyxel.ui, ...) não são implementados. Os exemplos
+# que dependem deles (ver UNSUPPORTED) param com uma mensagem de erro.
+#
+import sys
+import time
+import runpy
+import argparse
+import importlib.abc
+from pathlib import Path
+import numpy as np
+
+# Cores
+COLOR_BLACK = 0
+COLOR_NAVY = 1
+COLOR_PURPLE = 2
+COLOR_GREEN = 3
+COLOR_BROWN = 4
+COLOR_DARKBLUE = 5
+COLOR_LIGHTBLUE = 6
+COLOR_WHITE = 7
+COLOR_RED = 8
+COLOR_ORANGE = 9
+COLOR_YELLOW = 10
+COLOR_LIME = 11
+COLOR_CYAN = 12
+COLOR_GRAY = 13
+COLOR_PINK = 14
+COLOR_PEACH = 15
+DEFAULT_PALETTE = [
+    0x000000, 0x1D2B53, 0x7E2553, 0x008751, 0xAB5236, 0x5F574F, 0xC2C3C7, 0xFFF1E8,
+    0xFF004D, 0xFFA300, 0xFFEC27, 0x00E436, 0x29ADFF, 0x83769C, 0xFF77A8, 0xFFCCAA,
+]
+FONT_WIDTH = 4
+FONT_HEIGHT = 6
+
+# Estado da "janela"
+width = 0
+height = 0
+frame_count = 0
+mouse_x = 0
+mouse_y = 0
+screen = None
+keys = set()
+
+# Condições de parada e estatísticas da última execução
+max_frames = 300
+max_seconds = None
+framebuffer = False
+elapsed = 0.0
+
+_previous_keys = set()
+
+# Submódulos do pyxel ausentes aqui e os exemplos que os importam
+UNSUPPORTED = {"pyxel.ui": ["col-lab.py"]}
+
+
+class Quit(Exception):
+    """
+    Interrompe o laço de pyxel.run().
+    """
+
+
+class _Submodules(importlib.abc.MetaPathFinder):
+    """
+    Recusa "import pyxel.<submódulo>" com uma mensagem clara, em vez de
+    deixar o import procurar o submódulo do pyxel verdadeiro.
+    """
+
+    def find_spec(self, name, path, target=None):
+        if not name.startswith("pyxel."):
+            return None
+        demos = UNSUPPORTED.get(name) or UNSUPPORTED.get(".".join(name.split(".")[:2]), [])
+        used_by = f" (usado por {', '.join(demos)})" if demos else ""
+        raise ImportError(f"o pyxel sem janela não implementa {name}{used_by}", name=name)
+
+
+def __getattr__(name):
+    # Teclas e botões são apenas identificadores passados de volta para btn()
+    if name.startswith(("KEY_", "MOUSE_", "GAMEPAD")):
+        return name
+    raise AttributeError(name)
+
+
+def install(frames=300, seconds=None, with_screen=False):
+    """
+    Registra este módulo como "pyxel" em sys.modules.
+
+    Deve ser chamado antes de qualquer "import pyxel", inclusive os feitos
+    indiretamente pelo easymunk.
+    """
+    global max_frames, max_seconds, framebuffer
+    max_frames = frames
+    max_seconds = seconds
+    framebuffer = with_screen
+    module = sys.modules[__name__]
+    sys.modules["pyxel"] = module
+
+    # Com __path__, "import pyxel.ui" consulta os finders em vez de falhar
+    # com "'pyxel' is not a package"
+    module.__path__ = []
+    if not any(isinstance(finder, _Submodules) for finder in sys.meta_path):
+        sys.meta_path.insert(0, _Submodules())
+    return module
+
+
+#
+# Sistema
+#
+def init(w, h, caption=None, fps=30, palette=None, **kwargs):
+    global width, height, frame_count, screen
+    width, height = int(w), int(h)
+    frame_count = 0
+    screen = np.zeros((height, width), dtype=np.uint8) if framebuffer else None
+
+
+def run(update, draw):
+    """
+    Executa update() e draw() sem pausa entre os quadros até atingir
+    max_frames ou max_seconds (o que vier primeiro) ou até pyxel.quit().
+    """
+    global frame_count, elapsed, _previous_keys
+    start = time.perf_counter()
+    try:
+        while max_frames is None or frame_count < max_frames:
+            update()
+            draw()
+            frame_count += 1
+            _previous_keys = set(keys)
+            if max_seconds is not None and time.perf_counter() - start >= max_seconds:
+                break
+    except Quit:
+        pass
+    elapsed = time.perf_counter() - start
+
+
+def quit():
+    raise Quit
+
+
+def mouse(visible):
+    pass
+
+
+def load(filename, **kwargs):
+    pass
+
+
+#
+# Entrada
+#
+def btn(key):
+    return key in keys
+
+
+def btnp(key, hold=None, period=None):
+    return key in keys and key not in _previous_keys
+
+
+def btnr(key):
+    return key in _previous_keys and key not in keys
+
+
+#
+# Desenho
+#
+def _clip(x0, y0, x1, y1):
+    x0, x1 = max(int(x0), 0), min(int(x1), width)
+    y0, y1 = max(int(y0), 0), min(int(y1), height)
+    return x0, y0, x1, y1
+
+
+def _fill(mask_fn, x0, y0, x1, y1, col):
+    # Pinta os pixels do retângulo [x0, x1) x [y0, y1) selecionados pela máscara
+    x0, y0, x1, y1 = _clip(x0, y0, x1, y1)
+    if x0 >= x1 or y0 >= y1:
+        return
+    ys, xs = np.mgrid[y0:y1, x0:x1]
+    region = screen[y0:y1, x0:x1]
+    region[mask_fn(xs, ys)] = col
+
+
+def cls(col):
+    if screen is not None:
+        screen[:] = col
+
+
+def pset(x, y, col):
+    if screen is not None:
+        x, y = int(x), int(y)
+        if 0 <= x < width and 0 <= y < height:
+            screen[y, x] = col
+
+
+def pget(x, y):
+    if screen is None:
+        return 0
+    return int(screen[int(y), int(x)])
+
+
+def line(x1, y1, x2, y2, col):
+    if screen is not None:
+        n = int(max(abs(x2 - x1), abs(y2 - y1))) + 1
+        xs = np.rint(np.linspace(x1, x2, n)).astype(int)
+        ys = np.rint(np.linspace(y1, y2, n)).astype(int)
+        ok = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        screen[ys[ok], xs[ok]] = col
+
+
+def rect(x, y, w, h, col):
+    if screen is not None:
+        x0, y0, x1, y1 = _clip(x, y, x + w, y + h)
+        screen[y0:y1, x0:x1] = col
+
+
+def rectb(x, y, w, h, col):
+    line(x, y, x + w - 1, y, col)
+    line(x, y + h - 1, x + w - 1, y + h - 1, col)
+    line(x, y, x, y + h - 1, col)
+    line(x + w - 1, y, x + w - 1, y + h - 1, col)
+
+
+def circ(x, y, r, col):
+    if screen is not None:
+        inside = lambda xs, ys: (xs - x) ** 2 + (ys - y) ** 2 <= r * r
+        _fill(inside, x - r, y - r, x + r + 1, y + r + 1, col)
+
+
+def circb(x, y, r, col):
+    if screen is not None:
+        ring = lambda xs, ys: abs(np.hypot(xs - x, ys - y) - r) < 0.5
+        _fill(ring, x - r, y - r, x + r + 1, y + r + 1, col)
+
+
+def tri(x1, y1, x2, y2, x3, y3, col):
+    if screen is not None:
+
+        def inside(xs, ys):
+            d1 = (xs - x2) * (y1 - y2) - (x1 - x2) * (ys - y2)
+            d2 = (xs - x3) * (y2 - y3) - (x2 - x3) * (ys - y3)
+            d3 = (xs - x1) * (y3 - y1) - (x3 - x1) * (ys - y1)
+            neg = (d1 < 0) | (d2 < 0) | (d3 < 0)
+            pos = (d1 > 0) | (d2 > 0) | (d3 > 0)
+            return ~(neg & pos)
+
+        xs, ys = (x1, x2, x3), (y1, y2, y3)
+        _fill(inside, min(xs), min(ys), max(xs) + 1, max(ys) + 1, col)
+
+
+def trib(x1, y1, x2, y2, x3, y3, col):
+    line(x1, y1, x2, y2, col)
+    line(x2, y2, x3, y3, col)
+    line(x3, y3, x1, y1, col)
+
+
+def text(x, y, s, col):
+    # Não há fonte: o texto não é desenhado
+    pass
+
+
+class Image:
+    """
+    Banco de imagem em memória (pyxel.image(n)).
+    """
+
+    HEX = np.zeros(256, dtype=np.uint8)
+    HEX[np.frombuffer(b"0123456789abcdef", dtype=np.uint8)] = np.arange(16)
+
+    def __init__(self, w=256, h=256):
+        self.data = np.zeros((h, w), dtype=np.uint8)
+
+    def set(self, x, y, data):
+        # Cada linha é uma string de dígitos hexadecimais (uma cor por pixel)
+        rows = np.frombuffer("".join(data).encode(), dtype=np.uint8)
+        block = self.HEX[rows].reshape(len(data), -1)
+        h, w = block.shape
+        self.data[y : y + h, x : x + w] = block
+
+    def pset(self, x, y, col):
+        h, w = self.data.shape
+        if 0 <= x < w and 0 <= y < h:
+            self.data[int(y), int(x)] = col
+
+    def pget(self, x, y):
+        return int(self.data[y, x])
+
+
+_images = {}
+
+
+def image(img):
+    if img not in _images:
+        _images[img] = Image()
+    return _images[img]
+
+
+def blt(x, y, img, u, v, w, h, colkey=None):
+    # Imagens carregadas com load() não existem aqui: os bancos só têm o que
+    # foi escrito com image(n).set()
+    if screen is None or img not in _images:
+        return
+    x, y, w, h = int(x), int(y), abs(int(w)), abs(int(h))
+    x0, y0, x1, y1 = _clip(x, y, x + w, y + h)
+    if x0 >= x1 or y0 >= y1:
+        return
+    block = _images[img].data[v + y0 - y : v + y1 - y, u + x0 - x : u + x1 - x]
+    region = screen[y0:y1, x0:x1]
+    if colkey is None:
+        region[:] = block
+    else:
+        region[block != colkey] = block[block != colkey]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Executa um exemplo sem abrir a janela do pyxel.")
+    parser.add_argument("script", help="arquivo do exemplo, ex.: motor-simples.py")
+    parser.add_argument("--frames", type=int, default=300, help="número de quadros (0 = sem limite)")
+    parser.add_argument("--seconds", type=float, default=None, help="tempo máximo de execução")
+    parser.add_argument("--screen", action="store_true", help="desenha em um framebuffer na memória")
+    args = parser.parse_args(argv)
+
+    module = install(args.frames or None, args.seconds, args.screen)
+    path = Path(args.script).resolve()
+    sys.path.insert(0, str(path.parent))
+    sys.argv = [str(path)]
+    try:
+        runpy.run_path(str(path), run_name="__main__")
+    except ImportError as exc:
+        if not (exc.name or "").startswith("pyxel."):
+            raise
+        sys.exit(f"{path.name}: {exc}")
+
+    rate = module.frame_count / module.elapsed if module.elapsed else float("inf")
+    print(f"{path.name}: {module.frame_count} quadros em {module.elapsed:.3f}s ({rate:.1f} quadros/s)")
+
+
+if __name__ == "__main__":
+    # Garante que pyxel e "import headless" usem a mesma instância do módulo
+    import headless
+
+    headless.main()
@@ -0,0 +1,139 @@
+#
+# Terreno como mapa de alturas
+#
+# Um chão que é função de x pode ser guardado como um vetor de alturas com
+# espaçamento regular. Assim a altura e a normal em qualquer x saem em O(1)
+# (a célula é só (x - x0) // dx), as consultas aceitam vetores do NumPy
+# (partículas, vários landers) e um raio só precisa visitar as células que
+# atravessa. Para o motor de física, o mapa vira segmentos estáticos, que
+# podem ser criados só para um trecho (ver index_range) em terrenos largos.
+#
+import numpy as np
+
+
+class Heightfield:
+    """
+    Chão com alturas heights[k] nas posições x0 + k * dx.
+
+    Fora do intervalo coberto, a altura é a da borda mais próxima.
+    """
+
+    def __init__(self, x0, dx, heights):
+        if dx <= 0:
+            raise ValueError("dx deve ser positivo.")
+        self.x0 = float(x0)
+        self.dx = float(dx)
+        self.heights = np.asarray(heights, dtype=float)
+        if len(self.heights) < 2:
+            raise ValueError("são necessárias ao menos duas alturas.")
+        self.cells = len(self.heights) - 1
+
+    @property
+    def x1(self):
+        return self.x0 + self.cells * self.dx
+
+    @classmethod
+    def random_walk(cls, x0, dx, n, y0=0.0, dy=1.0, seed=None):
+        """
+        Terreno com n células em que cada altura difere da anterior por um
+        valor uniforme em [-dy, dy].
+        """
+        rng = np.random.default_rng(seed)
+        steps = rng.uniform(-dy, dy, n)
+        return cls(x0, dx, np.concatenate([[y0], y0 + np.cumsum(steps)]))
+
+    def cell(self, x):
+        """
+        Índice da célula que contém x e a posição fracionária dentro dela.
+        """
+        pos = (np.asarray(x, dtype=float) - self.x0) / self.dx
+        i = np.clip(np.floor(pos), 0, self.cells - 1).astype(np.int64)
+        return i, np.clip(pos - i, 0.0, 1.0)
+
+    def height(self, x):
+        i, t = self.cell(x)
+        h = self.heights
+        y = h[i] + (h[i + 1] - h[i]) * t
+        return y if y.ndim else float(y)
+
+    def slope(self, x):
+        i, _ = self.cell(x)
+        s = (self.heights[i + 1] - self.heights[i]) / self.dx
+        return s if s.ndim else float(s)
+
+    def normal(self, x):
+        """
+        Normal unitária (nx, ny) do chão em x, apontando para cima.
+        """
+        s = np.asarray(self.slope(x))
+        norm = np.sqrt(1 + s * s)
+        nx, ny = -s / norm, 1 / norm
+        return (nx, ny) if s.ndim else (float(nx), float(ny))
+
+    def altitude(self, x, y):
+        """
+        Distância vertical até o chão (negativa abaixo dele).
+        """
+        alt = np.asarray(y, dtype=float) - self.height(x)
+        return alt if alt.ndim else float(alt)
+
+    def raycast(self, origin, direction, max_distance=np.inf):
+        """
+        Primeiro ponto em que o raio origin + t * direction (t >= 0) atinge
+        o chão. Retorna (t, (x, y)) com t em unidades de |direction|, ou None
+        se não atingir antes de max_distance.
+
+        Só as células atravessadas pelo raio são testadas.
+        """
+        ox, oy = map(float, origin)
+        dx, dy = map(float, direction)
+        length = np.hypot(dx, dy)
+        if length == 0:
+            return None
+        t_max = max_distance / length
+
+        if self.altitude(ox, oy) <= 0:
+            return 0.0, (ox, oy)
+
+        # Células entre o início e o fim do raio
+        if dx == 0:
+            first = last = int(self.cell(ox)[0])
+        else:
+            first, last = sorted(int(k) for k in self.cell([ox, ox + dx * min(t_max, 1e12)])[0])
+        i = np.arange(first, last + 1)
+
+        # Cada trecho é uma reta y = a + b * (x - xa) válida em [lo, hi]; fora
+        # da região coberta o chão é plano
+        h = self.heights
+        xa = np.concatenate([self.x0 + i * self.dx, [self.x0, self.x1]])
+        a = np.concatenate([h[i], [h[0], h[-1]]])
+        b = np.concatenate([(h[i + 1] - h[i]) / self.dx, [0.0, 0.0]])
+        lo = np.concatenate([xa[:-2], [-np.inf, self.x1]])
+        hi = np.concatenate([xa[:-2] + self.dx, [self.x0, np.inf]])
+
+        den = dy - b * dx
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = (a + b * (ox - xa) - oy) / den
+        x = ox + t * dx
+        valid = (den != 0) & (t >= 0) & (t <= t_max) & (x >= lo - 1e-9) & (x <= hi + 1e-9)
+        if not valid.any():
+            return None
+        k = np.argmin(np.where(valid, t, np.inf))
+        return float(t[k]), (float(x[k]), float(oy + t[k] * dy))
+
+    def index_range(self, x_min, x_max):
+        """
+        Intervalo (i0, i1) das células que cobrem [x_min, x_max].
+        """
+        i0, _ = self.cell(x_min)
+        i1, _ = self.cell(x_max)
+        return int(i0), int(i1) + 1
+
+    def segments(self, i0=0, i1=None):
+        """
+        Pares de pontos ((xa, ya), (xb, yb)) das células i0 a i1 - 1.
+        """
+        i1 = self.cells if i1 is None else i1
+        for k in range(i0, i1):
+            xa = self.x0 + k * self.dx
+            yield (xa, float(self.heights[k])), (xa + self.dx, float(self.heights[k + 1]))
@@ -1,64 +1,16 @@
 from easymunk import Vec2d, Arbiter, Body, Vec2d, ShapeFilter, pyxel as phys
+import numpy as np
 import pyxel
 import random
+from batch_draw import PointLayer
+from heightfield import Heightfield
+from particles import ParticlePool
 
 FPS = 30
 WIDTH, HEIGHT = 256, 196
 SCREEN = Vec2d(WIDTH, HEIGHT)
 
 
-class Particles:
-    def __init__(self, space):
-        self.particles = []
-        self.space = space
-
-    def draw(self, camera=pyxel):
-        for p in self.particles:
-            x, y = p.position
-            if random.random() < 0.15:
-                camera.rect(x, y, 2, 2, self.get_color(p.duration))
-            else:
-                camera.pset(x, y, self.get_color(p.duration))
-
-    def update(self):
-        for p in self.particles.copy():
-            p.velocity = p.velocity.rotated(random.uniform(-5, 5)) 
-            p.duration -= 1
-            if p.duration <= 0:
-                self.particles.remove(p)
-
-    def emmit(self, position, velocity):
-        p = self.space.create_circle(
-            radius=1,
-            mass=0.1,
-            moment=float("inf"),
-            position=position,
-            velocity=velocity,
-            filter=ShapeFilter(group=1),
-        )
-        p.duration = 105 - random.expovariate(1 / 10)
-        p.velocity_func = self.update_velocity
-        self.particles.append(p)
-
-    def update_velocity(self, body, gravity, damping, dt):
-        body.update_velocity(body, -gravity / 2, 0.99, dt)
-
-    def get_color(self, t):
-        if t > 95:
-            return pyxel.COLOR_WHITE
-        elif t > 80:
-            return pyxel.COLOR_YELLOW
-        elif t > 65:
-            return pyxel.COLOR_RED
-        elif t > 40:
-            return pyxel.COLOR_PURPLE
-        elif t > 25:
-            return pyxel.COLOR_BROWN
-        else:
-            return pyxel.COLOR_GRAY
-
-
-
 #
 # MOON LANDER (SISTEMA DE PARTÍCULAS)
 #
@@ -71,7 +23,9 @@ class Game:
     GRAVITY = Vec2d(0, -25)
     THRUST = -3 * GRAVITY
     ANGULAR_VELOCITY = 180
-    FLOOR_STEP = 30
+    # Células do chão com a largura da base: a célula plana sob ela é
+    # exatamente a base, sem degrau ao lado
+    FLOOR_STEP = BASE_SHAPE[0]
     FLOOR_DY = 15
     FLOOR_N = 42
     PLAYER_COL_TYPE = 1
@@ -98,7 +52,9 @@ class Game:
             collision_type=self.PLAYER_COL_TYPE,
             filter=ShapeFilter(group=1),
         )
-        self.particles = Particles(space)
+        # Partículas do motor ficam fora do espaço (ver particles.py)
+        self.particles = ParticlePool(capacity=512)
+        self.layer = None
 
         # Cria base
         dx = random.uniform(-WIDTH, WIDTH)
@@ -113,8 +69,8 @@ class Game:
         # Cria chão
         shape = list(self.base.shapes)[0]
         bb = shape.cache_bb()
-        self.make_floor(bb.right, bb.bottom, self.FLOOR_STEP, self.FLOOR_DY)
-        self.make_floor(bb.left, bb.bottom, -self.FLOOR_STEP, self.FLOOR_DY)
+        self.base_bb = bb
+        self.make_floor(bb.left, bb.bottom, self.FLOOR_STEP, self.FLOOR_DY)
 
         # Escuta colisões entre base/chão e jogador
         space.collision_handler(
@@ -135,13 +91,21 @@ class Game:
         self.landed = True
 
     def make_floor(self, x, y, step, dy):
-        body = self.space.static_body
+        # Mapa de alturas com FLOOR_N células aleatórias de cada lado de uma
+        # célula plana [x, x + step] onde fica a base (step = largura da base)
+        n = self.FLOOR_N
+        right = y + np.cumsum([random.uniform(-dy, dy) for _ in range(n)])
+        left = y + np.cumsum([random.uniform(-dy, dy) for _ in range(n)])
+        self.floor = Heightfield(x - n * step, step, np.concatenate([left[::-1], [y, y], right]))
 
-        a = Vec2d(x, y)
-        for _ in range(self.FLOOR_N):
-            b = a + (step, random.uniform(-dy, dy))
+        body = self.space.static_body
+        for a, b in self.floor.segments():
             body.create_segment(a, b, 1, collision_type=self.FLOOR_COL_TYPE)
-            a = b
+
+    def floor_height(self, x):
+        # Chão e topo da base
+        bb = self.base_bb
+        return np.where((x >= bb.left) & (x <= bb.right), bb.top, self.floor.height(x))
 
     def update(self):
         if not self.landed:
@@ -156,13 +120,16 @@ class Game:
                 self.player.apply_force_at_local_point(4 * self.THRUST)
                 
                 for _ in range(2):
-                    self.particles.emmit(
+                    self.particles.emit(
                         position=self.player.local_to_world((random.uniform(-2, 2), -3)),
                         velocity=-random.uniform(50, 90) * self.player.rotation_vector.perpendicular(),
+                        duration=105 - random.expovariate(1 / 10),
                     )
 
         dt = 1 / FPS
-        self.particles.update()
+        # As partículas sobem com metade da gravidade e perdem 1% da
+        # velocidade a cada sub-passo
+        self.particles.update(dt, -self.GRAVITY / 2, 0.99, ground=self.floor_height, sub_steps=4)
         self.space.step(dt, sub_steps=4)
         self.space.camera.follow(self.player.position)
 
@@ -171,9 +138,14 @@ class Game:
         camera = self.space.camera
         camera.draw(self.space.static_body)
         camera.draw(self.base)
-        self.particles.draw(camera)
+        if self.layer is None:
+            self.layer = PointLayer()
+        self.particles.draw(self.layer, camera)
         camera.draw(self.player)
 
+        x, y = self.player.position
+        pyxel.text(1, 1, f"ALT {self.floor.altitude(x, y):5.0f}", pyxel.COLOR_WHITE)
+
         if self.landed:
             msg = "PARABENS!" if self.victory else "PERDEU :("
             x = WIDTH / 2 - len(msg) * pyxel.FONT_WIDTH / 2
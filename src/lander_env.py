@@ -0,0 +1,249 @@
+#
+# Ambiente do lander sem janela, com vários landers em vetores
+#
+# Reproduz as regras de lander.py (gravidade, empuxo, giro, base com limite
+# de impulso, chão aleatório em volta da base) com a física integrada
+# diretamente em vetores do NumPy: cada linha é um lander independente, com
+# o próprio terreno. Serve para avaliar e ajustar pilotos automáticos em
+# milhares de terrenos:
+#
+#   env = LanderEnv(1000)
+#   obs = env.reset(seed=0)
+#   while not env.done.all():
+#       obs, reward, done = env.step(autopilot(obs))
+#
+# ou, em vários processos:
+#
+#   $ python lander_env.py --episodes 10000 --workers 8
+#
+import os
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+FPS = 30
+WIDTH, HEIGHT = 256, 196
+
+# Observações: posição e velocidade em relação ao centro do topo da base,
+# orientação, velocidade angular e altitude sobre o chão
+OBSERVATIONS = ["dx", "dy", "vx", "vy", "sin", "cos", "omega", "altitude"]
+
+
+class LanderEnv:
+    """
+    n landers independentes com as constantes de lander.Game.
+
+    As ações são um vetor (n, 2): giro em [-1, 1] (+1 é anti-horário, como
+    KEY_LEFT) e empuxo em [0, 1] (KEY_UP). Um episódio termina no primeiro
+    contato com a base ou com o chão, ou depois de max_steps quadros. Os
+    landers que terminaram ficam parados até o próximo reset().
+    """
+
+    PLAYER_SHAPE = [(0, 6), (-3, -3), (+3, -3)]
+    BASE_SHAPE = (25, 5)
+    GRAVITY = -25
+    THRUST = 4 * 75
+    ANGULAR_VELOCITY = 180
+    FLOOR_STEP = BASE_SHAPE[0]  # como em lander.Game: célula plana = base
+    FLOOR_DY = 15
+    FLOOR_N = 42
+    MAX_IMPULSE = 30
+    SUB_STEPS = 4
+
+    def __init__(self, n=1, max_steps=60 * FPS):
+        self.n = n
+        self.max_steps = max_steps
+        self.shape = np.array(self.PLAYER_SHAPE, dtype=float)
+        self.reset(0)
+
+    def reset(self, seed=None):
+        """
+        Sorteia novos terrenos e posições. O terreno do lander i depende só
+        de (seed, i).
+        """
+        n, cells = self.n, 2 * self.FLOOR_N + 1
+        self.x = np.full(n, WIDTH / 2)
+        self.y = np.full(n, HEIGHT / 2)
+        self.vx = np.zeros(n)
+        self.vy = np.zeros(n)
+        self.angle = np.zeros(n)
+        self.omega = np.zeros(n)
+        self.steps = 0
+        self.done = np.zeros(n, dtype=bool)
+        self.victory = np.zeros(n, dtype=bool)
+
+        # Base e chão (como lander.Game.__init__ e make_floor)
+        w, h = self.BASE_SHAPE
+        self.base_x = np.empty(n)
+        self.heights = np.empty((n, cells + 1))
+        for i, ss in enumerate(np.random.SeedSequence(seed).spawn(n)):
+            rng = np.random.default_rng(ss)
+            self.base_x[i] = self.x[i] + rng.uniform(-WIDTH, WIDTH)
+            steps = rng.uniform(-self.FLOOR_DY, self.FLOOR_DY, (2, self.FLOOR_N))
+            left, right = np.cumsum(steps, axis=1)
+            self.heights[i] = np.concatenate([left[::-1], [0, 0], right])
+        self.base_top = self.y - 0.45 * HEIGHT + h / 2
+        self.heights += (self.base_top - h)[:, None]
+        self.base_left = self.base_x - w / 2
+        self.floor_x0 = self.base_left - self.FLOOR_N * self.FLOOR_STEP
+        return self.observe()
+
+    def floor_height(self, x):
+        """
+        Altura do chão de cada lander nas posições x, vetor (n,) ou (n, k).
+        """
+        x = np.asarray(x, dtype=float)
+        x0 = self.floor_x0.reshape((-1,) + (1,) * (x.ndim - 1))
+        pos = (x - x0) / self.FLOOR_STEP
+        cells = self.heights.shape[1] - 1
+        i = np.clip(np.floor(pos), 0, cells - 1).astype(np.int64)
+        t = np.clip(pos - i, 0.0, 1.0)
+        rows = np.arange(self.n).reshape(x0.shape)
+        h0 = self.heights[rows, i]
+        return h0 + (self.heights[rows, i + 1] - h0) * t
+
+    def observe(self):
+        w = self.BASE_SHAPE[0]
+        return np.column_stack(
+            [
+                self.x - (self.base_left + w / 2),
+                self.y - self.base_top,
+                self.vx,
+                self.vy,
+                np.sin(self.angle),
+                np.cos(self.angle),
+                self.omega,
+                self.y - self.floor_height(self.x),
+            ]
+        )
+
+    def step(self, actions):
+        """
+        Avança um quadro e retorna (observações, recompensas, terminou).
+
+        A recompensa é +100 ao pousar na base com impulso abaixo de
+        MAX_IMPULSE, -100 ao bater no chão ou pousar rápido demais e 0 no
+        resto do tempo.
+        """
+        actions = np.asarray(actions, dtype=float).reshape(self.n, 2)
+        turn = np.clip(actions[:, 0], -1, 1)
+        thrust = np.clip(actions[:, 1], 0, 1)
+        active = ~self.done
+        reward = np.zeros(self.n)
+
+        self.omega = np.where(active, np.radians(self.ANGULAR_VELOCITY) * turn, 0.0)
+        h = 1 / FPS / self.SUB_STEPS
+        for _ in range(self.SUB_STEPS):
+            if not active.any():
+                break
+            # Empuxo ao longo do eixo y local
+            ax = -np.sin(self.angle) * self.THRUST * thrust
+            ay = np.cos(self.angle) * self.THRUST * thrust + self.GRAVITY
+            self.vx = np.where(active, self.vx + ax * h, self.vx)
+            self.vy = np.where(active, self.vy + ay * h, self.vy)
+            self.x = np.where(active, self.x + self.vx * h, self.x)
+            self.y = np.where(active, self.y + self.vy * h, self.y)
+            self.angle = np.where(active, self.angle + self.omega * h, self.angle)
+
+            landed, crashed = self.contacts()
+            ended = active & (landed | crashed)
+            if ended.any():
+                # Corpo de massa 1 parado pelo contato: impulso = |v|
+                speed = np.hypot(self.vx, self.vy)
+                win = ended & landed & ~crashed & (speed < self.MAX_IMPULSE)
+                self.victory |= win
+                reward[ended] = np.where(win[ended], 100.0, -100.0)
+                self.done |= ended
+                self.vx[ended] = self.vy[ended] = self.omega[ended] = 0
+                active = ~self.done
+
+        self.steps += 1
+        if self.steps >= self.max_steps:
+            self.done[:] = True
+        return self.observe(), reward, self.done.copy()
+
+    def contacts(self):
+        """
+        Vetores (tocou a base, tocou o chão) com um teste por vértice.
+        """
+        cos, sin = np.cos(self.angle)[:, None], np.sin(self.angle)[:, None]
+        px, py = self.shape[:, 0], self.shape[:, 1]
+        vx = self.x[:, None] + cos * px - sin * py
+        vy = self.y[:, None] + sin * px + cos * py
+
+        w = self.BASE_SHAPE[0]
+        on_base = (vx >= self.base_left[:, None]) & (vx <= self.base_left[:, None] + w)
+        landed = (on_base & (vy <= self.base_top[:, None])).any(axis=1)
+        crashed = (~on_base & (vy <= self.floor_height(vx))).any(axis=1)
+        return landed, crashed
+
+
+def autopilot(obs):
+    """
+    Piloto automático simples: inclina para levar o lander sobre a base e
+    controla a velocidade vertical em função da altura.
+    """
+    dx, dy, vx, vy, sin, cos, _, altitude = obs.T
+    angle = np.arctan2(sin, cos)
+
+    # Inclinação desejada (positiva = anti-horário = empurra para -x)
+    tilt = np.clip(0.02 * dx + 0.05 * vx, -0.5, 0.5)
+    tilt = np.where(altitude < 15, 0.0, tilt)
+    turn = np.clip((tilt - angle) * 4, -1, 1)
+
+    # Desce mais devagar perto do chão e da base
+    clearance = np.minimum(altitude, np.maximum(dy, 0))
+    target_vy = -np.clip(0.3 * clearance, 4, 40)
+    thrust = np.clip((target_vy - vy) * 0.2 + 25 / LanderEnv.THRUST, 0, 1)
+    return np.column_stack([turn, thrust])
+
+
+def run_batch(controller, seed, n, max_steps=60 * FPS):
+    """
+    Roda n episódios até o fim e retorna o vetor de vitórias.
+    """
+    env = LanderEnv(n, max_steps)
+    obs = env.reset(seed)
+    while not env.done.all():
+        obs, _, _ = env.step(controller(obs))
+    return env.victory
+
+
+def evaluate(controller, episodes, seed=0, batch=256, workers=None, max_steps=60 * FPS):
+    """
+    Roda `episodes` episódios em lotes de `batch` landers, em um pool de
+    processos se workers > 1. controller(obs) -> ações deve ser uma função
+    definida no nível do módulo (para ir para os outros processos).
+
+    Cada lote k usa a semente (seed, k): o resultado não depende do número
+    de processos.
+    """
+    sizes = [min(batch, episodes - start) for start in range(0, episodes, batch)]
+    seeds = [[seed, k] for k in range(len(sizes))]
+    workers = workers or os.cpu_count()
+    if workers == 1:
+        results = [run_batch(controller, s, n, max_steps) for s, n in zip(seeds, sizes)]
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            futures = [pool.submit(run_batch, controller, s, n, max_steps) for s, n in zip(seeds, sizes)]
+            results = [f.result() for f in futures]
+    return np.concatenate(results)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Avalia o piloto automático em vários terrenos do lander.")
+    parser.add_argument("--episodes", type=int, default=1000)
+    parser.add_argument("--batch", type=int, default=256, help="landers simulados juntos em cada lote")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    victory = evaluate(autopilot, args.episodes, args.seed, args.batch, args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"{args.episodes} episódios em {elapsed:.2f}s: {victory.mean():.1%} de pousos na base")
+
+
+if __name__ == "__main__":
+    main()
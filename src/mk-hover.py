@@ -1,5 +1,6 @@
 import pyxel
 from easymunk import pyxel as phys, Vec2d, Body, Transform
+from svg_path import simplify_path
 
 svg1 = """0,0 -53.8281,34.3789 -233.3594,390.41211 -13.0625,84.15821 
 18.9492,39.89453 41.9531,33.78125 58.3926,7.60156 360.1621,-80.88086 
@@ -33,16 +34,20 @@ def parse(path):
         yield Vec2d(float(x), float(y))
 
 
-def make_paths(svg, body: Body, transform=Transform.identity(), **kwargs):
+def make_paths(svg, body: Body, transform=Transform.identity(), tolerance=1.0, **kwargs):
     a, *bs = map(transform, parse(svg))
-    paths = []
+    points = [a]
     for b in bs:
         b += a
-        paths.append(body.create_segment(a, b, **kwargs))
+        points.append(b)
         a = b
-    a = paths[-1].b
-    b = paths[0].a
-    paths.append(body.create_segment(a, b, **kwargs))
+
+    # Menos segmentos estáticos para testar contra cada carro a cada passo
+    simple = simplify_path(points, tolerance, closed=True)
+    paths = []
+    for a, b in zip(simple, simple[1:] + simple[:1]):
+        paths.append(body.create_segment(a, b, **kwargs))
+    print(f"make_paths: {len(points) - len(paths)} de {len(points)} segmentos removidos")
     return paths
 
 
@@ -2,6 +2,7 @@ import random
 import pyxel
 from easymunk import pyxel as phys, Vec2d
 import easymunk as mk
+from wing_model import Wing, apply_wings
 
 pyxel.init(256, 196)
 pyxel.mouse(True)
@@ -19,39 +20,6 @@ for _ in range(100):
     space.static_body.create_segment(a, b)
 space.static_body.shapes.apply(color=pyxel.COLOR_GREEN)
 
-class ClCdResult(NamedTuple):
-    Cl: float
-    Cd: float
-
-class ClCd:
-    args = property(lambda self: {"Cl": self.Cl, "Cd": self.Cd})
-    
-    def __init__(self, Cl_0=0.0, stall_angle=20, LD_max=10.0, Cl_max=1.0, ):
-        ...
-
-    def __call__(self, alpha):
-        return ClCdResult(self.Cl(alpha), self.Cd(alpha))
-        
-    def __iter__(self):
-        yield self.Cl
-        yield self.Cd
-
-    def Cl(self, alpha):
-        ...
-
-    def Cd(self, alpha):
-        ...
-
-    def plot(self):
-        angles = np.linspace(-45, 45)
-
-class Wing:
-    def __init__(self, body, offset=(0, 0), AoA=0.0, cruise_speed=None, Cl=None, Cd=None, x_cp=0.25):
-        self.body = body
-        self.offset = Vec2d(*offset)
-        if Cl is None and Cd is None:
-            self.Cl, self.Cd = ClCd()
-
 
 def make_plane():
     plane = space.create_body(10, 500)
@@ -70,29 +38,18 @@ plane = make_plane()
 plane.move(50, 30)
 
 
+wings = [
+    Wing(plane, offset=(-1, 5), AoA=6),  # asa
+    Wing(plane, offset=(-23, 3), AoA=0, area=0.25),  # profundor
+]
+
+
 @space.before_step()
 def update():
-    v: Vec2d = plane.velocity
-    s = v.length
-    rho = 0.1
-    Cl = 0.3
-    A = 1
-    Cd = Cl / 10
     power = 100
-
-    F_empuxo = 0.5 * rho * s**2 * A * Cl
-    F_arrasto = - 0.5 * rho * s**2 * A * Cd
-    F_motor = Vec2d(plane.mass * power, 0).rotated(0)      
-    
-    pt = (helice.a + helice.b) / 2
-    plane.apply_force_at_local_point(F_motor, pt) 
-
-    plane.apply_force_at_local_point((-F_arrasto, 0)) 
-
-    plane.apply_force_at_local_point((0, F_empuxo), (1, 5)) 
-
-    print(F_empuxo / plane.mass / 200)
-
+    F_motor = Vec2d(plane.mass * power, 0)
+    plane.apply_force_at_local_point(F_motor, (9, 1))  # centro da hélice
+    apply_wings(wings)
 
 
 @space.after_step()
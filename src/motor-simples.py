@@ -1,30 +1,118 @@
 import pyxel
-from math import sqrt
+from math import sqrt, floor, inf
 from random import uniform, choice
+from collections import defaultdict
+from heapq import heappush, heappop
+from itertools import count
+import numpy as np
+
+
+class SpatialHash:
+    """
+    Grade uniforme que associa cada célula à lista de bolas cujo centro está
+    dentro dela.
+
+    O lado da célula é o diâmetro da maior bola. Assim, duas bolas só podem se
+    tocar se estiverem na mesma célula ou em células vizinhas e basta testar
+    estes pares em vez de todas as combinações possíveis.
+    """
+
+    # Metade das vizinhas: cada par de células adjacentes é visitado uma vez só
+    NEIGHBORS = [(1, 0), (-1, 1), (0, 1), (1, 1)]
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)
+        self.keys = {}
+
+    def key(self, obj):
+        return floor(obj.x / self.cell_size), floor(obj.y / self.cell_size)
+
+    def insert(self, obj):
+        key = self.key(obj)
+        self.cells[key].append(obj)
+        self.keys[obj] = key
+
+    def remove(self, obj):
+        key = self.keys.pop(obj)
+        cell = self.cells[key]
+        cell.remove(obj)
+        if not cell:
+            del self.cells[key]
+
+    def move(self, obj):
+        """
+        Atualiza a célula do objeto. Só mexe na grade se ele mudou de célula.
+        """
+        if self.keys[obj] != self.key(obj):
+            self.remove(obj)
+            self.insert(obj)
+
+    def rebuild(self, cell_size):
+        objects = list(self.keys)
+        self.cell_size = cell_size
+        self.cells.clear()
+        self.keys.clear()
+        for obj in objects:
+            self.insert(obj)
+
+    def pairs(self):
+        """
+        Itera sobre os pares candidatos a colisão (a, b).
+        """
+        cells = self.cells
+        for (i, j), cell in cells.items():
+            n = len(cell)
+            for k in range(n):
+                obj_a = cell[k]
+                for m in range(k + 1, n):
+                    yield obj_a, cell[m]
+
+            for di, dj in self.NEIGHBORS:
+                other = cells.get((i + di, j + dj))
+                if other:
+                    for obj_a in cell:
+                        for obj_b in other:
+                            yield obj_a, obj_b
 
 
 class Space:
-    def __init__(self):
+    restitution = 1.0
+    sub_steps = 10
+
+    def __init__(self, width=256, height=196):
+        self.width = width
+        self.height = height
         self.objects = []
+        self.grid = SpatialHash(1)
+        self.pair_tests = 0
 
     def add(self, obj):
         self.objects.append(obj)
         obj.space = self
 
+        if 2 * obj.radius > self.grid.cell_size:
+            self.grid.rebuild(2 * obj.radius)
+        self.grid.insert(obj)
+
     def update(self, dt):
         for obj in self.objects:
             obj.update_velocities(dt)
-        
-        for i, obj_a in enumerate(self.objects):
-            for obj_b in self.objects[i + 1:]:
-                if obj_a.collides_with(obj_b):
-                    self.resolve_collision_pair(obj_a, obj_b)
+
+        # Só testa os pares que estão em células vizinhas da grade
+        pair_tests = 0
+        for obj_a, obj_b in self.grid.pairs():
+            pair_tests += 1
+            if obj_a.collides_with(obj_b):
+                self.resolve_collision_pair(obj_a, obj_b)
+        self.pair_tests = pair_tests
 
         for obj in self.objects:
             self.resolve_wall_collisions(obj)
         
         for obj in self.objects:
             obj.update_positions(dt)
+            self.grid.move(obj)
 
     def draw(self):
         for obj in self.objects:
@@ -38,22 +126,465 @@ class Space:
         vx = obj_b.vx - obj_a.vx
         vy = obj_b.vy - obj_a.vy
 
+        # Só há colisão se as bolas estiverem se aproximando
         vrel = (x/r * vx + y/r * vy)
-        obj_a.vx += vrel * (x / r)
-        obj_a.vy += vrel * (y / r)
-        obj_b.vx -= vrel * (x / r)
-        obj_b.vy -= vrel * (y / r)
+        if vrel >= 0:
+            return
+
+        # Impulso ao longo da normal com coeficiente de restituição e
+        # (ver colisoes.ipynb)
+        m_a, m_b = obj_a.mass, obj_b.mass
+        impulse = -(1 + self.restitution) * vrel * m_a * m_b / (m_a + m_b)
+        obj_a.vx -= impulse / m_a * (x / r)
+        obj_a.vy -= impulse / m_a * (y / r)
+        obj_b.vx += impulse / m_b * (x / r)
+        obj_b.vy += impulse / m_b * (y / r)
 
     def resolve_wall_collisions(self, obj):
         if obj.x < obj.radius - 1 and obj.vx < 0:
             obj.vx *= -1
-        elif obj.x > pyxel.width - obj.radius - 1 and obj.vx > 0:
+        elif obj.x > self.width - obj.radius - 1 and obj.vx > 0:
             obj.vx *= -1
         if obj.y < obj.radius - 1 and obj.vy < 0:
             obj.vy *= -1
-        elif obj.y > pyxel.height - obj.radius - 1 and obj.vy > 0:
+        elif obj.y > self.height - obj.radius - 1 and obj.vy > 0:
             obj.vy *= -1
 
+
+def independent_batches(i, j, n):
+    """
+    Divide os pares (i[k], j[k]) em lotes em que cada bola aparece no máximo
+    uma vez. Retorna a lista de vetores de índices dos pares de cada lote.
+
+    A cada rodada, cada par restante recebe uma prioridade aleatória e entra
+    no lote se tiver a maior prioridade entre todos os pares que tocam as
+    suas duas bolas (algoritmo de Luby). O par de maior prioridade sempre
+    entra, e em geral poucas rodadas bastam.
+    """
+    priority = np.random.default_rng(0).random(len(i))
+    remaining = np.arange(len(i))
+    batches = []
+    while remaining.size:
+        ri, rj, rp = i[remaining], j[remaining], priority[remaining]
+        best = np.full(n, -1.0)
+        np.maximum.at(best, ri, rp)
+        np.maximum.at(best, rj, rp)
+        selected = (best[ri] == rp) & (best[rj] == rp)
+        batches.append(remaining[selected])
+        remaining = remaining[~selected]
+    return batches
+
+
+def resolve_collision_pairs(x, y, vx, vy, mass, i, j, restitution=1.0, sweeps=4):
+    """
+    Resolve de uma vez as colisões entre os pares de bolas (i[k], j[k]),
+    modificando vx e vy no lugar. Retorna o impulso total aplicado em cada par.
+
+    O impulso atua ao longo da normal de contato e usa as velocidades
+    deduzidas em colisoes.ipynb para uma colisão com coeficiente de
+    restituição e, no referencial em que B está parado:
+
+        v_A = (m_A - e m_B) u / (m_A + m_B)
+        v_B = (1 + e) m_A u / (m_A + m_B)
+
+    Uma mesma bola pode aparecer em vários pares. Por isso, os pares são
+    separados em lotes sem bolas repetidas (ver independent_batches), que
+    são resolvidos um após o outro, como em uma varredura de Gauss-Seidel.
+    Cada lote usa as velocidades deixadas pelo anterior e cada colisão
+    individual conserva o momento (e a energia, se e = 1). Algumas
+    varreduras propagam o impulso ao longo de pilhas e fileiras de bolas.
+    """
+    nx = x[j] - x[i]
+    ny = y[j] - y[i]
+    dist = np.hypot(nx, ny)
+    dist[dist == 0] = np.inf
+    nx /= dist
+    ny /= dist
+
+    inv_a = 1 / mass[i]
+    inv_b = 1 / mass[j]
+    m_eff = 1 / (inv_a + inv_b)
+
+    impulse = np.zeros(len(i))
+    batches = independent_batches(i, j, len(vx))
+    for _ in range(sweeps):
+        for k in batches:
+            a, b = i[k], j[k]
+            vn = (vx[b] - vx[a]) * nx[k] + (vy[b] - vy[a]) * ny[k]
+
+            # Só há colisão se as bolas estiverem se aproximando (vn < 0)
+            dj = -(1 + restitution) * np.minimum(vn, 0) * m_eff[k]
+            impulse[k] += dj
+            vx[a] -= dj * inv_a[k] * nx[k]
+            vy[a] -= dj * inv_a[k] * ny[k]
+            vx[b] += dj * inv_b[k] * nx[k]
+            vy[b] += dj * inv_b[k] * ny[k]
+
+    return impulse
+
+
+class ArraySpace:
+    """
+    Espaço alternativo que guarda o estado de todas as bolas em vetores
+    contíguos do NumPy (uma "estrutura de vetores") em vez de atributos
+    de objetos Python.
+
+    A integração e as colisões com as paredes são feitas de uma vez sobre
+    todos os vetores. Os objetos em ``self.objects`` são apenas visões
+    (BallView) para o índice de cada bola, de modo que o código de desenho
+    continua funcionando sem alterações.
+    """
+
+    FIELDS = ["x", "y", "vx", "vy", "fx", "fy", "mass", "radius"]
+    restitution = 1.0
+    sub_steps = 10
+    sweeps = 4
+
+    def __init__(self, width=256, height=196, capacity=64):
+        self.width = width
+        self.height = height
+        self.objects = []
+        self.size = 0
+        self.pair_tests = 0
+        for name in self.FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float64))
+
+    def add(self, obj):
+        """
+        Copia o estado do objeto para os vetores do espaço e retorna a visão
+        correspondente. A partir daí, o objeto original não é mais atualizado.
+        """
+        i = self.size
+        if i == len(self.x):
+            for name in self.FIELDS:
+                data = getattr(self, name)
+                setattr(self, name, np.concatenate([data, np.zeros_like(data)]))
+
+        for name in self.FIELDS:
+            getattr(self, name)[i] = getattr(obj, name)
+        self.size += 1
+
+        view = BallView(self, i)
+        self.objects.append(view)
+        return view
+
+    def update(self, dt):
+        n = self.size
+        x, y = self.x[:n], self.y[:n]
+        vx, vy = self.vx[:n], self.vy[:n]
+        radius = self.radius[:n]
+
+        # Segunda lei de Newton para todas as bolas ao mesmo tempo
+        vx += self.fx[:n] / self.mass[:n] * dt
+        vy += self.fy[:n] / self.mass[:n] * dt
+
+        i, j = self.candidate_pairs()
+        self.pair_tests = len(i)
+        r = radius[i] + radius[j]
+        hit = (x[j] - x[i]) ** 2 + (y[j] - y[i]) ** 2 <= r * r
+        resolve_collision_pairs(
+            x, y, vx, vy, self.mass[:n], i[hit], j[hit],
+            restitution=self.restitution, sweeps=self.sweeps,
+        )
+
+        # Paredes
+        vx[((x < radius - 1) & (vx < 0)) | ((x > self.width - radius - 1) & (vx > 0))] *= -1
+        vy[((y < radius - 1) & (vy < 0)) | ((y > self.height - radius - 1) & (vy > 0))] *= -1
+
+        x += vx * dt
+        y += vy * dt
+
+    def candidate_pairs(self):
+        """
+        Retorna os vetores de índices (i, j) dos pares de bolas em células
+        vizinhas de uma grade uniforme, como em SpatialHash.
+
+        A grade é construída ordenando as bolas pelo índice da célula. Para
+        cada bola, as ocupantes de uma célula vizinha formam um intervalo
+        contíguo da ordenação, encontrado com busca binária.
+        """
+        n = self.size
+        if n < 2:
+            empty = np.zeros(0, dtype=np.intp)
+            return empty, empty
+
+        size = 2 * self.radius[:n].max()
+        cx = np.floor(self.x[:n] / size).astype(np.int64)
+        cy = np.floor(self.y[:n] / size).astype(np.int64)
+        cx -= cx.min() - 1
+        cy -= cy.min() - 1
+        rows = cy.max() + 2
+        keys = cx * rows + cy
+
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        indices = np.arange(n)
+
+        pairs_i, pairs_j = [], []
+        for di, dj in [(0, 0), *SpatialHash.NEIGHBORS]:
+            neighbor = keys + di * rows + dj
+            start = np.searchsorted(sorted_keys, neighbor, "left")
+            count = np.searchsorted(sorted_keys, neighbor, "right") - start
+            total = count.sum()
+            if total == 0:
+                continue
+
+            # Expande cada intervalo [start, start + count) em índices
+            offset = np.cumsum(count) - count
+            i = np.repeat(indices, count)
+            j = order[np.repeat(start - offset, count) + np.arange(total)]
+            if di == dj == 0:
+                keep = i < j
+                i, j = i[keep], j[keep]
+            pairs_i.append(i)
+            pairs_j.append(j)
+
+        if not pairs_i:
+            empty = np.zeros(0, dtype=np.intp)
+            return empty, empty
+        return np.concatenate(pairs_i), np.concatenate(pairs_j)
+
+    def draw(self):
+        for obj in self.objects:
+            obj.draw()
+
+
+def exit_time(p, v, a, lo, hi):
+    """
+    Primeiro instante t >= 0 em que a coordenada p + v t + a t² / 2 sai do
+    intervalo [lo, hi]. Retorna o par (t, lado), com lado igual a -1 se a
+    saída for por lo e +1 se for por hi, ou (inf, 0) se nunca sair.
+    """
+    if p <= lo and v < 0:
+        return 0.0, -1
+    if p >= hi and v > 0:
+        return 0.0, +1
+
+    best = (inf, 0)
+    for c, side in [(lo, -1), (hi, +1)]:
+        # Raízes de a/2 t² + v t + (p - c) = 0
+        if a == 0:
+            roots = [(c - p) / v] if v != 0 else []
+        else:
+            delta = v * v - 2 * a * (p - c)
+            if delta < 0:
+                continue
+            sqrt_delta = sqrt(delta)
+            roots = [(-v - sqrt_delta) / a, (-v + sqrt_delta) / a]
+
+        for t in roots:
+            # Só vale se estiver cruzando a fronteira para fora
+            if 0 <= t < best[0] and side * (v + a * t) > 0:
+                best = (t, side)
+    return best
+
+
+class EventSpace:
+    """
+    Espaço que simula esferas rígidas por eventos, em vez de passos fixos.
+
+    Os instantes exatos das próximas colisões entre bolas e com as paredes
+    ficam em uma fila de prioridades. Cada update(dt) pula diretamente de um
+    evento para o próximo até chegar ao final do intervalo. As bolas se movem
+    em trajetórias parabólicas entre os eventos, por isso todas precisam
+    ter a mesma aceleração f / m (ex.: a mesma gravidade).
+
+    Os eventos não são removidos da fila quando ficam obsoletos. Cada bola
+    guarda um contador de colisões e o evento é simplesmente descartado se o
+    contador mudou desde que foi previsto.
+
+    Só os vizinhos de uma grade com células do tamanho do diâmetro da maior
+    bola são considerados na previsão das colisões. A passagem de uma bola
+    para outra célula também é tratada como um evento.
+    """
+
+    restitution = 1.0
+    sub_steps = 1
+
+    def __init__(self, width=256, height=196):
+        self.width = width
+        self.height = height
+        self.objects = []
+        self.time = 0.0
+        self.ax = self.ay = None
+        self.pair_tests = 0
+        self.cell_size = 1
+        self.cells = defaultdict(set)
+        self._times = []
+        self._counts = []
+        self._keys = []
+        self._queue = []
+        self._seq = count()
+
+    def add(self, obj):
+        ax, ay = obj.fx / obj.mass, obj.fy / obj.mass
+        if self.ax is None:
+            self.ax, self.ay = ax, ay
+        elif (ax, ay) != (self.ax, self.ay):
+            raise ValueError("todas as bolas devem ter a mesma aceleração.")
+
+        self.objects.append(obj)
+        obj.space = self
+        idx = len(self.objects) - 1
+        self._times.append(self.time)
+        self._counts.append(0)
+        self._keys.append(None)
+
+        if 2 * obj.radius > self.cell_size:
+            self.cell_size = 2 * obj.radius
+            self.cells.clear()
+            self._queue.clear()
+            for i in range(len(self.objects)):
+                self._counts[i] += 1
+                self._insert(i)
+            for i in range(len(self.objects)):
+                self.predict(i)
+        else:
+            self._insert(idx)
+            self.predict(idx)
+
+    def update(self, dt):
+        self.pair_tests = 0
+        end = self.time + dt
+        queue = self._queue
+        counts = self._counts
+
+        while queue and queue[0][0] <= end:
+            t, _, kind, i, j, count_i, count_j = heappop(queue)
+            if counts[i] != count_i or (kind == "pair" and counts[j] != count_j):
+                continue
+            self.time = t
+
+            if kind == "pair":
+                self._drift(i)
+                self._drift(j)
+                self.resolve_collision_pair(self.objects[i], self.objects[j])
+                counts[i] += 1
+                counts[j] += 1
+                self.predict(i)
+                self.predict(j)
+            elif kind == "wall":
+                self._drift(i)
+                obj = self.objects[i]
+                if j == 0:
+                    obj.vx *= -1
+                else:
+                    obj.vy *= -1
+                counts[i] += 1
+                self.predict(i)
+            else:
+                self._move_cell(i, j)
+
+        self.time = end
+        for i in range(len(self.objects)):
+            self._drift(i)
+
+    def draw(self):
+        for obj in self.objects:
+            obj.draw()
+
+    resolve_collision_pair = Space.resolve_collision_pair
+
+    def predict(self, i, cells=None):
+        """
+        Agenda os próximos eventos da bola i: colisões com as bolas das
+        células vizinhas (ou apenas das células dadas), com as paredes e a
+        troca de célula.
+        """
+        self._drift(i)
+        obj = self.objects[i]
+        cx, cy = self._keys[i]
+
+        full = cells is None
+        if full:
+            cells = [(cx + dx, cy + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+        for key in cells:
+            for j in self.cells.get(key, ()):
+                if j != i:
+                    self.pair_tests += 1
+                    t = self.collision_time(i, j)
+                    if t < inf:
+                        self._schedule(t, "pair", i, j)
+
+        # Na troca de célula, o evento de parede previsto antes continua válido
+        if full:
+            tx, _ = exit_time(obj.x, obj.vx, self.ax, obj.radius - 1, self.width - obj.radius - 1)
+            ty, _ = exit_time(obj.y, obj.vy, self.ay, obj.radius - 1, self.height - obj.radius - 1)
+            if min(tx, ty) < inf:
+                self._schedule(self.time + min(tx, ty), "wall", i, 0 if tx <= ty else 1)
+
+        size = self.cell_size
+        tx, sx = exit_time(obj.x, obj.vx, self.ax, cx * size, (cx + 1) * size)
+        ty, sy = exit_time(obj.y, obj.vy, self.ay, cy * size, (cy + 1) * size)
+        if tx <= ty and tx < inf:
+            self._schedule(self.time + tx, "cell", i, (sx, 0))
+        elif ty < inf:
+            self._schedule(self.time + ty, "cell", i, (0, sy))
+
+    def collision_time(self, i, j):
+        """
+        Instante absoluto da próxima colisão entre as bolas i e j.
+
+        Como as duas têm a mesma aceleração, o movimento relativo é retilíneo
+        e basta resolver |dr + dv t| = r_i + r_j.
+        """
+        self._drift(j)
+        a, b = self.objects[i], self.objects[j]
+        dx, dy = b.x - a.x, b.y - a.y
+        dvx, dvy = b.vx - a.vx, b.vy - a.vy
+        dot = dx * dvx + dy * dvy
+        if dot >= 0:
+            return inf
+
+        sigma = a.radius + b.radius
+        dv2 = dvx * dvx + dvy * dvy
+        dr2 = dx * dx + dy * dy
+        delta = dot * dot - dv2 * (dr2 - sigma * sigma)
+        if delta < 0:
+            return inf
+        return self.time + max(-(dot + sqrt(delta)) / dv2, 0.0)
+
+    def _schedule(self, t, kind, i, j):
+        count_j = self._counts[j] if kind == "pair" else None
+        heappush(self._queue, (t, next(self._seq), kind, i, j, self._counts[i], count_j))
+
+    def _drift(self, i):
+        # Leva a bola i do seu instante local até o instante atual
+        dt = self.time - self._times[i]
+        if dt:
+            obj = self.objects[i]
+            obj.x += (obj.vx + self.ax * dt / 2) * dt
+            obj.y += (obj.vy + self.ay * dt / 2) * dt
+            obj.vx += self.ax * dt
+            obj.vy += self.ay * dt
+            self._times[i] = self.time
+
+    def _insert(self, i):
+        obj = self.objects[i]
+        key = floor(obj.x / self.cell_size), floor(obj.y / self.cell_size)
+        self.cells[key].add(i)
+        self._keys[i] = key
+
+    def _move_cell(self, i, step):
+        cx, cy = old = self._keys[i]
+        sx, sy = step
+        key = cx + sx, cy + sy
+        cell = self.cells[old]
+        cell.discard(i)
+        if not cell:
+            del self.cells[old]
+        self.cells[key].add(i)
+        self._keys[i] = key
+
+        # Só as células que acabaram de ficar vizinhas trazem novos pares
+        kx, ky = key
+        if sx:
+            new = [(kx + sx, ky + d) for d in (-1, 0, 1)]
+        else:
+            new = [(kx + d, ky + sy) for d in (-1, 0, 1)]
+        self.predict(i, new)
+
+
 class Game:
     """
     Jogo simples com a simulação de um círculo limitado à área visível da tela.
@@ -61,7 +592,7 @@ class Game:
 
     border_color = pyxel.COLOR_RED
 
-    def __init__(self, fps=30, width=256, height=196, speed=50):
+    def __init__(self, fps=30, width=256, height=196, speed=50, n=10, space_class=Space):
         x = lambda: uniform(5, width - 5)
         y = lambda: uniform(5, height - 5)
         v = lambda: choice([-speed, speed])
@@ -70,13 +601,13 @@ class Game:
         self.width = width
         self.height = height
 
-        self.space = Space()
-        for _ in range(10):
+        self.space = space_class(width, height)
+        for _ in range(n):
             ball = Ball(x(), y(), v(), v())
             self.space.add(ball)
 
     def update(self):
-        n = 10
+        n = self.space.sub_steps
         dt = 1 / self.fps / n
         for _ in range(n):
             self.space.update(dt)
@@ -93,6 +624,11 @@ class Game:
 
         self.space.draw()
 
+        # Número de testes de colisão vs. força bruta
+        n = len(self.space.objects)
+        msg = f"testes: {self.space.pair_tests}/{n * (n - 1) // 2}"
+        pyxel.text(2, 2, msg, pyxel.COLOR_GRAY)
+
     def run(self):
         pyxel.init(self.width, self.height, caption="Simulação de física", fps=self.fps)
         pyxel.mouse(True)
@@ -144,5 +680,40 @@ class Ball:
         pyxel.circ(self.x, self.y, self.radius, self.color)
 
 
-game = Game()
-game.run()
+def _field(name):
+    def fget(self):
+        return getattr(self.space, name)[self.index]
+
+    def fset(self, value):
+        getattr(self.space, name)[self.index] = value
+
+    return property(fget, fset)
+
+
+class BallView:
+    """
+    Visão de uma bola armazenada em um ArraySpace.
+
+    Os atributos são lidos e escritos diretamente nos vetores do espaço, assim
+    a visão se comporta como uma Ball comum.
+    """
+
+    __slots__ = ("space", "index")
+
+    color = Ball.color
+    x, y = _field("x"), _field("y")
+    vx, vy = _field("vx"), _field("vy")
+    fx, fy = _field("fx"), _field("fy")
+    mass, radius = _field("mass"), _field("radius")
+
+    def __init__(self, space, index):
+        self.space = space
+        self.index = index
+
+    collides_with = Ball.collides_with
+    draw = Ball.draw
+
+
+if __name__ == "__main__":
+    game = Game()
+    game.run()
@@ -0,0 +1,127 @@
+#
+# Sistema de partículas em vetores
+#
+# As partículas (fumaça, faíscas) não precisam do motor de física: cada uma
+# é só uma linha nos vetores de posição, velocidade e idade de um pool com
+# capacidade fixa. A atualização é feita de uma vez com o NumPy, a colisão é
+# apenas com a altura do chão e o desenho usa uma única camada de pontos
+# (ver batch_draw.py). Partículas mortas são substituídas pelas do fim do
+# pool, sem realocar memória.
+#
+import numpy as np
+import pyxel
+
+# Cores por idade: partículas novas são brancas e esfriam até cinza
+AGE_BUCKETS = np.array([25, 40, 65, 80, 95])
+AGE_COLORS = np.array(
+    [
+        pyxel.COLOR_GRAY,
+        pyxel.COLOR_BROWN,
+        pyxel.COLOR_PURPLE,
+        pyxel.COLOR_RED,
+        pyxel.COLOR_YELLOW,
+        pyxel.COLOR_WHITE,
+    ],
+    dtype=np.uint8,
+)
+
+
+class ParticlePool:
+    """
+    Pool de até `capacity` partículas.
+
+    As partículas vivas ocupam as primeiras `size` posições dos vetores x, y,
+    vx, vy e age (quadros restantes de vida). Emissões com o pool cheio são
+    ignoradas.
+    """
+
+    def __init__(self, capacity=1024, seed=None):
+        self.capacity = capacity
+        self.size = 0
+        self.rng = np.random.default_rng(seed)
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.age = np.zeros(capacity)
+        self.arrays = [self.x, self.y, self.vx, self.vy, self.age]
+
+    def __len__(self):
+        return self.size
+
+    def emit(self, position, velocity, duration):
+        k = self.size
+        if k == self.capacity:
+            return
+        self.x[k], self.y[k] = position
+        self.vx[k], self.vy[k] = velocity
+        self.age[k] = duration
+        self.size += 1
+
+    def update(self, dt, gravity=(0, 0), damping=1.0, spread=5.0, ground=None, sub_steps=1):
+        """
+        Avança as partículas um quadro: gira cada velocidade por um ângulo
+        aleatório de até `spread` graus, aplica gravidade e amortecimento,
+        move, colide com o chão e envelhece.
+
+        ground(x) deve retornar a altura do chão para um vetor de posições x.
+        """
+        n = self.size
+        if n == 0:
+            return
+        x, y, vx, vy, age = (a[:n] for a in self.arrays)
+
+        theta = np.radians(self.rng.uniform(-spread, spread, n))
+        cos, sin = np.cos(theta), np.sin(theta)
+        vx[:], vy[:] = cos * vx - sin * vy, sin * vx + cos * vy
+
+        h = dt / sub_steps
+        gx, gy = gravity
+        for _ in range(sub_steps):
+            vx *= damping
+            vy *= damping
+            vx += gx * h
+            vy += gy * h
+            x += vx * h
+            y += vy * h
+
+        if ground is not None:
+            floor = ground(x)
+            below = y < floor
+            y[below] = floor[below]
+            vy[below] = np.abs(vy[below]) * 0.3
+            vx[below] *= 0.5
+
+        age -= 1
+        self.recycle()
+
+    def recycle(self):
+        """
+        Remove as partículas mortas trocando-as pelas vivas do fim do pool.
+        """
+        n = self.size
+        alive = self.age[:n] > 0
+        k = int(alive.sum())
+        if k == n:
+            return
+        holes = np.flatnonzero(~alive[:k])
+        movers = k + np.flatnonzero(alive[k:n])
+        for a in self.arrays:
+            a[holes] = a[movers]
+        self.size = k
+
+    def colors(self):
+        return AGE_COLORS[np.digitize(self.age[: self.size], AGE_BUCKETS, right=True)]
+
+    def draw(self, layer, camera, big=0.15):
+        """
+        Desenha todas as partículas em uma PointLayer. Uma fração `big`
+        delas (sorteada a cada quadro) ocupa 2x2 pixels.
+        """
+        n = self.size
+        x, y, colors = self.x[:n], self.y[:n], self.colors()
+        pick = self.rng.random(n) < big
+        xs = np.concatenate([x, x[pick] + 1, x[pick], x[pick] + 1])
+        ys = np.concatenate([y, y[pick], y[pick] - 1, y[pick] - 1])
+        cs = np.concatenate([colors, np.tile(colors[pick], 3)])
+        layer.draw_camera(xs, ys, cs, camera)
@@ -14,7 +14,7 @@ class Game:
         self.fps = fps
         self.width = width
         self.height = height
-        self.ball = Ball(50, 50, speed, -speed)
+        self.ball = Ball(50, 50, speed, -speed, width=width, height=height)
         self.positions = deque([(self.ball.x, self.ball.y)], maxlen=1024)
 
     def update(self):
@@ -51,13 +51,15 @@ class Ball:
 
     color = pyxel.COLOR_WHITE
 
-    def __init__(self, x, y, vx=0, vy=0, radius=5, mass=1):
+    def __init__(self, x, y, vx=0, vy=0, radius=5, mass=1, width=256, height=196):
         self.x = x
         self.y = y
         self.vx = vx
         self.vy = vy
         self.mass = mass
         self.radius = radius
+        self.width = width
+        self.height = height
         self.time = 0
 
     def update(self, dt):
@@ -102,11 +104,11 @@ class Ball:
     def resolve_collisions(self):
         if self.x < self.radius - 1 and self.vx < 0:
             self.vx *= -1
-        elif self.x > pyxel.width - self.radius - 1 and self.vx > 0:
+        elif self.x > self.width - self.radius - 1 and self.vx > 0:
             self.vx *= -1
         if self.y < self.radius - 1 and self.vy < 0:
             self.vy *= -1
-        elif self.y > pyxel.height - self.radius - 1 and self.vy > 0:
+        elif self.y > self.height - self.radius - 1 and self.vy > 0:
             self.vy *= -1
 
     def draw(self):
@@ -0,0 +1,222 @@
+#
+# Perfil de tempo por fase de cada quadro
+#
+# Mede quanto tempo cada quadro gasta em update, draw, space.step, nos
+# callbacks before_step/after_step e nas funções de colisão do easymunk.
+# Mostra as médias e o p99 em uma sobreposição na tela (liga/desliga com F1)
+# e pode gravar um registro JSONL com uma linha por quadro.
+#
+# Uso, sem modificar o exemplo:
+#
+#   $ python profiler.py lander.py --trace lander.jsonl
+#   $ python profiler.py sir-model.py --headless --frames 300 --trace sir.jsonl
+#
+# ou dentro do código:
+#
+#   profiler = FrameProfiler(trace="frames.jsonl")
+#   profiler.run(game.update, game.draw)
+#
+import sys
+import json
+import runpy
+import argparse
+from time import perf_counter_ns
+from collections import deque, defaultdict
+from functools import wraps
+from pathlib import Path
+
+COLLISION_HOOKS = [
+    "begin_collision",
+    "pre_solve_collision",
+    "post_solve_collision",
+    "separate_collision",
+]
+
+
+class FrameProfiler:
+    """
+    Acumula o tempo gasto em cada fase durante um quadro.
+
+    As funções embrulhadas com wrap()/timed() só medem o tempo quando o
+    perfil está ativo (sobreposição visível ou registro em arquivo). Quando
+    desativado, o custo é apenas um teste de atributo por chamada.
+    """
+
+    def __init__(self, trace=None, overlay=False, window=120, key="KEY_F1"):
+        self.overlay = overlay
+        self.window = window
+        self.key = key
+        self.frame = 0
+        self.current = defaultdict(int)
+        self.history = defaultdict(lambda: deque(maxlen=self.window))
+        self.trace = open(trace, "w") if trace else None
+
+    @property
+    def enabled(self):
+        return self.overlay or self.trace is not None
+
+    def wrap(self, name, fn):
+        """
+        Retorna uma versão de fn que soma o tempo de cada chamada à fase name.
+        """
+        current = self.current
+
+        @wraps(fn)
+        def timed_fn(*args, **kwargs):
+            if not self.enabled:
+                return fn(*args, **kwargs)
+            start = perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                current[name] += perf_counter_ns() - start
+
+        return timed_fn
+
+    def timed(self, name):
+        """
+        Decorador equivalente a wrap(name, fn).
+        """
+        return lambda fn: self.wrap(name, fn)
+
+    def end_frame(self):
+        """
+        Fecha o quadro atual: atualiza as médias móveis e grava a linha no
+        registro JSONL.
+        """
+        if self.current:
+            ms = {name: ns / 1e6 for name, ns in self.current.items()}
+            for name, value in ms.items():
+                self.history[name].append(value)
+            if self.trace is not None:
+                self.trace.write(json.dumps({"frame": self.frame, **ms}) + "\n")
+            self.current.clear()
+        self.frame += 1
+
+    def stats(self):
+        """
+        Dicionário {fase: (média, p99)} em milissegundos sobre a janela.
+        """
+        result = {}
+        for name, values in self.history.items():
+            if values:
+                ordered = sorted(values)
+                p99 = ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))]
+                result[name] = (sum(ordered) / len(ordered), p99)
+        return result
+
+    def draw_overlay(self, x=None, y=1):
+        import pyxel
+
+        lines = [f"{name[:11]:<11}{avg:6.2f}{p99:6.2f}" for name, (avg, p99) in self.stats().items()]
+        lines.insert(0, f"{'ms':<11}{'media':>6}{'p99':>6}")
+        if x is None:
+            x = pyxel.width - 23 * pyxel.FONT_WIDTH - 1
+        pyxel.rect(x - 1, y - 1, 23 * pyxel.FONT_WIDTH + 2, len(lines) * (pyxel.FONT_HEIGHT + 1) + 1, 0)
+        for i, line in enumerate(lines):
+            pyxel.text(x, y + i * (pyxel.FONT_HEIGHT + 1), line, 7)
+
+    def run(self, update, draw, run=None):
+        """
+        Substitui pyxel.run(update, draw) medindo update e draw e desenhando
+        a sobreposição por cima do quadro.
+        """
+        import pyxel
+
+        run = run or pyxel.run
+        timed_update = self.wrap("update", update)
+        timed_draw = self.wrap("draw", draw)
+
+        def frame_update():
+            if pyxel.btnp(getattr(pyxel, self.key)):
+                self.overlay = not self.overlay
+            timed_update()
+
+        def frame_draw():
+            timed_draw()
+            if self.overlay:
+                self.draw_overlay()
+            if self.enabled:
+                self.end_frame()
+
+        try:
+            run(frame_update, frame_draw)
+        finally:
+            self.close()
+
+    def instrument_space_class(self, cls):
+        """
+        Mede step() e os callbacks registrados pelos decoradores
+        before_step/after_step e *_collision de uma classe de espaço.
+        """
+        if hasattr(cls, "step"):
+            cls.step = self.wrap("step", cls.step)
+
+        for name in ["before_step", "after_step", *COLLISION_HOOKS]:
+            method = getattr(cls, name, None)
+            if method is not None:
+                phase = "collision" if name in COLLISION_HOOKS else name
+                setattr(cls, name, self._wrap_decorator(phase, method))
+
+    def _wrap_decorator(self, phase, method):
+        # space.before_step(...) retorna um decorador: embrulha a função
+        # decorada antes de registrá-la
+        @wraps(method)
+        def factory(space, *args, **kwargs):
+            decorator = method(space, *args, **kwargs)
+            return lambda fn: decorator(self.wrap(phase, fn))
+
+        return factory
+
+    def close(self):
+        if self.trace is not None:
+            self.trace.close()
+            self.trace = None
+
+
+def instrument(profiler):
+    """
+    Instala o perfil em pyxel.run e nas classes de espaço do pymunk e do
+    easymunk que estiverem instalados.
+    """
+    import pyxel
+
+    original_run = pyxel.run
+    pyxel.run = lambda update, draw: profiler.run(update, draw, original_run)
+
+    for module_name in ["pymunk", "easymunk"]:
+        try:
+            module = __import__(module_name)
+        except ImportError:
+            continue
+        profiler.instrument_space_class(module.Space)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mede o tempo de cada fase dos quadros de um exemplo.")
+    parser.add_argument("script", help="arquivo do exemplo, ex.: lander.py")
+    parser.add_argument("--trace", default=None, help="arquivo JSONL com uma linha por quadro")
+    parser.add_argument("--overlay", action="store_true", help="começa com a sobreposição visível")
+    parser.add_argument("--headless", action="store_true", help="executa sem janela (ver headless.py)")
+    parser.add_argument("--frames", type=int, default=300, help="quadros no modo --headless")
+    args = parser.parse_args(argv)
+
+    if args.headless:
+        import headless
+
+        headless.install(args.frames)
+
+    profiler = FrameProfiler(trace=args.trace, overlay=args.overlay)
+    instrument(profiler)
+
+    path = Path(args.script).resolve()
+    sys.path.insert(0, str(path.parent))
+    sys.argv = [str(path)]
+    runpy.run_path(str(path), run_name="__main__")
+
+    for name, (avg, p99) in profiler.stats().items():
+        print(f"{name:>12}: média {avg:.3f}ms, p99 {p99:.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
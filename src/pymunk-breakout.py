@@ -1,6 +1,8 @@
 import pyxel
 import random
-from pymunk import Space, Body, Circle, Poly, Segment, BB, Arbiter, Vec2d
+from batch_draw import StaticLayer
+from brick_field import BrickField, reflect
+from pymunk import Space, Body, Circle, Poly, Segment, BB, Vec2d
 
 FPS = 30
 WIDTH, HEIGHT = SCREEN = (256, 196)
@@ -11,14 +13,19 @@ class Game:
     BLOCK_SHAPE = PLAYER_SHAPE
     PLAYER_SPEED = 90
     BALL_SPEED = 60
+    BALL_RADIUS = 3
     BALL_COL_TYPE = 1
-    BLOCK_COL_TYPE = 2
     DIV_LINE_COL_TYPE = 3
 
     def __init__(self):
         self.paused = True
         self.space = Space()
 
+        # Blocos são desenhados uma vez em uma camada retida; as colisões só
+        # marcam os retângulos a apagar (ver draw)
+        self.layer = None
+        self.dirty = []
+
         # Cria jogadores
         x, y = WIDTH / 2, HEIGHT - 5
         self.player = Body(body_type=Body.KINEMATIC)
@@ -30,7 +37,7 @@ class Game:
 
         # Cria bola
         self.ball = Body(1, 1)
-        shape = Circle(self.ball, 3)
+        shape = Circle(self.ball, self.BALL_RADIUS)
         shape.elasticity = 1.0
         shape.collision_type = self.BALL_COL_TYPE
         self.space.add(self.ball, shape)
@@ -43,12 +50,12 @@ class Game:
         top.elasticity = left.elasticity = right.elasticity = 1.0
         self.space.add(top, left, right)
 
-        # Cria blocos
+        # Cria blocos: ficam fora do pymunk, em uma grade com um bit por
+        # bloco (centros em (20, 15) + (26 * col, 7 * linha))
         x0, y0 = 20, 15
         w, h = self.BLOCK_SHAPE
-        for dx in range(0, WIDTH - 25, w + 1):
-            for dy in range(0, HEIGHT // 3, h + 1):
-                self.make_block(x0 + dx, y0 + dy)
+        shape = (len(range(0, HEIGHT // 3, h + 1)), len(range(0, WIDTH - 25, w + 1)))
+        self.blocks = BrickField((x0 - w / 2, y0 - h / 2), (w + 1, h + 1), (w, h), shape)
 
         # Cria linha divisória
         y = HEIGHT // 2 + 4 * self.BLOCK_SHAPE[1]
@@ -59,29 +66,23 @@ class Game:
         # self.space.add(shape)
 
         # Registra função para atuar nos eventos de colisão
-        handler = self.space.add_collision_handler(self.BLOCK_COL_TYPE, self.BALL_COL_TYPE)
-        handler.separate = self.on_collision
- 
         handler = self.space.add_collision_handler(self.DIV_LINE_COL_TYPE, self.BALL_COL_TYPE)
         handler.begin = self.on_div_line_collision
 
-    def on_collision(self, arb: Arbiter, space, data):
-        for shape in arb.shapes:
-            if shape.collision_type == self.BLOCK_COL_TYPE:
-                space.remove(shape, shape.body)
-        return True
-
     def on_div_line_collision(self, arb, space, data):
         return False
 
-    def make_block(self, x, y):
-        body = Body(2, float('inf'), body_type=Body.STATIC)
-        body.position = (x, y)
-
-        shape = Poly.create_box(body, self.BLOCK_SHAPE)
-        shape.elasticity = 1.0
-        shape.collision_type = self.BLOCK_COL_TYPE
-        self.space.add(body, shape)
+    def collide_blocks(self, previous):
+        """
+        Testa o caminho da bola no último passo contra a grade de blocos.
+        """
+        hit = self.blocks.sweep(previous, self.ball.position, self.BALL_RADIUS)
+        if hit is None:
+            return
+        self.blocks.remove(hit.row, hit.col)
+        self.dirty.append(self.blocks.rect(hit.row, hit.col))
+        self.ball.position = hit.position
+        self.ball.velocity = reflect(self.ball.velocity, hit.normal)
 
     def update(self):
         # Atualiza a velocidade
@@ -97,7 +98,9 @@ class Game:
         self.ball.force += (angle - v.angle_degrees) * self.ball.velocity.normalized().rotated_degrees(90)
         
         dt = 1 / FPS
+        previous = self.ball.position
         self.space.step(dt)
+        self.collide_blocks(previous)
 
         # Inicia o jogo quando aperta espaço
         if self.paused and pyxel.btnp(pyxel.KEY_SPACE):
@@ -118,21 +121,31 @@ class Game:
         if self.paused:
             self.ball.position = self.player.position + (0, -6)
 
+    def shape_rect(self, shape):
+        bb: BB = shape.bb
+        return bb.left, bb.bottom, bb.right - bb.left, bb.top - bb.bottom
+
+    def draw_static(self):
+        self.layer = StaticLayer()
+        for row, col in self.blocks.bricks():
+            self.layer.rect(*self.blocks.rect(row, col), pyxel.COLOR_WHITE)
+        self.dirty.clear()
+
     def draw(self):
+        if self.layer is None:
+            self.draw_static()
+        for rect in self.dirty:
+            self.layer.erase(*rect)
+        self.dirty.clear()
+
         pyxel.cls(pyxel.COLOR_BLACK)
+        self.layer.blit()
 
-        for shape in self.space.shapes:
-            if isinstance(shape, Circle):
-                x, y = shape.body.position + shape.offset
-                r = shape.radius
-                pyxel.circ(x, y, r, pyxel.COLOR_RED)
-            elif isinstance(shape, Poly):
-                bb: BB = shape.bb
-                x = bb.left
-                y = bb.bottom
-                width = bb.right - bb.left
-                height = bb.top - bb.bottom
-                pyxel.rect(x, y, width, height, pyxel.COLOR_WHITE)
+        # Só a bola e a plataforma mudam a cada quadro
+        x, y = self.ball.position
+        pyxel.circ(x, y, self.BALL_RADIUS, pyxel.COLOR_RED)
+        for shape in self.player.shapes:
+            pyxel.rect(*self.shape_rect(shape), pyxel.COLOR_WHITE)
 
 
 game = Game()
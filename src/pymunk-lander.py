@@ -1,7 +1,9 @@
 from pymunk.arbiter import Arbiter
 from pymunk.vec2d import Vec2d
+import numpy as np
 import pyxel
 import random
+from heightfield import Heightfield
 from pymunk import Space, Body, Circle, Poly, Segment, Vec2d, BB
 
 FPS = 30
@@ -21,7 +23,9 @@ class Game:
     GRAVITY = Vec2d(0, 25)
     THRUST = -3 * GRAVITY
     ANGULAR_VELOCITY = 5
-    FLOOR_STEP = 30
+    # Células do chão com a largura da base: a célula plana sob ela é
+    # exatamente a base, sem degrau ao lado
+    FLOOR_STEP = BASE_SHAPE[0]
     FLOOR_DY = 15
     FLOOR_N = 42
     PLAYER_COL_TYPE = 1
@@ -58,8 +62,7 @@ class Game:
         # Cria chão
         shape = list(self.base.shapes)[0]
         bb = shape.cache_bb()
-        self.make_floor(bb.right, bb.bottom, self.FLOOR_STEP, self.FLOOR_DY)
-        self.make_floor(bb.left, bb.bottom, -self.FLOOR_STEP, self.FLOOR_DY)
+        self.make_floor(bb.left, bb.bottom, self.FLOOR_STEP, self.FLOOR_DY)
 
         # Escuta colisões entre base/chão e jogador
         handler = self.space.add_collision_handler(self.PLAYER_COL_TYPE, self.BASE_COL_TYPE)
@@ -79,15 +82,18 @@ class Game:
         self.landed = True
         
     def make_floor(self, x, y, step, dy):
+        # Mapa de alturas com FLOOR_N células aleatórias de cada lado de uma
+        # célula plana [x, x + step] onde fica a base (step = largura da base)
+        n = self.FLOOR_N
+        right = y + np.cumsum([random.uniform(-dy, dy) for _ in range(n)])
+        left = y + np.cumsum([random.uniform(-dy, dy) for _ in range(n)])
+        self.floor = Heightfield(x - n * step, step, np.concatenate([left[::-1], [y, y], right]))
+
         body = self.space.static_body
-        
-        a = Vec2d(x, y)
-        for _ in range(self.FLOOR_N):
-            b = a + (step, random.uniform(-dy, dy))
+        for a, b in self.floor.segments():
             shape = Segment(body, a, b, 2)
             shape.collision_type = self.FLOOR_COL_TYPE
             self.space.add(shape)
-            a = b
 
     def update(self):
         if not self.landed:
@@ -1,12 +1,21 @@
 #
 # MODELO SIR
 #
-from copy import copy
+# Teclas: F avança rápido (vários passos da física por quadro, quantos couberem
+# no tempo do quadro) e E salva o histórico.
+#
+# Para simular sem janela até não restarem infecciosos:
+#
+#   $ python sir-model.py --headless
+#
+import time
+import argparse
 from types import SimpleNamespace
-from collections import deque
+from itertools import chain
 import random
-from easymunk import pyxel as phys, Arbiter, BB, ShapeFilter
-import pyxel
+import numpy as np
+from sir_stats import StatsBuffer
+from sir_schedule import TimerWheel
 
 
 # Parâmetros da simulação
@@ -16,104 +25,225 @@ PROB_INFECTION = 0.25
 INFECTIOUS_PERIOD = 30 * 5
 PROB_DEATH = 0.01
 SIZE = 500
+FPS = 30
+DT = 1 / 30
 
 # Constantes
 S, I, R, D = range(1, 5)
-COLORS = [None, pyxel.COLOR_PEACH, pyxel.COLOR_RED, pyxel.COLOR_LIME, pyxel.COLOR_ORANGE]
-STATS = deque([], 256)
-STATS_STEPS = 16
-
-# Inicializa espaço e elementos
-pyxel.init(256, 256)
-pyxel.mouse(True)
-
-space = phys.space()
-stats = SimpleNamespace(S=N - 1, I=1, R=0, D=0)
-camera = phys.Camera(flip_y=True)
-camera.follow((0, 0))
-
-# Cria elementos
-circles = []
-for _ in range(N):
-    x = random.uniform(-SIZE / 2, +SIZE / 2)
-    y = random.uniform(-SIZE / 2, +SIZE / 2)
-    vel = random.uniform(-SPEED, SPEED), random.uniform(-SPEED, SPEED)
-    c = phys.circ(x, y, 2, velocity=vel, collision_type=S)
-    circles.append(c)
-
-# Infecta o paciente zero
-c = circles[-1]
-c.shape.collision_type = I
-c.frames_to_recovery = INFECTIOUS_PERIOD  # (days_to_recovery, no vídeo)
-c.position = (128, 128)
-
-# Margens
-phys.margin(-SIZE / 2, -SIZE / 2, SIZE, SIZE)
-space.shapes.apply(elasticity=1.0)
-
-
-# Infecta um suscetível em contato com um infeccioso
-@space.separate_collision(S, I)
-def on_infection(arb: Arbiter):
-    s, i = arb.shapes
-    if s.collision_type != S:
-        s, i = i, s
-
-    if random.random() < PROB_INFECTION:
-        s.collision_type = I
-        s.body.frames_to_recovery = INFECTIOUS_PERIOD
-        stats.S -= 1
-        stats.I += 1
-
-
-def update():
-    camera.offset += phys.arrow(1, 1)
-    space.step(1 / 30)
-
-    for c in circles:
-        if c.collision_type == I:
-            c.frames_to_recovery -= 1
-
-            if c.frames_to_recovery <= 0:
-                stats.I -= 1
-
-                if random.random() < PROB_DEATH:
-                    stats.D += 1
-                    c.collision_type = D
-                    c.body_type = "static"
-                else:
-                    stats.R += 1
-                    c.collision_type = R
-
-    if pyxel.frame_count % STATS_STEPS == 0:
-        STATS.append(copy(stats))
-
-def draw():
-    pyxel.cls(0)
-    x, y = camera.offset
-    bb = BB(x, y, x + 256, y + 256)
-    for c in space.bb_query(bb, ShapeFilter()):
-        if c.is_circle:
-            x, y = c.position
-            color = COLORS[c.collision_type]
-            camera.pset(x, y, color)
-
-    height = pyxel.height
-    s = height / N
-    for x, stat in enumerate(STATS):
-        pyxel.pset(x, height - s * stat.S, COLORS[S])
-        pyxel.pset(x, height - s * stat.I, COLORS[I])
-        pyxel.pset(x, height - s * stat.R, COLORS[R])
-        pyxel.pset(x, height - s * stat.D, COLORS[D])
-
-    col = pyxel.COLOR_WHITE
-    pyxel.text(0, 0, f'S = {stats.S}', col)
-    pyxel.text(0, 10, f'I = {stats.I}', col)
-    pyxel.text(0, 20, f'R = {stats.R}', col)
-    pyxel.text(0, 30, f'D = {stats.D}', col)
-    
-
-pyxel.run(update, draw)
-
-
-
+STATS_PATH = "sir-stats.npz"
+
+
+class Game:
+    """
+    Simulação com n agentes no easymunk.
+
+    O pyxel e o easymunk só são importados aqui, para que main() possa
+    instalar antes o pyxel sem janela (ver headless.py).
+    """
+
+    def __init__(self, n=N, fast=False, seed=None):
+        from easymunk import pyxel as phys
+        import pyxel
+        from batch_draw import PointLayer
+
+        self.phys = phys
+        self.n = n
+        self.rng = random.Random(seed)
+        self.colors = [None, pyxel.COLOR_PEACH, pyxel.COLOR_RED, pyxel.COLOR_LIME, pyxel.COLOR_ORANGE]
+        self.color_table = np.array([0, *self.colors[1:]], dtype=np.uint8)
+        self.history = StatsBuffer()
+
+        # Agenda de recuperação: passo -> infectados que se recuperam nele
+        self.recovery = TimerWheel()
+
+        # Passos da física já simulados (independente dos quadros desenhados)
+        # e tempo gasto no último draw(), descontado do orçamento do avanço
+        # rápido
+        self.clock = SimpleNamespace(step=0, steps_per_frame=1, draw_time=0.0, fast=fast)
+
+        # Inicializa espaço e elementos
+        pyxel.init(256, 256, fps=FPS)
+        pyxel.mouse(True)
+        self.layer = PointLayer()
+
+        self.space = space = phys.space()
+        self.stats = SimpleNamespace(S=n - 1, I=1, R=0, D=0)
+        self.camera = phys.Camera(flip_y=True)
+        self.camera.follow((0, 0))
+
+        # Cria elementos
+        self.circles = []
+        for _ in range(n):
+            x = self.rng.uniform(-SIZE / 2, +SIZE / 2)
+            y = self.rng.uniform(-SIZE / 2, +SIZE / 2)
+            vel = self.rng.uniform(-SPEED, SPEED), self.rng.uniform(-SPEED, SPEED)
+            c = phys.circ(x, y, 2, velocity=vel, collision_type=S)
+            self.circles.append(c)
+
+        # Estado (espelha collision_type) e posição de cada círculo, para
+        # desenhar em lote
+        self.index = {c: k for k, c in enumerate(self.circles)}
+        self.state = np.full(n, S, dtype=np.int8)
+        self.xy = np.zeros((n, 2))
+
+        # Infecta o paciente zero
+        c = self.circles[-1]
+        c.shape.collision_type = I
+        self.state[-1] = I
+        self.schedule_recovery(c)  # (days_to_recovery, no vídeo)
+        c.position = (128, 128)
+        self.sync_positions()
+
+        # Margens
+        phys.margin(-SIZE / 2, -SIZE / 2, SIZE, SIZE)
+        space.shapes.apply(elasticity=1.0)
+
+        # Infecta um suscetível em contato com um infeccioso
+        @space.separate_collision(S, I)
+        def on_infection(arb):
+            s, i = arb.shapes
+            if s.collision_type != S:
+                s, i = i, s
+            self.infect(s)
+
+    def schedule_recovery(self, body):
+        # Como na contagem regressiva original: o passo em que o agente é
+        # infectado já conta como o primeiro dos INFECTIOUS_PERIOD passos
+        self.recovery.schedule(self.clock.step + INFECTIOUS_PERIOD - 1, body)
+
+    def infect(self, shape):
+        if self.rng.random() < PROB_INFECTION:
+            shape.collision_type = I
+            self.state[self.index[shape.body]] = I
+            self.schedule_recovery(shape.body)
+            self.stats.S -= 1
+            self.stats.I += 1
+
+    def sync_positions(self):
+        """
+        Copia as posições dos corpos para self.xy (uma vez por passo).
+        """
+        flat = chain.from_iterable(c.position for c in self.circles)
+        self.xy.ravel()[:] = np.fromiter(flat, float, 2 * self.n)
+
+    def step(self):
+        stats = self.stats
+        self.space.step(DT)
+        self.sync_positions()
+
+        # Visita apenas os infectados que se recuperam neste passo
+        for c in self.recovery.pop(self.clock.step):
+            stats.I -= 1
+
+            if self.rng.random() < PROB_DEATH:
+                stats.D += 1
+                c.collision_type = D
+                c.body_type = "static"
+            else:
+                stats.R += 1
+                c.collision_type = R
+            self.state[self.index[c]] = c.collision_type
+
+        self.history.append(self.clock.step, stats.S, stats.I, stats.R, stats.D)
+        self.clock.step += 1
+
+    def advance(self, budget):
+        """
+        Simula um passo e, no avanço rápido, continua enquanto houver
+        infecciosos e sobrar tempo do orçamento (em segundos). Retorna o
+        número de passos simulados.
+        """
+        clock = self.clock
+        deadline = time.perf_counter() + budget
+        self.step()
+        steps = 1
+        while clock.fast and self.stats.I > 0 and time.perf_counter() < deadline:
+            self.step()
+            steps += 1
+        clock.steps_per_frame = steps
+        return steps
+
+    def update(self):
+        import pyxel
+
+        self.camera.offset += self.phys.arrow(1, 1)
+
+        if pyxel.btnp(pyxel.KEY_F):
+            self.clock.fast = not self.clock.fast
+
+        # No avanço rápido, simula passos até esgotar o tempo do quadro que
+        # sobra depois do draw()
+        self.advance(1 / FPS - self.clock.draw_time)
+
+        # Salva o histórico completo (ver sir_stats.py para inspecionar)
+        if pyxel.btnp(pyxel.KEY_E):
+            self.history.save(STATS_PATH)
+
+    def draw(self):
+        import pyxel
+
+        start = time.perf_counter()
+        pyxel.cls(0)
+
+        # Só os agentes visíveis (máscara sobre as posições do último passo),
+        # em uma única transferência (ver batch_draw.py)
+        ox, oy = self.camera.offset
+        x, y = self.xy.T
+        visible = (x >= ox) & (x < ox + pyxel.width) & (y >= oy) & (y < oy + pyxel.height)
+        colors = self.color_table[self.state[visible]]
+        self.layer.draw_camera(x[visible], y[visible], colors, self.camera)
+
+        colors = self.colors
+        height = pyxel.height
+        s = height / self.n
+        _, data = self.history.downsample(pyxel.width)
+        for x, (s_, i_, r_, d_) in enumerate(data.T):
+            pyxel.pset(x, height - s * s_, colors[S])
+            pyxel.pset(x, height - s * i_, colors[I])
+            pyxel.pset(x, height - s * r_, colors[R])
+            pyxel.pset(x, height - s * d_, colors[D])
+
+        stats = self.stats
+        col = pyxel.COLOR_WHITE
+        pyxel.text(0, 0, f'S = {stats.S}', col)
+        pyxel.text(0, 10, f'I = {stats.I}', col)
+        pyxel.text(0, 20, f'R = {stats.R}', col)
+        pyxel.text(0, 30, f'D = {stats.D}', col)
+        if self.clock.fast:
+            pyxel.text(0, 40, f'>> {self.clock.steps_per_frame} passos/quadro', col)
+        self.clock.draw_time = time.perf_counter() - start
+
+    def run_headless(self, log=print):
+        start = time.perf_counter()
+        while self.stats.I > 0:
+            self.step()
+        elapsed = time.perf_counter() - start
+        steps = self.clock.step
+        stats = self.stats
+        log(f"{steps} passos em {elapsed:.2f}s ({steps / elapsed:.1f} passos/s)")
+        log(f"S = {stats.S}, I = {stats.I}, R = {stats.R}, D = {stats.D}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Modelo SIR com o easymunk.")
+    parser.add_argument("--headless", action="store_true", help="simula sem janela até a extinção dos infecciosos")
+    parser.add_argument("--fast", action="store_true", help="começa no modo de avanço rápido")
+    parser.add_argument("-n", type=int, default=N, help="número de agentes")
+    args = parser.parse_args(argv)
+
+    if args.headless:
+        import headless
+
+        headless.install()
+
+    import pyxel
+
+    game = Game(args.n, fast=args.fast)
+    if args.headless:
+        game.run_headless()
+    else:
+        pyxel.run(game.update, game.draw)
+
+
+if __name__ == "__main__":
+    main()
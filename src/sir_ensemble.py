@@ -0,0 +1,164 @@
+#
+# Ensemble de Monte Carlo do modelo SIR
+#
+# Uma execução do modelo é apenas uma amostra ruidosa. Este script roda
+# várias sementes do modelo vetorizado (sir_numpy.py) em paralelo, cada uma
+# com um gerador de números aleatórios independente, e agrega as séries
+# S/I/R/D conforme as execuções terminam: média e quantis por quadro, sem
+# guardar as execuções individuais. O resultado é salvo em um .npz com uma
+# coluna por grandeza.
+#
+# Uso:
+#
+#   $ python sir_ensemble.py --runs 200 --prob-infection 0.1 0.25 -o sir.npz
+#
+import os
+import time
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+import sir_numpy
+
+STATS_STEPS = 16
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+PARAMS = ["n", "speed", "prob_infection", "infectious_period", "prob_death"]
+
+
+def simulate(params, seed, frames, every=STATS_STEPS):
+    """
+    Executa uma simulação e retorna a série (S, I, R, D) amostrada a cada
+    `every` quadros até `frames`. Depois da extinção dos infecciosos, a série
+    é completada com o estado final.
+    """
+    model = sir_numpy.SIRModel(seed=seed, **params)
+    samples = frames // every + 1
+    series = np.empty((samples, 4), dtype=np.int32)
+    for k in range(samples):
+        series[k] = model.stats
+        if model.stats[1] == 0:
+            series[k:] = model.stats
+            break
+        for _ in range(every):
+            model.step()
+    return series
+
+
+class EnsembleStats:
+    """
+    Acumula as séries de várias execuções com memória fixa: soma (para a
+    média) e um histograma por amostra e por coluna (para os quantis).
+
+    Os quantis têm a resolução de um bin do histograma, ou seja, n / bins:
+    cada um é o menor valor inteiro do seu bin. Com bins = n + 1, cada valor
+    tem o próprio bin e os quantis são exatos.
+    """
+
+    def __init__(self, samples, n, bins=200):
+        self.n = n
+        self.bins = min(bins, n + 1)
+        self.runs = 0
+        self.total = np.zeros((samples, 4))
+        self.hist = np.zeros((samples, 4, self.bins), dtype=np.int32)
+
+    def add(self, series):
+        self.runs += 1
+        self.total += series
+        idx = np.minimum(series.astype(np.int64) * self.bins // (self.n + 1), self.bins - 1)
+        t, col = np.indices(series.shape)
+        np.add.at(self.hist, (t, col, idx), 1)
+
+    def mean(self):
+        return self.total / max(self.runs, 1)
+
+    def quantiles(self, qs=QUANTILES):
+        """
+        Vetor (len(qs), amostras, 4) com os quantis de cada coluna.
+        """
+        cdf = np.cumsum(self.hist, axis=-1)
+        result = []
+        for q in qs:
+            # Primeiro bin que acumula ao menos q das execuções (e ao menos
+            # uma, para que q = 0 seja o mínimo)
+            idx = np.minimum((cdf < max(q * self.runs, 1)).sum(axis=-1), self.bins - 1)
+            # Inverso de add(): menor v com v * bins // (n + 1) == idx
+            result.append(-(-idx * (self.n + 1) // self.bins))
+        return np.array(result, dtype=float)
+
+
+def run_ensemble(params, runs, frames=3000, seed=0, workers=None, every=STATS_STEPS, bins=200):
+    """
+    Roda `runs` execuções com os parâmetros dados em um pool de processos e
+    retorna o EnsembleStats com o agregado.
+    """
+    n = params.get("n", sir_numpy.N)
+    stats = EnsembleStats(frames // every + 1, n, bins)
+    seeds = iter(np.random.SeedSequence(seed).spawn(runs))
+
+    workers = workers or os.cpu_count()
+    with ProcessPoolExecutor(workers) as pool:
+        # Mantém poucas execuções pendentes para não acumular resultados
+        submit = lambda s: pool.submit(simulate, params, s, frames, every)
+        pending = {submit(s) for s in itertools.islice(seeds, 2 * workers)}
+        while pending:
+            done = next(as_completed(pending))
+            pending.remove(done)
+            stats.add(done.result())
+            s = next(seeds, None)
+            if s is not None:
+                pending.add(submit(s))
+    return stats
+
+
+def save(path, param_sets, results, every=STATS_STEPS, qs=QUANTILES):
+    """
+    Salva os agregados em um .npz colunar. Os vetores têm um primeiro eixo
+    para o conjunto de parâmetros.
+    """
+    columns = {name: np.array([p[name] for p in param_sets]) for name in PARAMS}
+    samples = results[0].total.shape[0]
+    np.savez_compressed(
+        path,
+        frame=np.arange(samples) * every,
+        runs=np.array([r.runs for r in results]),
+        quantile=np.array(qs),
+        mean=np.array([r.mean() for r in results], dtype=np.float32),
+        quantiles=np.array([r.quantiles(qs) for r in results], dtype=np.float32),
+        **columns,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ensemble de Monte Carlo do modelo SIR.")
+    parser.add_argument("--runs", type=int, default=100, help="execuções por conjunto de parâmetros")
+    parser.add_argument("--frames", type=int, default=3000, help="duração de cada execução")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("-n", type=int, nargs="+", default=[sir_numpy.N])
+    parser.add_argument("--speed", type=float, nargs="+", default=[sir_numpy.SPEED])
+    parser.add_argument("--prob-infection", type=float, nargs="+", default=[sir_numpy.PROB_INFECTION])
+    parser.add_argument("--infectious-period", type=int, nargs="+", default=[sir_numpy.INFECTIOUS_PERIOD])
+    parser.add_argument("--prob-death", type=float, nargs="+", default=[sir_numpy.PROB_DEATH])
+    parser.add_argument("-o", "--output", default="sir-ensemble.npz")
+    args = parser.parse_args(argv)
+
+    grid = itertools.product(args.n, args.speed, args.prob_infection, args.infectious_period, args.prob_death)
+    param_sets = [dict(zip(PARAMS, values)) for values in grid]
+
+    results = []
+    for params in param_sets:
+        start = time.perf_counter()
+        stats = run_ensemble(params, args.runs, args.frames, args.seed, args.workers)
+        results.append(stats)
+        s, i, r, d = stats.mean()[-1]
+        print(
+            f"{params}: {stats.runs} execuções em {time.perf_counter() - start:.1f}s, "
+            f"média final S={s:.0f} I={i:.0f} R={r:.0f} D={d:.0f}"
+        )
+
+    save(args.output, param_sets, results)
+    print(f"Resultados salvos em {args.output}")
+
+
+if __name__ == "__main__":
+    main()
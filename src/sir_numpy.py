@@ -0,0 +1,233 @@
+#
+# MODELO SIR VETORIZADO
+#
+# Mesmo modelo de sir-model.py, mas sem o motor de física: posições e
+# velocidades dos agentes ficam em vetores do NumPy, as paredes refletem os
+# agentes e só os contatos entre infecciosos (I) e suscetíveis (S) são
+# procurados, usando uma grade de células. Isso permite simular da ordem de
+# 10^6 agentes.
+#
+# Os agentes não colidem entre si. Cada novo contato entre um I e um S
+# (distância menor que 2 raios neste quadro, mas não no anterior) é uma
+# tentativa de infecção com probabilidade PROB_INFECTION, assim como cada
+# colisão S-I em sir-model.py.
+#
+import time
+import argparse
+import numpy as np
+
+# Parâmetros da simulação (os mesmos de sir-model.py)
+N = 5000
+SPEED = 10
+PROB_INFECTION = 0.25
+INFECTIOUS_PERIOD = 30 * 5
+PROB_DEATH = 0.01
+SIZE = 500
+RADIUS = 2
+DT = 1 / 30
+
+# Constantes
+S, I, R, D = range(1, 5)
+
+
+class SIRModel:
+    """
+    Simulação SIR com agentes em vetores.
+
+    Se size não for dado, o lado da caixa cresce com sqrt(n) para manter a
+    mesma densidade de agentes de sir-model.py.
+    """
+
+    def __init__(
+        self,
+        n=N,
+        speed=SPEED,
+        prob_infection=PROB_INFECTION,
+        infectious_period=INFECTIOUS_PERIOD,
+        prob_death=PROB_DEATH,
+        size=None,
+        radius=RADIUS,
+        dt=DT,
+        seed=None,
+    ):
+        self.n = n
+        self.prob_infection = prob_infection
+        self.infectious_period = infectious_period
+        self.prob_death = prob_death
+        self.size = SIZE * np.sqrt(n / N) if size is None else size
+        self.radius = radius
+        self.dt = dt
+        self.frame = 0
+        self.rng = rng = np.random.default_rng(seed)
+
+        half = self.size / 2
+        self.x = rng.uniform(-half, half, n)
+        self.y = rng.uniform(-half, half, n)
+        self.vx = rng.uniform(-speed, speed, n)
+        self.vy = rng.uniform(-speed, speed, n)
+        self.state = np.full(n, S, dtype=np.int8)
+        self.recover_at = np.zeros(n, dtype=np.int64)
+
+        # Infecta o paciente zero, em (128, 128) como em sir-model.py ou no
+        # canto da caixa, se ela for menor
+        self.state[-1] = I
+        self.x[-1] = self.y[-1] = min(128, half - radius)
+        self.recover_at[-1] = infectious_period
+        self.infected = np.array([n - 1])
+        self.stats = np.array([n - 1, 1, 0, 0])
+
+        # Grade com células do tamanho da distância de contato
+        self.cell_size = 2 * radius
+        self.cells = int(np.ceil(self.size / self.cell_size)) + 1
+
+    def counts(self):
+        """
+        Tupla (S, I, R, D) com o número de agentes em cada estado.
+        """
+        return tuple(int(k) for k in self.stats)
+
+    def step(self):
+        x0, y0 = self.x.copy(), self.y.copy()
+        self.move()
+        self.infect(x0, y0)
+        self.recover()
+        self.frame += 1
+
+    def move(self):
+        dt = self.dt
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+
+        # Paredes elásticas (como em phys.margin)
+        lo = -self.size / 2 + self.radius
+        hi = self.size / 2 - self.radius
+        for pos, vel in [(self.x, self.vx), (self.y, self.vy)]:
+            low, high = pos < lo, pos > hi
+            pos[low] = 2 * lo - pos[low]
+            pos[high] = 2 * hi - pos[high]
+            vel[low | high] *= -1
+
+    def cell_keys(self, idx=slice(None)):
+        # As coordenadas deslocadas são positivas: truncar equivale a floor()
+        half = self.size / 2
+        scale = 1 / self.cell_size
+        cx = ((self.x[idx] + half) * scale).astype(np.int64)
+        cy = ((self.y[idx] + half) * scale).astype(np.int64)
+        np.clip(cx, 0, self.cells - 1, out=cx)
+        np.clip(cy, 0, self.cells - 1, out=cy)
+        return cx, cy
+
+    def contacts(self, x0, y0):
+        """
+        Pares (i, s) de infecciosos e suscetíveis que entraram em contato
+        neste quadro.
+        """
+        infected = self.infected
+        empty = np.zeros(0, dtype=np.int64)
+        if infected.size == 0:
+            return empty, empty
+
+        # Marca as células vizinhas a algum infeccioso e só considera os
+        # suscetíveis que estão nelas
+        m = self.cells
+        icx, icy = self.cell_keys(infected)
+        hot = np.zeros((m + 2, m + 2), dtype=bool)
+        for dx in (0, 1, 2):
+            for dy in (0, 1, 2):
+                hot[icx + dx, icy + dy] = True
+        hot = hot[1:-1, 1:-1]
+
+        cx, cy = self.cell_keys()
+        susceptible = np.flatnonzero((self.state == S) & hot[cx, cy])
+        if susceptible.size == 0:
+            return empty, empty
+
+        keys = cx[susceptible] * m + cy[susceptible]
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+
+        pairs_i, pairs_s = [], []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                neighbor = (icx + dx) * m + (icy + dy)
+                start = np.searchsorted(sorted_keys, neighbor, "left")
+                count = np.searchsorted(sorted_keys, neighbor, "right") - start
+                total = count.sum()
+                if total == 0:
+                    continue
+                offset = np.cumsum(count) - count
+                pairs_i.append(np.repeat(infected, count))
+                pos = np.repeat(start - offset, count) + np.arange(total)
+                pairs_s.append(susceptible[order[pos]])
+
+        if not pairs_i:
+            return empty, empty
+        i, s = np.concatenate(pairs_i), np.concatenate(pairs_s)
+
+        # Em contato agora, mas não no quadro anterior
+        d2 = (2 * self.radius) ** 2
+        now = (self.x[i] - self.x[s]) ** 2 + (self.y[i] - self.y[s]) ** 2 <= d2
+        before = (x0[i] - x0[s]) ** 2 + (y0[i] - y0[s]) ** 2 <= d2
+        new = now & ~before
+        return i[new], s[new]
+
+    def infect(self, x0, y0):
+        _, s = self.contacts(x0, y0)
+        trials = self.rng.random(s.size) < self.prob_infection
+        s = np.unique(s[trials])
+        if s.size:
+            self.state[s] = I
+            self.recover_at[s] = self.frame + self.infectious_period
+            self.infected = np.concatenate([self.infected, s])
+            self.stats[0] -= s.size
+            self.stats[1] += s.size
+
+    def recover(self):
+        infected = self.infected
+        due = self.recover_at[infected] <= self.frame
+        if not due.any():
+            return
+
+        done = infected[due]
+        self.infected = infected[~due]
+        dead = self.rng.random(done.size) < self.prob_death
+        self.state[done] = np.where(dead, D, R)
+        self.vx[done[dead]] = 0
+        self.vy[done[dead]] = 0
+
+        n_dead = int(dead.sum())
+        self.stats[1] -= done.size
+        self.stats[2] += done.size - n_dead
+        self.stats[3] += n_dead
+
+    def run(self, max_frames=None):
+        """
+        Simula até não haver mais infecciosos (ou até max_frames) e retorna
+        a série temporal como um vetor com colunas S, I, R, D.
+        """
+        history = [self.counts()]
+        while self.stats[1] > 0 and (max_frames is None or self.frame < max_frames):
+            self.step()
+            history.append(self.counts())
+        return np.array(history, dtype=np.int32)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Modelo SIR vetorizado (sem motor de física).")
+    parser.add_argument("-n", type=int, default=N, help="número de agentes")
+    parser.add_argument("--frames", type=int, default=None, help="número máximo de quadros")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    model = SIRModel(args.n, seed=args.seed)
+    start = time.perf_counter()
+    history = model.run(args.frames)
+    elapsed = time.perf_counter() - start
+
+    s, i, r, d = history[-1]
+    print(f"{model.frame} quadros em {elapsed:.2f}s ({model.frame / elapsed:.1f} quadros/s)")
+    print(f"S = {s}, I = {i}, R = {r}, D = {d}")
+
+
+if __name__ == "__main__":
+    main()
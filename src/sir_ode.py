@@ -0,0 +1,188 @@
+#
+# Modelo SIR de campo médio
+#
+# Equações diferenciais do modelo SIRD, em frações da população e com o
+# tempo medido em quadros da simulação:
+#
+#   dS/dt = -β S I
+#   dI/dt = β S I - γ I
+#   dR/dt = (1 - p) γ I
+#   dD/dt = p γ I
+#
+# β, γ e p podem ser vetores de qualquer formato: todas as combinações são
+# integradas juntas (Runge-Kutta de 4ª ordem) com operações do NumPy. Isso
+# permite varrer milhares de parâmetros em poucos segundos e ajustar β e γ
+# à série S/I/R/D de uma simulação de agentes (sir-model.py, sir_numpy.py)
+# antes de gastar tempo com execuções caras.
+#
+# Uso:
+#
+#   $ python sir_ode.py sir-stats.npz        # ajusta a série salva por sir-model.py
+#   $ python sir_ode.py --simulate -n 20000  # ajusta uma execução de sir_numpy.py
+#
+import argparse
+from typing import NamedTuple
+import numpy as np
+
+
+def derivatives(y, beta, gamma, prob_death):
+    s, i, _, _ = y
+    infection = beta * s * i
+    recovery = gamma * i
+    return np.array([-infection, infection - recovery, (1 - prob_death) * recovery, prob_death * recovery])
+
+
+def rk4_step(y, beta, gamma, prob_death, dt):
+    k1 = derivatives(y, beta, gamma, prob_death)
+    k2 = derivatives(y + dt / 2 * k1, beta, gamma, prob_death)
+    k3 = derivatives(y + dt / 2 * k2, beta, gamma, prob_death)
+    k4 = derivatives(y + dt * k3, beta, gamma, prob_death)
+    return y + dt / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+
+
+def initial_state(i0, shape):
+    y = np.zeros((4, *shape))
+    y[0] = 1 - i0
+    y[1] = i0
+    return y
+
+
+def trajectories(beta, gamma, prob_death=0.0, frames=1000, i0=1e-3, substeps=1):
+    """
+    Gerador com o estado (4, *formato) de cada quadro 0, 1, ..., frames,
+    onde formato é o formato comum (broadcast) de beta, gamma e prob_death.
+    """
+    beta, gamma, prob_death = np.broadcast_arrays(*map(np.asarray, (beta, gamma, prob_death)))
+    dt = 1 / substeps
+    y = initial_state(i0, beta.shape)
+    yield y
+    for _ in range(frames):
+        for _ in range(substeps):
+            y = rk4_step(y, beta, gamma, prob_death, dt)
+        yield y
+
+
+def solve(beta, gamma, prob_death=0.0, frames=1000, i0=1e-3, every=1, substeps=1):
+    """
+    Integra o modelo e retorna um vetor (amostras, 4, *formato) com as frações
+    S, I, R, D a cada `every` quadros.
+    """
+    states = trajectories(beta, gamma, prob_death, frames, i0, substeps)
+    return np.array([y for k, y in enumerate(states) if k % every == 0])
+
+
+def sse(beta, gamma, observed, prob_death=0.0, substeps=1):
+    """
+    Soma dos quadrados dos resíduos de I e R + D (em frações) em relação à
+    série observada (quadros, 4), para cada combinação de parâmetros.
+
+    O erro é acumulado durante a integração, sem guardar as trajetórias.
+    """
+    frames = len(observed) - 1
+    total = 0.0
+    states = trajectories(beta, gamma, prob_death, frames, observed[0, 1], substeps)
+    for y, obs in zip(states, observed):
+        total = total + (y[1] - obs[1]) ** 2 + (y[2] + y[3] - obs[2] - obs[3]) ** 2
+    return total
+
+
+def residuals(params, observed, prob_death, substeps):
+    # params: (2, k) com log(β) e log(γ) -> resíduos (k, 2 * quadros)
+    beta, gamma = np.exp(params)
+    model = solve(beta, gamma, prob_death, len(observed) - 1, observed[0, 1], substeps=substeps)
+    res_i = model[:, 1] - observed[:, 1, None]
+    res_r = model[:, 2] + model[:, 3] - (observed[:, 2] + observed[:, 3])[:, None]
+    return np.concatenate([res_i, res_r]).T
+
+
+class FitResult(NamedTuple):
+    beta: float
+    gamma: float
+    prob_death: float
+    sse: float
+
+    @property
+    def r0(self):
+        return self.beta / self.gamma
+
+
+def fit(series, grid=40, iterations=50, substeps=1, beta_range=(1e-4, 1.0), gamma_range=(1e-4, 0.3)):
+    """
+    Ajusta β e γ (por quadro) por mínimos quadrados à série S/I/R/D de uma
+    simulação de agentes (vetor (quadros, 4) de contagens, um quadro por
+    linha).
+
+    Primeiro avalia uma grade logarítmica grid x grid de uma vez e depois
+    refina o melhor ponto com Levenberg-Marquardt em log(β), log(γ). A
+    fração de mortes p é estimada diretamente de D / (R + D) no final.
+    """
+    series = np.asarray(series, dtype=float)
+    observed = series / series[0].sum()
+    removed = observed[-1, 2] + observed[-1, 3]
+    prob_death = observed[-1, 3] / removed if removed > 0 else 0.0
+
+    # Busca em grade
+    betas = np.geomspace(*beta_range, grid)
+    gammas = np.geomspace(*gamma_range, grid)
+    errors = sse(betas[:, None], gammas[None, :], observed, prob_death, substeps)
+    k, m = np.unravel_index(np.nanargmin(errors), errors.shape)
+    params = np.log([betas[k], gammas[m]])
+    best = errors[k, m]
+
+    # Levenberg-Marquardt com o jacobiano por diferenças finitas: o ponto
+    # atual e os dois deslocados são integrados juntos
+    h = 1e-6
+    damping = 1e-3
+    for _ in range(iterations):
+        probe = params[:, None] + np.array([[0, h, 0], [0, 0, h]])
+        res = residuals(probe, observed, prob_death, substeps)
+        r = res[0]
+        jac = (res[1:] - r).T / h
+        jtj = jac.T @ jac
+        grad = jac.T @ r
+        while True:
+            delta = np.linalg.solve(jtj + damping * np.diag(np.diag(jtj) + 1e-12), -grad)
+            candidate = params + delta
+            error = float(sse(*np.exp(candidate), observed, prob_death, substeps))
+            if error < best:
+                params, best = candidate, error
+                damping /= 3
+                break
+            damping *= 3
+            if damping > 1e10:
+                break
+        if damping > 1e10 or np.abs(delta).max() < 1e-8:
+            break
+
+    beta, gamma = np.exp(params)
+    return FitResult(float(beta), float(gamma), float(prob_death), float(best))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ajusta o modelo SIR de campo médio a uma simulação de agentes.")
+    parser.add_argument("path", nargs="?", help="histórico salvo por sir-model.py (.npz ou .csv)")
+    parser.add_argument("--simulate", action="store_true", help="ajusta uma execução de sir_numpy.py")
+    parser.add_argument("-n", type=int, default=None, help="agentes em --simulate")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    if args.simulate:
+        import sir_numpy
+
+        series = sir_numpy.SIRModel(args.n or sir_numpy.N, seed=args.seed).run()
+    elif args.path:
+        from sir_stats import StatsBuffer
+
+        buffer = StatsBuffer.load(args.path)
+        series = buffer.data[:, : len(buffer)].T
+    else:
+        parser.error("informe um arquivo ou --simulate")
+
+    result = fit(series)
+    print(f"{len(series)} quadros, N = {series[0].sum()}")
+    print(f"beta = {result.beta:.5g}/quadro, gamma = {result.gamma:.5g}/quadro, R0 = {result.r0:.3f}")
+    print(f"p(morte) = {result.prob_death:.4f}, erro quadrático = {result.sse:.4g}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+#
+# Agenda de eventos por passo
+#
+# No modelo SIR, cada infectado se recupera um número fixo de passos depois
+# de ser infectado. Em vez de percorrer todos os infectados a cada passo
+# para ver quem já pode se recuperar, cada um é colocado no compartimento
+# do passo em que se recupera e o passo só visita o seu compartimento.
+#
+# Uso (ver sir-model.py):
+#
+#   recovery = TimerWheel()
+#   recovery.schedule(step + INFECTIOUS_PERIOD, agent)
+#   ...
+#   for agent in recovery.pop(step):
+#       ...
+#
+from collections import defaultdict
+
+
+class TimerWheel:
+    """
+    Associa cada passo à lista de itens agendados para ele.
+
+    Agendar e retirar um item custa O(1); passos sem eventos não ocupam
+    memória.
+    """
+
+    def __init__(self):
+        self.slots = defaultdict(list)
+
+    def __len__(self):
+        return sum(len(slot) for slot in self.slots.values())
+
+    def schedule(self, step, item):
+        self.slots[step].append(item)
+
+    def pop(self, step):
+        """
+        Remove e retorna os itens agendados para o passo (na ordem em que
+        foram agendados).
+        """
+        return self.slots.pop(step, [])
@@ -0,0 +1,169 @@
+#
+# Histórico das estatísticas do modelo SIR
+#
+# Guarda a série temporal S/I/R/D em colunas int32 pré-alocadas que crescem
+# conforme necessário, junto com o número do quadro de cada amostra. O
+# gráfico na tela usa uma versão reduzida da série, mas a resolução completa
+# pode ser salva em .npz ou CSV e carregada depois para inspeção ou replay.
+#
+# Uso:
+#
+#   $ python sir_stats.py sir-stats.npz            # resumo da execução
+#   $ python sir_stats.py sir-stats.npz --replay   # refaz o gráfico na tela
+#
+import argparse
+import warnings
+from pathlib import Path
+import numpy as np
+
+COLUMNS = ("S", "I", "R", "D")
+
+
+class StatsBuffer:
+    """
+    Série temporal com uma coluna por estado (S, I, R, D) e o quadro de cada
+    amostra.
+
+    A capacidade dobra quando o buffer enche, então adicionar uma amostra
+    custa O(1) amortizado e não cria objetos Python.
+    """
+
+    def __init__(self, capacity=1024):
+        self.size = 0
+        self.frames = np.zeros(capacity, dtype=np.int64)
+        self.data = np.zeros((len(COLUMNS), capacity), dtype=np.int32)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, name):
+        """
+        Coluna pelo nome, ex.: buffer["I"].
+        """
+        return self.data[COLUMNS.index(name), : self.size]
+
+    @property
+    def frame(self):
+        return self.frames[: self.size]
+
+    def append(self, frame, s, i, r, d):
+        k = self.size
+        if k == len(self.frames):
+            self.frames = np.concatenate([self.frames, np.zeros_like(self.frames)])
+            self.data = np.concatenate([self.data, np.zeros_like(self.data)], axis=1)
+        self.frames[k] = frame
+        self.data[:, k] = (s, i, r, d)
+        self.size += 1
+
+    def downsample(self, width):
+        """
+        Retorna (quadros, dados) com no máximo `width` amostras igualmente
+        espaçadas, para desenhar a série inteira em `width` pixels.
+        """
+        n = self.size
+        if n <= width:
+            idx = np.arange(n)
+        else:
+            idx = np.linspace(0, n - 1, width).astype(np.int64)
+        return self.frames[idx], self.data[:, idx]
+
+    def save(self, path, chunk=65536):
+        """
+        Salva a série completa em .npz (uma entrada por coluna) ou em CSV.
+
+        Só o CSV é escrito em blocos de `chunk` linhas, para limitar a memória
+        usada na formatação do texto. No .npz cada coluna já é um vetor
+        contíguo gravado sem cópias, então `chunk` é ignorado.
+        """
+        path = Path(path)
+        if path.suffix == ".csv":
+            with open(path, "w") as fd:
+                fd.write("frame," + ",".join(COLUMNS) + "\n")
+                for start in range(0, self.size, chunk):
+                    end = min(start + chunk, self.size)
+                    rows = np.column_stack([self.frames[start:end], self.data[:, start:end].T])
+                    np.savetxt(fd, rows, fmt="%d", delimiter=",")
+        else:
+            columns = {name: self[name] for name in COLUMNS}
+            np.savez_compressed(path, frame=self.frame, **columns)
+
+    @classmethod
+    def load(cls, path):
+        path = Path(path)
+        if path.suffix == ".csv":
+            # Um CSV só com o cabeçalho é um histórico vazio, não um erro
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", UserWarning)
+                table = np.loadtxt(path, delimiter=",", skiprows=1, dtype=np.int64, ndmin=2)
+            table = table.reshape(-1, len(COLUMNS) + 1)
+            frames, columns = table[:, 0], table[:, 1:].T
+        else:
+            with np.load(path) as npz:
+                frames = npz["frame"]
+                columns = np.array([npz[name] for name in COLUMNS])
+
+        buffer = cls(max(len(frames), 1))
+        buffer.size = len(frames)
+        buffer.frames[: buffer.size] = frames
+        buffer.data[:, : buffer.size] = columns
+        return buffer
+
+    def summary(self):
+        if not self.size:
+            return "nenhuma amostra"
+        infected = self["I"]
+        peak = int(infected.argmax())
+        s, i, r, d = self.data[:, self.size - 1]
+        return (
+            f"{self.size} amostras (quadros {self.frame[0]} a {self.frame[-1]})\n"
+            f"pico de infecciosos: I = {infected[peak]} no quadro {self.frame[peak]}\n"
+            f"final: S = {s}, I = {i}, R = {r}, D = {d}"
+        )
+
+
+def replay(buffer, speed=4):
+    """
+    Refaz o gráfico da execução na tela, revelando `speed` colunas por quadro.
+    """
+    if not len(buffer):
+        raise ValueError("histórico vazio: não há o que refazer.")
+    import pyxel
+
+    colors = [pyxel.COLOR_PEACH, pyxel.COLOR_RED, pyxel.COLOR_LIME, pyxel.COLOR_ORANGE]
+    pyxel.init(256, 256)
+    _, data = buffer.downsample(pyxel.width)
+    total = data[:, 0].sum()
+
+    def update():
+        pass
+
+    def draw():
+        pyxel.cls(0)
+        scale = pyxel.height / total
+        shown = min(pyxel.frame_count * speed, data.shape[1])
+        for x in range(shown):
+            for col, value in zip(colors, data[:, x]):
+                pyxel.pset(x, pyxel.height - scale * value, col)
+
+        col = pyxel.COLOR_WHITE
+        for k, name in enumerate(COLUMNS):
+            value = data[k, max(shown - 1, 0)]
+            pyxel.text(0, 10 * k, f"{name} = {value}", col)
+
+    pyxel.run(update, draw)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspeciona o histórico salvo por sir-model.py.")
+    parser.add_argument("path", help="arquivo .npz ou .csv")
+    parser.add_argument("--replay", action="store_true", help="refaz o gráfico na tela")
+    args = parser.parse_args(argv)
+
+    buffer = StatsBuffer.load(args.path)
+    print(buffer.summary())
+    if args.replay and len(buffer):
+        replay(buffer)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+#
+# Decomposição convexa de contornos SVG
+#
+# phys.poly (e os polígonos do pymunk) só aceitam contornos convexos. Este
+# módulo divide um polígono simples qualquer em poucos pedaços convexos:
+# triangula por remoção de orelhas e depois junta triângulos vizinhos
+# enquanto o resultado continuar convexo (Hertel-Mehlhorn, no máximo 4 vezes
+# o número mínimo de pedaços).
+#
+# convex_pieces() lê o caminho com svg_path e guarda o resultado em disco,
+# indexado pelo hash do caminho e pela tolerância, então carrosserias e
+# pistas complexas são decompostas só na primeira execução.
+#
+# Uso:
+#
+#   pieces = convex_pieces("m 0,0 l 20,0 0,10 -10,0 0,10 -10,0 z")
+#   for piece in pieces:
+#       body.create_poly(piece)
+#
+import json
+import hashlib
+from pathlib import Path
+
+TOLERANCE = 0.25
+CACHE_DIR = Path(__file__).with_name("__svgcache__")
+CACHE_VERSION = 1
+EPS = 1e-9
+
+
+def signed_area(points):
+    """
+    Área com sinal: positiva para polígonos no sentido anti-horário.
+    """
+    n = len(points)
+    total = 0.0
+    for k in range(n):
+        x0, y0 = points[k]
+        x1, y1 = points[(k + 1) % n]
+        total += x0 * y1 - x1 * y0
+    return total / 2
+
+
+def cross(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def segments_intersect(a, b, c, d):
+    d1, d2 = cross(c, d, a), cross(c, d, b)
+    d3, d4 = cross(a, b, c), cross(a, b, d)
+    if ((d1 > EPS and d2 < -EPS) or (d1 < -EPS and d2 > EPS)) and (
+        (d3 > EPS and d4 < -EPS) or (d3 < -EPS and d4 > EPS)
+    ):
+        return True
+
+    # Casos colineares: um extremo sobre o outro segmento
+    def on_segment(p, q, r):
+        return min(p[0], q[0]) - EPS <= r[0] <= max(p[0], q[0]) + EPS and min(p[1], q[1]) - EPS <= r[1] <= max(
+            p[1], q[1]
+        ) + EPS
+
+    return (
+        (abs(d1) <= EPS and on_segment(c, d, a))
+        or (abs(d2) <= EPS and on_segment(c, d, b))
+        or (abs(d3) <= EPS and on_segment(a, b, c))
+        or (abs(d4) <= EPS and on_segment(a, b, d))
+    )
+
+
+def clean(points):
+    """
+    Remove pontos repetidos em sequência (inclusive o fechamento repetindo o
+    primeiro ponto) e vértices colineares.
+    """
+    result = []
+    for p in map(tuple, points):
+        if not result or abs(p[0] - result[-1][0]) > EPS or abs(p[1] - result[-1][1]) > EPS:
+            result.append(p)
+    while len(result) > 1 and abs(result[0][0] - result[-1][0]) <= EPS and abs(result[0][1] - result[-1][1]) <= EPS:
+        result.pop()
+
+    changed = True
+    while changed and len(result) > 3:
+        changed = False
+        for k in range(len(result)):
+            if abs(cross(result[k - 1], result[k], result[(k + 1) % len(result)])) <= EPS:
+                del result[k]
+                changed = True
+                break
+    return result
+
+
+def orient(points):
+    """
+    Valida o contorno e retorna seus vértices no sentido anti-horário.
+
+    Levanta ValueError se o polígono for degenerado ou tiver arestas que se
+    cruzam.
+    """
+    points = clean(points)
+    n = len(points)
+    if n < 3 or abs(signed_area(points)) <= EPS:
+        raise ValueError("polígono degenerado (menos de 3 vértices ou área nula).")
+
+    for i in range(n):
+        a, b = points[i], points[(i + 1) % n]
+        for j in range(i + 2, n):
+            if i == 0 and j == n - 1:
+                continue
+            if segments_intersect(a, b, points[j], points[(j + 1) % n]):
+                raise ValueError(f"polígono não é simples: arestas {i} e {j} se cruzam.")
+
+    if signed_area(points) < 0:
+        points.reverse()
+    return points
+
+
+def triangulate(points):
+    """
+    Triangula um polígono simples anti-horário por remoção de orelhas.
+    Retorna triângulos como tuplas de índices.
+    """
+    remaining = list(range(len(points)))
+    triangles = []
+    while len(remaining) > 3:
+        n = len(remaining)
+        for k in range(n):
+            i, j, l = remaining[k - 1], remaining[k], remaining[(k + 1) % n]
+            a, b, c = points[i], points[j], points[l]
+            if cross(a, b, c) <= EPS:
+                continue
+            if any(
+                cross(a, b, points[m]) >= -EPS and cross(b, c, points[m]) >= -EPS and cross(c, a, points[m]) >= -EPS
+                for m in remaining
+                if m not in (i, j, l) and points[m] not in (a, b, c)
+            ):
+                continue
+            triangles.append((i, j, l))
+            del remaining[k]
+            break
+        else:
+            raise ValueError("não foi possível triangular o polígono.")
+    triangles.append(tuple(remaining))
+    return triangles
+
+
+def is_convex(points, indices):
+    n = len(indices)
+    return all(
+        cross(points[indices[k - 1]], points[indices[k]], points[indices[(k + 1) % n]]) >= -EPS for k in range(n)
+    )
+
+
+def merge(p, q, a, b):
+    # p tem a aresta a -> b e q a aresta b -> a: junta pela diagonal
+    i = p.index(a)
+    j = q.index(b)
+    p = p[i + 1 :] + p[: i + 1]  # b ... a
+    q = q[j + 1 :] + q[: j + 1]  # a ... b
+    return p + q[1:-1]
+
+
+def convex_decompose(points):
+    """
+    Divide um polígono simples (em qualquer sentido) em polígonos convexos
+    anti-horários, como listas de tuplas (x, y).
+    """
+    points = orient(points)
+    pieces = [list(t) for t in triangulate(points)]
+
+    merged = True
+    while merged:
+        merged = False
+        edges = {}
+        for k, piece in enumerate(pieces):
+            for a, b in zip(piece, piece[1:] + piece[:1]):
+                edges[a, b] = k
+        for (a, b), k in edges.items():
+            m = edges.get((b, a))
+            if m is None or m == k:
+                continue
+            candidate = merge(pieces[k], pieces[m], a, b)
+            if is_convex(points, candidate):
+                pieces[k] = candidate
+                del pieces[m]
+                merged = True
+                break
+
+    return [clean(points[i] for i in piece) for piece in pieces]
+
+
+def convex_pieces(src, tolerance=TOLERANCE, cache_dir=CACHE_DIR):
+    """
+    Pedaços convexos do caminho SVG src (ver svg_path.mk_path).
+
+    O resultado fica em cache_dir, em um arquivo JSON indexado pelo hash do
+    caminho e da tolerância. Use cache_dir=None para não usar o disco.
+    """
+    path = None
+    if cache_dir is not None:
+        key = hashlib.sha1(f"{CACHE_VERSION}:{tolerance!r}:{src}".encode()).hexdigest()
+        path = Path(cache_dir) / f"{key}.json"
+        if path.exists():
+            return [[tuple(p) for p in piece] for piece in json.loads(path.read_text())]
+
+    from svg_path import parse_path
+
+    pieces = convex_decompose(parse_path(src, tolerance=tolerance))
+    if path is not None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(pieces))
+        tmp.replace(path)
+    return pieces
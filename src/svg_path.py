@@ -1,49 +1,305 @@
-from easymunk import Vec2d
-from typing import  List
-import pyxel
+#
+# Caminhos SVG
+#
+# Converte o atributo "d" de um <path> (como os exportados pelo Inkscape) em
+# uma lista de pontos. Todos os comandos são aceitos (M, L, H, V, C, S, Q, T,
+# A e Z, em versões absolutas e relativas); as curvas são aproximadas por
+# segmentos de reta, subdivididos até que o desvio em relação à curva seja
+# menor que `tolerance` (em unidades do SVG).
+#
+# O resultado é memorizado pelo texto do caminho: carregar a mesma fase de
+# novo não repete a leitura. Só mk_path() usa o easymunk (para criar os
+# Vec2d); o resto do módulo é Python puro.
+#
+import re
+import math
+from functools import lru_cache
+from typing import TYPE_CHECKING, List
 
+if TYPE_CHECKING:
+    from easymunk import Vec2d
 
-def mk_path(src: str, origin=(0, 0)) -> List[Vec2d]:
-    cursor = Vec2d(*origin)
-    path = [cursor]
+TOLERANCE = 0.25
+MAX_DEPTH = 16
 
-    parts = src.replace(",", " ").split()
-    parts.reverse()
+NUMBER = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+TOKEN = re.compile(rf"[\s,]*(?:([MmZzLlHhVvCcSsQqTtAa])|({NUMBER}))")
+FLAG = re.compile(r"[\s,]*([01])")
+END = re.compile(r"[\s,]*$")
 
-    def read_vec():
-        return Vec2d(read_num(), read_num())
+
+def mk_path(src: str, origin=(0, 0), tolerance=TOLERANCE) -> "List[Vec2d]":
+    """
+    Lista de pontos do caminho, começando em origin (a não ser que o caminho
+    comece com um comando M/m).
+
+    Subcaminhos (vários M/m ou comandos depois de Z) continuam na mesma lista.
+    Z não repete o ponto inicial.
+    """
+    return list(_mk_path(src, tuple(origin), tolerance))
+
+
+@lru_cache(maxsize=256)
+def _mk_path(src, origin, tolerance):
+    from easymunk import Vec2d
+
+    return tuple(Vec2d(x, y) for x, y in parse_path(src, origin, tolerance))
+
+
+def parse_path(src, origin=(0, 0), tolerance=TOLERANCE):
+    """
+    Como mk_path(), mas retorna tuplas (x, y) e não usa o cache.
+    """
+    pos = 0
+    x, y = map(float, origin)
+    start = (x, y)
+    path = [(x, y)]
+
+    # Último ponto de controle (para os comandos S/s e T/t)
+    ctrl = prev = None
 
     def read_num():
-        return float(parts.pop())
-
-    cmd = "M"
-    while parts:
-        if parts[-1][-1] not in "0123456789-":
-            cmd = parts.pop()
-            if len(cmd) > 1:
-                parts.append(cmd[1:])
-                cmd = cmd[0]
-        if cmd in "LM":
-            cursor = read_vec()
-        elif cmd in "lm":
-            cursor += read_vec()
-        elif cmd == "H":
-            cursor = cursor.copy(x=read_num())
-        elif cmd == "h":
-            cursor = cursor.copy(x=cursor.x + read_num())
-        elif cmd == "V":
-            cursor = cursor.copy(y=read_num())
-        elif cmd == "v":
-            cursor = cursor.copy(y=cursor.y + read_num())
-        elif cmd in ("z", "Z"):
-            if parts:
-                raise ValueError("caminho fechou antes de terminar.")
-            break
+        nonlocal pos
+        m = TOKEN.match(src, pos)
+        if not m or m.group(2) is None:
+            raise ValueError(f"número esperado na posição {pos}: {src[pos:pos + 10]!r}")
+        pos = m.end()
+        return float(m.group(2))
+
+    def read_flag():
+        nonlocal pos
+        m = FLAG.match(src, pos)
+        if not m:
+            raise ValueError(f"flag 0/1 esperada na posição {pos}: {src[pos:pos + 10]!r}")
+        pos = m.end()
+        return m.group(1) == "1"
+
+    def read_vec(relative):
+        px, py = read_num(), read_num()
+        return (x + px, y + py) if relative else (px, py)
+
+    cmd = "M" if src.lstrip()[:1] not in ("m", "M") else None
+    while not END.match(src, pos):
+        m = TOKEN.match(src, pos)
+        if m is None:
+            raise ValueError(f"comando inválido na posição {pos}: {src[pos:pos + 10]!r}")
+        if m.group(1):
+            pos = m.end()
+            cmd = m.group(1)
+        elif cmd is None:
+            raise ValueError(f"comando inválido na posição {pos}: {src[pos:pos + 10]!r}")
+
+        op, relative = cmd.upper(), cmd.islower()
+        if op == "M":
+            x, y = start = read_vec(relative)
+            path.append((x, y))
+            # Pares seguintes a um M são linhas
+            cmd = "l" if relative else "L"
+            ctrl = None
+            continue
+        elif op == "Z":
+            x, y = start
+            cmd = None
+            ctrl = None
+            continue
+        elif op == "L":
+            x, y = read_vec(relative)
+            path.append((x, y))
+        elif op == "H":
+            x = read_num() + (x if relative else 0)
+            path.append((x, y))
+        elif op == "V":
+            y = read_num() + (y if relative else 0)
+            path.append((x, y))
+        elif op in "CS":
+            if op == "C":
+                c1 = read_vec(relative)
+            else:
+                c1 = (2 * x - ctrl[0], 2 * y - ctrl[1]) if ctrl and prev in "CS" else (x, y)
+            c2 = read_vec(relative)
+            end = read_vec(relative)
+            flatten_cubic((x, y), c1, c2, end, tolerance, path)
+            (x, y), ctrl = end, c2
+        elif op in "QT":
+            if op == "Q":
+                q = read_vec(relative)
+            else:
+                q = (2 * x - ctrl[0], 2 * y - ctrl[1]) if ctrl and prev in "QT" else (x, y)
+            end = read_vec(relative)
+            c1 = (x + 2 / 3 * (q[0] - x), y + 2 / 3 * (q[1] - y))
+            c2 = (end[0] + 2 / 3 * (q[0] - end[0]), end[1] + 2 / 3 * (q[1] - end[1]))
+            flatten_cubic((x, y), c1, c2, end, tolerance, path)
+            (x, y), ctrl = end, q
+        elif op == "A":
+            rx, ry, angle = read_num(), read_num(), read_num()
+            large, sweep = read_flag(), read_flag()
+            end = read_vec(relative)
+            flatten_arc((x, y), rx, ry, angle, large, sweep, end, tolerance, path)
+            x, y = end
         else:
             raise ValueError(f"comando inválido: {cmd!r}")
-        path.append(cursor)
 
-    if src.lstrip()[0] in "mM":
+        if op not in "CSQT":
+            ctrl = None
+        prev = op
+
+    if src.lstrip()[:1] in ("m", "M"):
         path.pop(0)
 
-    return path
\ No newline at end of file
+    return path
+
+
+def flatten_cubic(p0, p1, p2, p3, tolerance, out):
+    """
+    Acrescenta a out os pontos da curva de Bézier cúbica p0-p3 (sem p0),
+    subdividindo ao meio até cada trecho estar a menos de tolerance da reta.
+    """
+    limit = 16 * tolerance**2
+    stack = [(p0, p1, p2, p3, 0)]
+    while stack:
+        p0, p1, p2, p3, depth = stack.pop()
+
+        # Desvio máximo da curva em relação à corda (critério de Willcocks)
+        ux = (3 * p1[0] - 2 * p0[0] - p3[0]) ** 2
+        uy = (3 * p1[1] - 2 * p0[1] - p3[1]) ** 2
+        vx = (3 * p2[0] - p0[0] - 2 * p3[0]) ** 2
+        vy = (3 * p2[1] - p0[1] - 2 * p3[1]) ** 2
+        if max(ux, vx) + max(uy, vy) <= limit or depth >= MAX_DEPTH:
+            out.append(p3)
+            continue
+
+        # De Casteljau em t = 1/2; a metade esquerda sai primeiro da pilha
+        p01, p12, p23 = _mid(p0, p1), _mid(p1, p2), _mid(p2, p3)
+        p012, p123 = _mid(p01, p12), _mid(p12, p23)
+        mid = _mid(p012, p123)
+        stack.append((mid, p123, p23, p3, depth + 1))
+        stack.append((p0, p01, p012, mid, depth + 1))
+
+
+def flatten_arc(p0, rx, ry, angle, large, sweep, p1, tolerance, out):
+    """
+    Acrescenta a out os pontos do arco elíptico de p0 a p1 (sem p0), com a
+    parametrização do SVG (raios, rotação em graus e as flags large/sweep).
+    """
+    rx, ry = abs(rx), abs(ry)
+    if rx == 0 or ry == 0 or p0 == p1:
+        out.append(p1)
+        return
+
+    # Conversão para a parametrização pelo centro (SVG 1.1, apêndice F.6.5)
+    phi = math.radians(angle)
+    cos, sin = math.cos(phi), math.sin(phi)
+    dx, dy = (p0[0] - p1[0]) / 2, (p0[1] - p1[1]) / 2
+    x1 = cos * dx + sin * dy
+    y1 = -sin * dx + cos * dy
+
+    scale = (x1 / rx) ** 2 + (y1 / ry) ** 2
+    if scale > 1:
+        rx, ry = rx * math.sqrt(scale), ry * math.sqrt(scale)
+
+    num = rx**2 * ry**2 - rx**2 * y1**2 - ry**2 * x1**2
+    den = rx**2 * y1**2 + ry**2 * x1**2
+    k = math.sqrt(max(num, 0) / den)
+    if large == sweep:
+        k = -k
+    cx1, cy1 = k * rx * y1 / ry, -k * ry * x1 / rx
+    cx = cos * cx1 - sin * cy1 + (p0[0] + p1[0]) / 2
+    cy = sin * cx1 + cos * cy1 + (p0[1] + p1[1]) / 2
+
+    theta = math.atan2((y1 - cy1) / ry, (x1 - cx1) / rx)
+    end = math.atan2((-y1 - cy1) / ry, (-x1 - cx1) / rx)
+    delta = end - theta
+    if sweep and delta < 0:
+        delta += 2 * math.pi
+    elif not sweep and delta > 0:
+        delta -= 2 * math.pi
+
+    # Cada segmento cobre o ângulo cuja flecha no raio maior é a tolerância
+    r = max(rx, ry)
+    step = 2 * math.acos(max(1 - tolerance / r, -1))
+    n = min(max(1, math.ceil(abs(delta) / step)), 2**MAX_DEPTH)
+    for i in range(1, n):
+        t = theta + delta * i / n
+        ex, ey = rx * math.cos(t), ry * math.sin(t)
+        out.append((cx + cos * ex - sin * ey, cy + sin * ex + cos * ey))
+    out.append(p1)
+
+
+def _mid(a, b):
+    return (a[0] + b[0]) / 2, (a[1] + b[1]) / 2
+
+
+def simplify_path(points, tolerance=1.0, closed=False):
+    """
+    Reduz o número de vértices de uma linha poligonal sem afastá-la mais que
+    `tolerance` da original.
+
+    Primeiro junta segmentos colineares (e remove pontos repetidos) e depois
+    aplica Douglas-Peucker. Com closed=True, o último ponto se liga ao
+    primeiro. Retorna os pontos mantidos, na ordem e com o tipo originais.
+    """
+    points = _merge_collinear(list(points), closed)
+    n = len(points)
+    if n <= 2 or (closed and n <= 3):
+        return points
+
+    # No caminho fechado, divide o anel no ponto mais distante do primeiro e
+    # simplifica as duas metades
+    if closed:
+        x0, y0 = points[0][0], points[0][1]
+        far = max(range(1, n), key=lambda k: (points[k][0] - x0) ** 2 + (points[k][1] - y0) ** 2)
+        ring = points + points[:1]
+        keep = [False] * (n + 1)
+        keep[0] = keep[far] = keep[n] = True
+        spans = [(0, far), (far, n)]
+    else:
+        ring = points
+        keep = [False] * n
+        keep[0] = keep[n - 1] = True
+        spans = [(0, n - 1)]
+
+    while spans:
+        i, j = spans.pop()
+        if j - i < 2:
+            continue
+        k, dist = max(((k, _segment_distance(ring[k], ring[i], ring[j])) for k in range(i + 1, j)), key=lambda t: t[1])
+        if dist > tolerance:
+            keep[k] = True
+            spans.append((i, k))
+            spans.append((k, j))
+
+    return [p for p, kept in zip(points, keep) if kept]
+
+
+def _merge_collinear(points, closed):
+    result = []
+    for p in points:
+        if result and abs(p[0] - result[-1][0]) <= 1e-9 and abs(p[1] - result[-1][1]) <= 1e-9:
+            continue
+        # O ponto anterior está no meio de uma reta: descarta
+        while len(result) >= 2 and _collinear(result[-2], result[-1], p):
+            result.pop()
+        result.append(p)
+
+    if closed:
+        while len(result) > 1 and abs(result[0][0] - result[-1][0]) <= 1e-9 and abs(result[0][1] - result[-1][1]) <= 1e-9:
+            result.pop()
+        while len(result) > 3 and _collinear(result[-2], result[-1], result[0]):
+            result.pop()
+        while len(result) > 3 and _collinear(result[-1], result[0], result[1]):
+            result.pop(0)
+    return result
+
+
+def _collinear(a, b, c):
+    # b está sobre o segmento a-c (área do triângulo desprezível)
+    ux, uy = b[0] - a[0], b[1] - a[1]
+    vx, vy = c[0] - b[0], c[1] - b[1]
+    return abs(ux * vy - uy * vx) <= 1e-9 * (ux * ux + uy * uy + vx * vx + vy * vy) and ux * vx + uy * vy >= 0
+
+
+def _segment_distance(p, a, b):
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    length = dx * dx + dy * dy
+    t = 0.0 if length == 0 else max(0.0, min(1.0, ((p[0] - a[0]) * dx + (p[1] - a[1]) * dy) / length))
+    return math.hypot(p[0] - a[0] - t * dx, p[1] - a[1] - t * dy)
@@ -0,0 +1,106 @@
+#
+# Terreno procedural em pedaços
+#
+# Gera o chão e os obstáculos de um mundo lateral infinito em pedaços
+# (chunks) de largura fixa. Cada pedaço depende apenas da semente e do seu
+# índice, então voltar a um lugar já visitado gera exatamente o mesmo
+# terreno. O ChunkStreamer mantém no espaço apenas os pedaços próximos da
+# câmera: cria os que estão à frente e remove os que ficaram para trás.
+#
+# Uso (ver veiculos.py):
+#
+#   terrain = Terrain(seed=42)
+#   streamer = ChunkStreamer(terrain, build, destroy)
+#   ...
+#   streamer.update(camera_x)
+#
+import random
+
+
+class Terrain:
+    """
+    Gerador determinístico de terreno.
+
+    O chão é uma linha poligonal com vértices a cada `step` unidades, com
+    alturas aleatórias em torno de `base`. Como a altura de cada vértice
+    depende só da semente e da posição, pedaços vizinhos se encaixam sem
+    degraus.
+    """
+
+    def __init__(self, seed=0, chunk_width=512, step=32, base=100, amplitude=20, obstacles=(4, 10)):
+        if chunk_width % step:
+            raise ValueError("chunk_width deve ser múltiplo de step.")
+        self.seed = seed
+        self.chunk_width = chunk_width
+        self.step = step
+        self.base = base
+        self.amplitude = amplitude
+        self.obstacles = obstacles
+
+    def rng(self, kind, index):
+        return random.Random(f"{self.seed}:{kind}:{index}")
+
+    def vertex_height(self, k):
+        return self.base + self.amplitude * self.rng("h", k).uniform(-1, 1)
+
+    def height(self, x):
+        """
+        Altura do chão na posição x (interpolação linear entre vértices).
+        """
+        k, frac = divmod(x / self.step, 1)
+        k = int(k)
+        y0, y1 = self.vertex_height(k), self.vertex_height(k + 1)
+        return y0 + (y1 - y0) * frac
+
+    def chunk_index(self, x):
+        return int(x // self.chunk_width)
+
+    def chunk(self, index):
+        """
+        Retorna (chão, obstáculos) do pedaço index: a lista de vértices do
+        chão e uma lista de triângulos estáticos (x1, y1, x2, y2, x3, y3).
+        """
+        per_chunk = self.chunk_width // self.step
+        first = index * per_chunk
+        ground = [(k * self.step, self.vertex_height(k)) for k in range(first, first + per_chunk + 1)]
+
+        rng = self.rng("obstacles", index)
+        start = index * self.chunk_width
+        triangles = []
+        for _ in range(rng.randint(*self.obstacles)):
+            x = rng.uniform(start, start + self.chunk_width - 200)
+            w = rng.uniform(50, 100)
+            w_ = rng.uniform(50, 100)
+            h = rng.uniform(2, 10)
+
+            # Apoia a base no ponto mais baixo do chão sob o triângulo
+            y = min(self.height(x), self.height(x + w + w_), self.height(x + w))
+            triangles.append((x, y, x + w + w_, y, x + w, y + h + self.amplitude / 4))
+        return ground, triangles
+
+
+class ChunkStreamer:
+    """
+    Mantém no espaço apenas os pedaços em [atual - behind, atual + ahead].
+
+    build(index) cria os objetos do pedaço e retorna algo que é passado a
+    destroy() quando o pedaço sai da janela.
+    """
+
+    def __init__(self, terrain, build, destroy, ahead=2, behind=1):
+        self.terrain = terrain
+        self.build = build
+        self.destroy = destroy
+        self.ahead = ahead
+        self.behind = behind
+        self.live = {}
+
+    def update(self, x):
+        current = self.terrain.chunk_index(x)
+        wanted = range(current - self.behind, current + self.ahead + 1)
+
+        for index in [k for k in self.live if k not in wanted]:
+            self.destroy(self.live.pop(index))
+        for index in wanted:
+            if index not in self.live:
+                self.live[index] = self.build(index)
@@ -0,0 +1,65 @@
+import unittest
+import numpy as np
+import headless
+
+pyxel = headless.install()
+from batch_draw import PointLayer, StaticLayer, to_screen
+
+
+class TestPointLayer(unittest.TestCase):
+    def setUp(self):
+        headless.install(with_screen=True)
+        pyxel.init(64, 48)
+        self.layer = PointLayer()
+
+    def tearDown(self):
+        headless.install()
+
+    def test_screen_coordinates(self):
+        x, y = np.array([0.5, 10, 63, 70]), np.array([0, 5, 47, 3])
+        self.layer.draw(x, y, np.array([7, 8, 9, 10]))
+        assert pyxel.screen[0, 0] == 7 and pyxel.screen[5, 10] == 8 and pyxel.screen[47, 63] == 9
+        assert np.count_nonzero(pyxel.screen) == 3
+
+    def test_flip_y_with_offset(self):
+        sx, sy = to_screen([12, 15], [20, 20 + 47], offset=(10, 20), flip_y=True, height=48)
+        assert list(sx) == [2, 5] and list(sy) == [47, 0]
+
+    def test_image_bank_path(self):
+        screen, pyxel.screen = pyxel.screen, None
+        self.layer.draw([3], [4], 11)
+        pyxel.screen = screen
+        pyxel.cls(0)
+        pyxel.blt(0, 0, self.layer.bank, 0, 0, 64, 48, 0)
+        assert pyxel.screen[4, 3] == 11 and np.count_nonzero(pyxel.screen) == 1
+
+
+class TestStaticLayer(unittest.TestCase):
+    def setUp(self):
+        headless.install(with_screen=True)
+        pyxel.init(64, 48)
+        self.layer = StaticLayer()
+        self.layer.rect(2, 3, 10, 4, 7)
+        self.layer.rect(20, 3, 10, 4, 8)
+
+    def tearDown(self):
+        headless.install()
+
+    def test_blit(self):
+        self.layer.blit()
+        assert pyxel.screen[3, 2] == 7 and pyxel.screen[6, 29] == 8
+        assert np.count_nonzero(pyxel.screen) == 80
+
+    def test_erase_only_dirty_rect(self):
+        self.layer.erase(2, 3, 10, 4)
+        pyxel.cls(1)
+        self.layer.blit()
+        assert pyxel.screen[3, 2] == 1 and pyxel.screen[6, 29] == 8
+        assert np.count_nonzero(pyxel.screen == 8) == 40
+
+    def test_rect_clipped_to_layer(self):
+        self.layer.rect(-5, 40, 10, 20, 9)
+        self.layer.rect(70, 0, 5, 5, 9)
+        self.layer.blit()
+        assert np.count_nonzero(pyxel.screen == 9) == 5 * 8
+        assert pyxel.screen[47, 4] == 9 and pyxel.screen[39, 4] == 0
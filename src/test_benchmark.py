@@ -0,0 +1,46 @@
+import sys
+import unittest
+import headless
+
+headless.install()
+import benchmark
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_run_all_engines(self):
+        results = benchmark.run(sizes=(4,), steps=3, log=lambda msg: None)
+        engines = {row["engine"] for row in results}
+        assert {"motor", "motor-array", "motor-event"} <= engines
+        for row in results:
+            assert row["steps_per_sec"] > 0
+            assert row["p50_ms"] <= row["p99_ms"]
+
+    def test_motor_engines_conserve_energy_on_cradle(self):
+        for name in ["motor", "motor-array", "motor-event"]:
+            step, energy = benchmark.ENGINES[name]().cradle(5)
+            e0 = energy()
+            for _ in range(30):
+                step()
+            assert abs(energy() - e0) < 1e-6 * e0
+
+    def test_import_does_not_replace_pyxel(self):
+        pyxel = sys.modules.pop("pyxel")
+        del sys.modules["benchmark"]
+        try:
+            import benchmark  # noqa: F401
+
+            assert "pyxel" not in sys.modules
+        finally:
+            sys.modules["pyxel"] = pyxel
+
+    def test_unsupported_scenarios_are_skipped(self):
+        messages = []
+        results = benchmark.run(
+            ["motor"], ["platformer", "cradle"], sizes=(3,), steps=2, log=messages.append
+        )
+        assert [row["scenario"] for row in results] == ["cradle"]
+        assert any("platformer" in msg for msg in messages)
+
+    def test_level_boxes(self):
+        boxes = benchmark.level_boxes("|\n|== =\n")
+        assert boxes == [(16, 8, 32, 8), (64, 8, 16, 8)]
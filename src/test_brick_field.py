@@ -0,0 +1,85 @@
+import unittest
+from math import hypot, sqrt
+import numpy as np
+from brick_field import BrickField, reflect
+
+
+class TestBrickField(unittest.TestCase):
+    def setUp(self):
+        self.field = BrickField(origin=(0, 0), pitch=(26, 7), size=(25, 6), shape=(3, 4))
+
+    def test_rect_and_remove(self):
+        assert self.field.rect(1, 2) == (52, 7, 25, 6)
+        self.field.remove(1, 2)
+        assert len(self.field) == 11 and (1, 2) not in set(self.field.bricks())
+
+    def test_sweep_hits_first_brick_on_path(self):
+        # Bola subindo por baixo da grade, na coluna 1
+        hit = self.field.sweep((38, 40), (38, 10), radius=3)
+        assert (hit.row, hit.col) == (2, 1)
+        assert hit.normal == (0.0, 1.0)
+        assert hit.position[1] >= 14 + 3
+
+    def test_sweep_does_not_tunnel(self):
+        # Um passo longo atravessaria a grade inteira sem amostragem
+        hit = self.field.sweep((38, 100), (38, -100), radius=3)
+        assert (hit.row, hit.col) == (2, 1)
+
+    def test_sweep_does_not_tunnel_through_corner(self):
+        # Passo longo na diagonal, raspando o canto inferior direito do tijolo
+        # (2, 3) a 2.95 px do centro: amostrar a cada meio raio deixaria passar
+        corner = np.array([103.0, 20.0])
+        side, along = np.array([1, 1]) / sqrt(2), np.array([1, -1]) / sqrt(2)
+        start, end = corner + side * 2.95 - along * 299.3, corner + side * 2.95 + along * 300
+        hit = self.field.sweep(start, end, radius=3)
+        assert (hit.row, hit.col) == (2, 3)
+        # A normal aponta do canto para o centro no contato
+        offset = np.array(hit.position) - corner
+        assert 3 <= hypot(*offset) < 3.01
+        np.testing.assert_allclose(hit.normal, offset / hypot(*offset), atol=1e-3)
+
+        start, end = corner + side * 3.05 - along * 299.3, corner + side * 3.05 + along * 300
+        assert self.field.sweep(start, end, radius=3) is None
+
+    def test_sweep_hits_first_brick_along_diagonal(self):
+        # Subindo da esquerda para a direita: a fileira de baixo vem primeiro,
+        # e o contato é na face de baixo do tijolo (2, 0). Sem ele, a bola
+        # chega à face esquerda de (2, 1) em x = 24 antes de alcançar (1, 0)
+        hit = self.field.sweep((0, 40), (60, -20), radius=2)
+        assert (hit.row, hit.col) == (2, 0) and hit.normal == (0.0, 1.0)
+        assert np.isclose(hit.position[1], 22, atol=1e-2)
+        self.field.remove(2, 0)
+        hit = self.field.sweep((0, 40), (60, -20), radius=2)
+        assert (hit.row, hit.col) == (2, 1) and hit.normal == (-1.0, 0.0)
+
+    def test_sweep_agrees_with_dense_sampling(self):
+        rng = np.random.default_rng(0)
+        for row, col in rng.integers(0, (3, 4), (5, 2)):
+            self.field.remove(row, col)
+        for _ in range(150):
+            start, end = rng.uniform(-20, 120, 2), rng.uniform(-20, 120, 2)
+            if self.field.overlap(*start, 3):
+                continue
+            hit = self.field.sweep(start, end, radius=3)
+            samples = (start + (end - start) * t for t in np.linspace(0, 1, 3000))
+            first = next(filter(None, (self.field.overlap(*p, 3) for p in samples)), None)
+            if first is None:
+                assert hit is None or hypot(*(np.array(hit.position) - start)) >= hypot(*(end - start)) - 0.1
+            else:
+                assert hit is not None and self.field.overlap(*hit.position, 3) is None
+                assert (hit.row, hit.col) == first[:2]
+
+    def test_removed_bricks_and_gaps_are_free(self):
+        self.field.remove(2, 1)
+        hit = self.field.sweep((38, 40), (38, 10), radius=3)
+        assert (hit.row, hit.col) == (1, 1)
+        # Entre os tijolos há 1 pixel: uma bola de raio 0.4 passa
+        assert self.field.sweep((25.5, 40), (25.5, -10), radius=0.4) is None
+
+    def test_reflect(self):
+        assert reflect((3, -4), (0, 1)) == (3, 4)
+        assert reflect((3, 4), (0, 1)) == (3, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+import headless
+
+pyxel = headless.install()
+
+
+class TestHeadless(unittest.TestCase):
+    def tearDown(self):
+        headless.install()
+
+    def test_run_stops_after_frames(self):
+        headless.install(frames=5)
+        calls = []
+        pyxel.init(32, 32)
+        pyxel.run(lambda: calls.append("update"), lambda: calls.append("draw"))
+        assert pyxel.frame_count == 5 and len(calls) == 10
+
+    def test_unsupported_submodule(self):
+        with self.assertRaises(ImportError) as ctx:
+            from pyxel.ui.widget import Widget  # noqa: F401
+        assert ctx.exception.name == "pyxel.ui"
+        assert "col-lab.py" in str(ctx.exception)
+
+
+if __name__ == "__main__":
+    unittest.main()
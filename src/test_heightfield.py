@@ -0,0 +1,38 @@
+import unittest
+import numpy as np
+from heightfield import Heightfield
+
+
+class TestHeightfield(unittest.TestCase):
+    def setUp(self):
+        self.floor = Heightfield(0, 10, [0, 10, 0, 5])
+
+    def test_height_and_normal(self):
+        assert list(self.floor.height([-5, 5, 15, 25, 40])) == [0, 5, 5, 2.5, 5]
+        nx, ny = self.floor.normal(5)
+        assert abs(nx + ny) < 1e-12 and abs(nx * nx + ny * ny - 1) < 1e-12
+        assert self.floor.altitude(5, 12) == 7
+
+    def test_raycast(self):
+        t, point = self.floor.raycast((5, 100), (0, -1))
+        assert t == 95 and point == (5, 5)
+        t, point = self.floor.raycast((50, 10), (-1, -0.1))
+        assert abs(point[1] - self.floor.height(point[0])) < 1e-9
+        assert self.floor.raycast((-20, 20), (1, 0)) is None
+        assert self.floor.raycast((5, 100), (0, -1), max_distance=50) is None
+
+    def test_raycast_matches_marching(self):
+        floor = Heightfield.random_walk(-500, 2, 500, y0=0, dy=3, seed=0)
+        rng = np.random.default_rng(1)
+        for _ in range(50):
+            origin = (rng.uniform(-500, 500), 100)
+            direction = (rng.uniform(-1, 1), -1)
+            t, (x, y) = floor.raycast(origin, direction)
+            ts = np.linspace(0, t, 1000)[:-1]
+            xs, ys = origin[0] + ts * direction[0], origin[1] + ts * direction[1]
+            assert (ys > floor.height(xs) - 1e-9).all()
+            assert abs(y - floor.height(x)) < 1e-6
+
+    def test_segments_cover_range(self):
+        segments = list(self.floor.segments(*self.floor.index_range(12, 28)))
+        assert segments == [((10, 10), (20, 0)), ((20, 0), (30, 5))]
@@ -0,0 +1,26 @@
+import unittest
+import numpy as np
+import lander_env
+from lander_env import LanderEnv
+
+
+class TestLanderEnv(unittest.TestCase):
+    def test_deterministic_per_seed(self):
+        a, b = LanderEnv(20), LanderEnv(50)
+        assert np.array_equal(a.reset(3), b.reset(3)[:20])
+        assert np.array_equal(a.heights, b.heights[:20])
+        assert not np.array_equal(a.reset(4), b.reset(3)[:20])
+
+    def test_free_fall_crashes(self):
+        env = LanderEnv(100)
+        env.reset(0)
+        total = np.zeros(100)
+        while not env.done.all():
+            _, reward, _ = env.step(np.zeros((100, 2)))
+            total += reward
+        assert not env.victory.any()
+        assert (total == -100).all()
+
+    def test_autopilot_lands(self):
+        victory = lander_env.evaluate(lander_env.autopilot, 200, seed=1, batch=64, workers=1)
+        assert victory.shape == (200,) and victory.mean() > 0.8
@@ -0,0 +1,182 @@
+import unittest
+from itertools import combinations
+import numpy as np
+import headless
+
+headless.install()
+from benchmark import load_script
+
+motor = load_script("motor-simples.py")
+
+
+class TestSpatialHash(unittest.TestCase):
+    def brute_force(self, balls, cell_size):
+        return {
+            frozenset((id(a), id(b)))
+            for a, b in combinations(balls, 2)
+            if (a.x - b.x) ** 2 + (a.y - b.y) ** 2 <= cell_size**2
+        }
+
+    def candidates(self, grid):
+        pairs = [frozenset((id(a), id(b))) for a, b in grid.pairs()]
+        assert len(pairs) == len(set(pairs)), "par repetido"
+        return set(pairs)
+
+    def test_pairs_cover_brute_force(self):
+        # Bolas sobre as bordas e cantos das células, e várias no mesmo ponto
+        coords = [(0, 0), (9.99, 0), (10, 0), (10, 0), (10, 0), (-0.01, -0.01)]
+        coords += [(5, 9.99), (5, 10), (19.5, 10.5)]
+        coords += [(x + 0.5 * k, y) for k, (x, y) in enumerate(coords)]
+        balls = [motor.Ball(x, y, radius=5) for x, y in coords]
+        grid = motor.SpatialHash(10)
+        for ball in balls:
+            grid.insert(ball)
+
+        pairs = self.candidates(grid)
+        assert self.brute_force(balls, 10) <= pairs
+        assert frozenset((id(balls[2]), id(balls[3]))) in pairs
+
+    def test_move_keeps_pairs(self):
+        balls = [motor.Ball(4 * k, 3 * k, radius=5) for k in range(20)]
+        grid = motor.SpatialHash(10)
+        for ball in balls:
+            grid.insert(ball)
+        for k, ball in enumerate(balls):
+            ball.x, ball.y = ball.y + 0.5, (7 * k) % 25
+            grid.move(ball)
+        assert self.brute_force(balls, 10) <= self.candidates(grid)
+
+
+class TestImpulseKernel(unittest.TestCase):
+    def scalar(self, x, y, vx, vy, mass, order, restitution):
+        space = motor.Space()
+        space.restitution = restitution
+        balls = [motor.Ball(*args) for args in zip(x, y, vx, vy, [5] * len(x), mass)]
+        for a, b in order:
+            space.resolve_collision_pair(balls[a], balls[b])
+        return np.array([b.vx for b in balls]), np.array([b.vy for b in balls])
+
+    def random_state(self, n, seed):
+        rng = np.random.default_rng(seed)
+        x, y = rng.uniform(0, 20, (2, n))
+        vx, vy = rng.uniform(-10, 10, (2, n))
+        return x, y, vx, vy, rng.uniform(0.5, 3, n)
+
+    def test_isolated_pairs_match_scalar(self):
+        x, y, vx, vy, mass = self.random_state(8, seed=1)
+        i, j = np.arange(0, 8, 2), np.arange(1, 8, 2)
+        for e in [1.0, 0.5, 0.0]:
+            ux, uy = vx.copy(), vy.copy()
+            motor.resolve_collision_pairs(x, y, ux, uy, mass, i, j, restitution=e)
+            sx, sy = self.scalar(x, y, vx, vy, mass, zip(i, j), e)
+            np.testing.assert_allclose(ux, sx)
+            np.testing.assert_allclose(uy, sy)
+
+    def test_shared_balls_match_scalar_in_batch_order(self):
+        x, y, vx, vy, mass = self.random_state(6, seed=2)
+        i, j = np.array([0, 1, 2, 0, 3, 1, 4]), np.array([1, 2, 3, 2, 4, 5, 5])
+        batches = motor.independent_batches(i, j, 6)
+        for k in batches:
+            balls = np.concatenate([i[k], j[k]])
+            assert len(set(balls)) == len(balls)
+
+        ux, uy = vx.copy(), vy.copy()
+        motor.resolve_collision_pairs(x, y, ux, uy, mass, i, j, restitution=0.8, sweeps=1)
+        order = [(i[m], j[m]) for k in batches for m in k]
+        sx, sy = self.scalar(x, y, vx, vy, mass, order, 0.8)
+        np.testing.assert_allclose(ux, sx)
+        np.testing.assert_allclose(uy, sy)
+
+    def test_row_conserves_momentum_and_energy(self):
+        n = 5
+        x, y = np.arange(n) * 10.0, np.zeros(n)
+        vx, vy = np.zeros(n), np.zeros(n)
+        vx[0] = 10
+        mass = np.ones(n)
+        i, j = np.arange(n - 1), np.arange(1, n)
+        motor.resolve_collision_pairs(x, y, vx, vy, mass, i, j, sweeps=n)
+        assert np.isclose(vx.sum(), 10) and np.isclose((vx**2).sum(), 100)
+        assert np.all(vx[j] - vx[i] >= -1e-12)
+
+
+class TestArraySpace(unittest.TestCase):
+    def balls(self):
+        # Um par em rota de colisão, uma bola indo contra a parede e bolas
+        # isoladas, longe o bastante para não formar cadeias de contatos
+        return [
+            motor.Ball(60, 100, vx=30, vy=5, mass=2),
+            motor.Ball(80, 100, vx=-20),
+            motor.Ball(8, 40, vx=-40, vy=-3),
+            motor.Ball(150, 30, vx=10, vy=20, radius=7),
+            motor.Ball(200, 150, vx=-5, vy=-15, mass=0.5),
+        ]
+
+    def test_matches_object_space(self):
+        space, array = motor.Space(), motor.ArraySpace()
+        for ball in self.balls():
+            space.add(ball)
+        for ball in self.balls():
+            array.add(ball)
+        for _ in range(30):
+            space.update(1 / 30)
+            array.update(1 / 30)
+        for attr in ["x", "y", "vx", "vy"]:
+            expected = [getattr(b, attr) for b in space.objects]
+            np.testing.assert_allclose(getattr(array, attr)[: array.size], expected)
+        assert array.objects[0].vx < 0 < array.objects[1].vx
+
+    def test_walls_reflect(self):
+        array = motor.ArraySpace(width=100, height=80)
+        for x, y, vx, vy in [(3, 40, -10, 0), (97, 40, 10, 0), (50, 3, 0, -10), (20, 77, 0, 10)]:
+            ball = motor.Ball(x, y, vx=vx, vy=vy)
+            ball.fy = 0
+            array.add(ball)
+        array.update(1 / 30)
+        assert list(array.vx[:4]) == [10, -10, 0, 0]
+        assert list(array.vy[:4]) == [0, 0, 10, -10]
+
+    def test_add_grows_capacity(self):
+        array = motor.ArraySpace(capacity=2)
+        views = [array.add(motor.Ball(10 * k, 5, vx=k, radius=1 + k)) for k in range(5)]
+        assert array.size == 5 and len(array.x) >= 5
+        assert all(len(getattr(array, name)) == len(array.x) for name in array.FIELDS)
+        assert [v.index for v in views] == list(range(5))
+        assert list(array.x[:5]) == [0, 10, 20, 30, 40]
+        assert list(array.radius[:5]) == [1, 2, 3, 4, 5]
+        assert [v.vx for v in views] == [0, 1, 2, 3, 4]
+
+    def test_ball_view_reads_and_writes_its_row(self):
+        array = motor.ArraySpace()
+        a = array.add(motor.Ball(10, 20, vx=1, vy=2, radius=3, mass=4))
+        b = array.add(motor.Ball(15, 20))
+        assert (a.x, a.y, a.vx, a.vy, a.radius, a.mass) == (10, 20, 1, 2, 3, 4)
+        a.x, a.vy = 50, -7
+        assert array.x[0] == 50 and array.vy[0] == -7 and array.x[1] == 15
+        array.vx[1] = 9
+        assert b.vx == 9 and a.vx == 1
+        assert not a.collides_with(b)
+        a.x = 16
+        assert a.collides_with(b)
+
+
+class TestEventSpace(unittest.TestCase):
+    def test_two_ball_collision_time(self):
+        # Folga de 40 entre as superfícies e velocidade relativa de 30: a
+        # colisão acontece em t = 4/3, também sob a mesma gravidade
+        space = motor.EventSpace()
+        a = motor.Ball(50, 50, vx=20, radius=5)
+        b = motor.Ball(100, 50, vx=-10, radius=5)
+        space.add(a)
+        space.add(b)
+        assert np.isclose(space.collision_time(0, 1), 4 / 3)
+
+        space.update(4 / 3 - 1e-3)
+        assert (a.vx, b.vx) == (20, -10)
+        space.update(2e-3)
+        assert np.isclose(a.vx, -10) and np.isclose(b.vx, 20)
+        assert np.isclose(b.x - a.x, 10 + 30 * 1e-3)
+        assert np.isclose(a.y, b.y)
+
+
+if __name__ == "__main__":
+    unittest.main()
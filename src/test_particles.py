@@ -0,0 +1,36 @@
+import unittest
+from particles import ParticlePool
+
+
+class TestParticlePool(unittest.TestCase):
+    def test_capacity_is_fixed(self):
+        pool = ParticlePool(capacity=10)
+        for _ in range(20):
+            pool.emit((0, 0), (1, 0), 5)
+        assert len(pool) == 10
+
+    def test_dead_particles_are_recycled(self):
+        pool = ParticlePool(capacity=100, seed=0)
+        for k in range(100):
+            pool.emit((k, 0), (0, 0), 1 + k % 3)
+        pool.update(1 / 30)
+        assert len(pool) == 66
+        assert (pool.age[: len(pool)] > 0).all()
+        survivors = sorted(pool.x[: len(pool)].round().astype(int))
+        assert survivors == [k for k in range(100) if k % 3]
+
+    def test_particles_stay_above_ground(self):
+        pool = ParticlePool(capacity=200, seed=1)
+        for k in range(200):
+            pool.emit((k, 10), (0, -300), 50)
+        ground = lambda x: 0.05 * x
+        for _ in range(20):
+            pool.update(1 / 30, gravity=(0, -100), ground=ground, sub_steps=4)
+            n = len(pool)
+            assert (pool.y[:n] >= ground(pool.x[:n]) - 1e-9).all()
+
+    def test_colors_by_age(self):
+        pool = ParticlePool(capacity=3)
+        for age in [100, 70, 10]:
+            pool.emit((0, 0), (0, 0), age)
+        assert list(pool.colors()) == [7, 8, 13]
@@ -0,0 +1,100 @@
+import json
+import time
+import tempfile
+import unittest
+from pathlib import Path
+from profiler import FrameProfiler
+
+
+class FakeSpace:
+    """
+    Espaço com a mesma interface de decoradores do easymunk.
+    """
+
+    def __init__(self):
+        self.callbacks = []
+
+    def step(self, dt):
+        for fn in self.callbacks:
+            fn(self, dt)
+
+    def before_step(self):
+        def decorator(fn):
+            self.callbacks.append(fn)
+            return fn
+
+        return decorator
+
+    begin_collision = before_step
+
+
+class TestFrameProfiler(unittest.TestCase):
+    def test_wrap_measures_only_when_enabled(self):
+        profiler = FrameProfiler()
+        fn = profiler.wrap("update", lambda x: time.sleep(0.001) or 2 * x)
+        assert fn(3) == 6 and not profiler.current
+
+        profiler.overlay = True
+        assert fn(3) == 6
+        assert profiler.current["update"] >= 1_000_000
+
+    def test_timed_decorator(self):
+        profiler = FrameProfiler(overlay=True)
+
+        @profiler.timed("draw")
+        def draw():
+            """desenha"""
+
+        draw()
+        draw()
+        assert draw.__doc__ == "desenha" and "draw" in profiler.current
+
+    def test_end_frame_history_and_trace(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "frames.jsonl"
+            profiler = FrameProfiler(trace=path)
+            profiler.current["update"] = 2_000_000
+            profiler.end_frame()
+            profiler.end_frame()
+            profiler.current["draw"] = 500_000
+            profiler.end_frame()
+            profiler.close()
+
+            lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert lines == [{"frame": 0, "update": 2.0}, {"frame": 2, "draw": 0.5}]
+        assert list(profiler.history["update"]) == [2.0] and not profiler.current
+        assert profiler.frame == 3
+
+    def test_stats_mean_and_p99(self):
+        profiler = FrameProfiler(overlay=True)
+        for ms in range(1, 101):
+            profiler.current["step"] = ms * 1_000_000
+            profiler.end_frame()
+        mean, p99 = profiler.stats()["step"]
+        assert mean == 50.5 and p99 == 100
+
+    def test_instrument_space_class(self):
+        profiler = FrameProfiler(overlay=True)
+        cls = type("Space", (FakeSpace,), {})
+        profiler.instrument_space_class(cls)
+
+        space = cls()
+        calls = []
+
+        @space.before_step()
+        def _(space, dt):
+            calls.append(dt)
+
+        @space.begin_collision()
+        def _(space, dt):
+            time.sleep(0.001)
+
+        space.step(0.5)
+        assert calls == [0.5]
+        assert {"step", "before_step", "collision"} <= set(profiler.current)
+        assert profiler.current["collision"] >= 1_000_000
+        assert profiler.current["step"] >= profiler.current["collision"]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+import numpy as np
+import sir_ensemble
+
+
+class TestEnsembleStats(unittest.TestCase):
+    def test_mean(self):
+        stats = sir_ensemble.EnsembleStats(samples=2, n=10)
+        stats.add(np.array([[9, 1, 0, 0], [5, 3, 2, 0]]))
+        stats.add(np.array([[9, 1, 0, 0], [7, 1, 2, 0]]))
+        assert stats.runs == 2
+        assert np.array_equal(stats.mean(), [[9, 1, 0, 0], [6, 2, 2, 0]])
+
+    def test_exact_quantiles_with_one_bin_per_value(self):
+        stats = sir_ensemble.EnsembleStats(samples=1, n=10, bins=200)
+        assert stats.bins == 11
+        for i in range(1, 6):
+            stats.add(np.array([[10 - i, i, 0, 0]]))
+        q = stats.quantiles((0.0, 0.5, 1.0))
+        assert np.array_equal(q[:, 0, 1], [1, 3, 5])
+        assert np.array_equal(q[:, 0, 0], [5, 7, 9])
+        assert (q[:, 0, 2:] == 0).all()
+
+    def test_quantiles_are_bin_lower_edges(self):
+        stats = sir_ensemble.EnsembleStats(samples=1, n=999, bins=100)
+        for value in [0, 0, 5, 25, 999]:
+            stats.add(np.array([[value, 0, 0, value]]))
+        q = stats.quantiles((0.2, 0.5, 0.7, 1.0))
+        assert np.array_equal(q[:, 0, 0], [0, 0, 20, 990])
+        assert (q[:, 0, 1] == 0).all()
+        assert (q[:, 0, 0] <= [0, 0, 25, 999]).all()
+
+
+class TestSimulate(unittest.TestCase):
+    def test_series_padded_after_extinction(self):
+        # Sem infecções, o paciente zero se recupera no quadro 150
+        params = {"n": 100, "prob_infection": 0.0}
+        series = sir_ensemble.simulate(params, seed=0, frames=400, every=16)
+        assert series.shape == (26, 4)
+        assert (series[:9] == [99, 1, 0, 0]).all()
+        extinct = series[:, 1] == 0
+        assert extinct[10:].all()
+        assert (series[extinct] == series[-1]).all()
+        assert series[-1, 0] == 99 and series[-1, 2] + series[-1, 3] == 1
+
+
+if __name__ == "__main__":
+    unittest.main()
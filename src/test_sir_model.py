@@ -0,0 +1,85 @@
+import unittest
+import headless
+
+headless.install()
+from benchmark import load_script
+
+try:
+    import easymunk  # noqa: F401
+except ImportError:  # sir-model.py depende do easymunk
+    sir_model = None
+else:
+    sir_model = load_script("sir-model.py")
+
+
+@unittest.skipIf(sir_model is None, "easymunk não está instalado")
+class TestSIRModel(unittest.TestCase):
+    def setUp(self):
+        headless.install()
+
+    def test_run_headless(self):
+        game = sir_model.Game(200, seed=0)
+        lines = []
+        game.run_headless(log=lines.append)
+        stats = game.stats
+        assert stats.I == 0 and stats.S + stats.R + stats.D == 200
+        assert len(game.history) == game.clock.step and len(lines) == 2
+
+    def test_exact_recovery_step(self):
+        # Como no modelo original, um agente infectado durante o passo k se
+        # recupera no passo k + INFECTIOUS_PERIOD - 1; o paciente zero conta
+        # a partir do primeiro passo
+        period = sir_model.INFECTIOUS_PERIOD
+        prob, sir_model.PROB_INFECTION = sir_model.PROB_INFECTION, 0.0
+        try:
+            game = sir_model.Game(50, seed=1)
+            for _ in range(10):
+                game.step()
+            game.rng.random = lambda: -1.0
+            game.infect(game.circles[0].shape)
+            del game.rng.random
+            states = []
+            for _ in range(period + 20):
+                game.step()
+                states.append((game.state[-1], game.state[0]))
+        finally:
+            sir_model.PROB_INFECTION = prob
+        zero, other = zip(*states)
+        assert zero[period - 12] == sir_model.I and zero[period - 11] != sir_model.I
+        assert other[period - 2] == sir_model.I and other[period - 1] != sir_model.I
+
+        infected = game.history["I"]
+        assert (infected[: period - 1] >= 1).all() and infected[period - 1] == 1
+        assert (infected[period + 9 :] == 0).all()
+
+    def test_fast_forward_budget(self):
+        game = sir_model.Game(50, seed=2)
+        assert game.advance(1.0) == 1
+        game.clock.fast = True
+        assert game.advance(0.0) == 1
+        steps = game.advance(0.05)
+        assert steps > 1 and game.clock.steps_per_frame == steps
+        assert game.clock.step == steps + 2
+
+    def test_draw_uses_positions_of_last_step(self):
+        game = sir_model.Game(300, seed=3)
+        game.step()
+        expected = [tuple(c.position) for c in game.circles]
+        assert [tuple(p) for p in game.xy] == expected
+
+        drawn = []
+        game.layer.draw_camera = lambda x, y, colors, camera: drawn.append((x, y, colors))
+        game.camera.offset = (0, 0)
+        game.draw()
+        x, y, colors = drawn[0]
+        inside = [(px, py) for px, py in expected if 0 <= px < 256 and 0 <= py < 256]
+        assert 0 < len(x) == len(inside) < game.n
+        assert sorted(zip(x, y)) == sorted(inside)
+        assert colors[-1] == game.color_table[sir_model.I]
+
+    def test_main_headless(self):
+        sir_model.main(["--headless", "-n", "30"])
+
+
+if __name__ == "__main__":
+    unittest.main()
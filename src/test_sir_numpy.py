@@ -0,0 +1,31 @@
+import unittest
+import numpy as np
+import sir_numpy
+
+
+class TestSIRModel(unittest.TestCase):
+    def test_population_is_conserved(self):
+        model = sir_numpy.SIRModel(2000, seed=1)
+        history = model.run(300)
+        assert (history.sum(axis=1) == 2000).all()
+        assert (np.diff(history[:, 0]) <= 0).all()
+        assert model.counts() == tuple(int((model.state == k).sum()) for k in range(1, 5))
+
+    def test_same_seed_same_series(self):
+        a = sir_numpy.SIRModel(1000, seed=3).run(200)
+        b = sir_numpy.SIRModel(1000, seed=3).run(200)
+        assert np.array_equal(a, b)
+
+    def test_agents_stay_in_box(self):
+        model = sir_numpy.SIRModel(500, speed=200, seed=0)
+        for _ in range(100):
+            model.step()
+        half = model.size / 2
+        assert np.abs(model.x).max() <= half and np.abs(model.y).max() <= half
+
+    def test_patient_zero_inside_small_box(self):
+        model = sir_numpy.SIRModel(100, prob_infection=1.0, seed=0)
+        half = model.size / 2
+        assert abs(model.x[-1]) <= half and abs(model.y[-1]) <= half
+        history = model.run(model.infectious_period)
+        assert history[-1, 0] < 99
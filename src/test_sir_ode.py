@@ -0,0 +1,26 @@
+import unittest
+import numpy as np
+import sir_ode
+
+
+class TestSIRODE(unittest.TestCase):
+    def test_population_is_conserved(self):
+        traj = sir_ode.solve(0.05, 0.01, 0.02, frames=1000)
+        assert np.allclose(traj.sum(axis=1), 1)
+        assert (np.diff(traj[:, 0]) <= 0).all()
+
+    def test_vectorized_matches_single_runs(self):
+        betas = np.array([0.02, 0.05, 0.1])
+        gammas = np.array([0.005, 0.01])
+        grid = sir_ode.solve(betas[:, None], gammas[None, :], frames=300, every=10)
+        assert grid.shape == (31, 4, 3, 2)
+        single = sir_ode.solve(0.05, 0.005, frames=300, every=10)
+        assert np.allclose(grid[:, :, 1, 0], single)
+
+    def test_fit_recovers_parameters(self):
+        traj = sir_ode.solve(0.05, 0.01, 0.02, frames=1500)
+        series = np.round(traj * 10000).astype(int)
+        result = sir_ode.fit(series, grid=20)
+        assert abs(result.beta / 0.05 - 1) < 0.01
+        assert abs(result.gamma / 0.01 - 1) < 0.01
+        assert abs(result.r0 - 5) < 0.1
@@ -0,0 +1,36 @@
+import unittest
+from sir_schedule import TimerWheel
+
+PERIOD = 150
+
+
+class TestTimerWheel(unittest.TestCase):
+    def test_pop_returns_items_in_order_once(self):
+        wheel = TimerWheel()
+        wheel.schedule(3, "a")
+        wheel.schedule(3, "b")
+        wheel.schedule(5, "c")
+        assert len(wheel) == 3
+        assert wheel.pop(3) == ["a", "b"] and wheel.pop(3) == []
+        assert wheel.pop(4) == [] and len(wheel) == 1
+
+    def test_recovery_exactly_one_period_after_infection(self):
+        # Mesma sequência de sir-model.step(): agenda ao infectar e retira o
+        # compartimento do passo atual
+        wheel = TimerWheel()
+        infected_at = {}
+        recovered_at = {}
+        for step in range(1000):
+            if step % 7 == 0 and step < 600:
+                agent = len(infected_at)
+                infected_at[agent] = step
+                wheel.schedule(step + PERIOD, agent)
+            for agent in wheel.pop(step):
+                recovered_at[agent] = step
+
+        assert recovered_at.keys() == infected_at.keys() and len(wheel) == 0
+        assert all(recovered_at[a] - infected_at[a] == PERIOD for a in infected_at)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+import tempfile
+from pathlib import Path
+import numpy as np
+from sir_stats import StatsBuffer, replay
+
+
+class TestStatsBuffer(unittest.TestCase):
+    def make_buffer(self, n=1000):
+        buffer = StatsBuffer(capacity=8)
+        for k in range(n):
+            buffer.append(k, n - k, k % 5, k, k // 100)
+        return buffer
+
+    def test_grows_and_keeps_columns(self):
+        buffer = self.make_buffer()
+        assert len(buffer) == 1000
+        assert buffer["S"][0] == 1000 and buffer["D"][-1] == 9
+        assert buffer.data.dtype == np.int32
+
+    def test_downsample(self):
+        frames, data = self.make_buffer().downsample(256)
+        assert frames.shape == (256,) and data.shape == (4, 256)
+        assert frames[0] == 0 and frames[-1] == 999
+
+    def test_save_and_load(self):
+        buffer = self.make_buffer()
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ["stats.npz", "stats.csv"]:
+                path = Path(tmp) / name
+                buffer.save(path, chunk=300)
+                loaded = StatsBuffer.load(path)
+                assert np.array_equal(loaded.frame, buffer.frame)
+                for col in "SIRD":
+                    assert np.array_equal(loaded[col], buffer[col])
+
+    def test_empty_buffer(self):
+        buffer = StatsBuffer()
+        assert buffer.summary() == "nenhuma amostra"
+        with self.assertRaises(ValueError):
+            replay(buffer)
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ["empty.npz", "empty.csv"]:
+                path = Path(tmp) / name
+                buffer.save(path)
+                assert len(StatsBuffer.load(path)) == 0
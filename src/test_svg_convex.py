@@ -0,0 +1,48 @@
+import math
+import tempfile
+import unittest
+from pathlib import Path
+from svg_convex import convex_decompose, orient, signed_area, cross
+
+
+def assert_convex_ccw(piece):
+    n = len(piece)
+    assert all(cross(piece[k - 1], piece[k], piece[(k + 1) % n]) > 0 for k in range(n))
+
+
+class TestConvexDecompose(unittest.TestCase):
+    def test_l_shape_in_two_pieces(self):
+        shape = [(0, 0), (20, 0), (20, 10), (10, 10), (10, 20), (0, 20)]
+        for points in [shape, shape[::-1]]:
+            pieces = convex_decompose(points)
+            assert len(pieces) == 2
+            for piece in pieces:
+                assert_convex_ccw(piece)
+
+    def test_pieces_cover_star(self):
+        star = [(math.cos(k * math.pi / 8) * (10 if k % 2 else 4), math.sin(k * math.pi / 8) * (10 if k % 2 else 4)) for k in range(16)]
+        pieces = convex_decompose(star)
+        assert len(pieces) < 14
+        assert abs(sum(signed_area(p) for p in pieces) - abs(signed_area(star))) < 1e-9
+        for piece in pieces:
+            assert_convex_ccw(piece)
+
+    def test_convex_polygon_is_kept(self):
+        square = [(0, 0), (0, 1), (1, 1), (1, 0)]
+        pieces = convex_decompose(square)
+        assert len(pieces) == 1 and set(pieces[0]) == set(square)
+        assert_convex_ccw(pieces[0])
+
+    def test_rejects_self_intersection(self):
+        with self.assertRaises(ValueError):
+            orient([(0, 0), (10, 0), (10, 10), (5, -5), (0, 10)])
+
+    def test_disk_cache(self):
+        from svg_convex import convex_pieces
+
+        src = "M0 0 A10 10 0 1 1 20 0 L 10 -5 z"
+        with tempfile.TemporaryDirectory() as tmp:
+            first = convex_pieces(src, cache_dir=tmp)
+            second = convex_pieces(src, cache_dir=tmp)
+            assert first == second
+            assert len(list(Path(tmp).glob("*.json"))) == 1
@@ -0,0 +1,49 @@
+import math
+import unittest
+import svg_path
+
+try:
+    import easymunk
+except ImportError:
+    easymunk = None
+
+
+class TestSVGPath(unittest.TestCase):
+    def test_lines(self):
+        path = svg_path.parse_path("m 64,100 l 20,26 43,2 h-5 V 10 z")
+        assert path == [(64, 100), (84, 126), (127, 128), (122, 128), (122, 10)]
+
+    def test_curves_end_at_their_endpoints(self):
+        assert svg_path.parse_path("M0 0C0 10 10 10 10 0S20-10 20 0")[-1] == (20, 0)
+        assert svg_path.parse_path("M0 0q5 10 10 0t10 0")[-1] == (20, 0)
+
+    def test_arc_points_lie_on_circle(self):
+        path = svg_path.parse_path("M10 0A10 10 0 1 1-10 0a10 10 0 0120 0", tolerance=0.01)
+        assert len(path) > 50
+        assert max(abs(math.hypot(x, y) - 10) for x, y in path) < 1e-9
+
+    def test_tolerance_controls_subdivision(self):
+        src = "M0 0C0 100 100 100 100 0"
+        coarse = svg_path.parse_path(src, tolerance=1)
+        fine = svg_path.parse_path(src, tolerance=0.01)
+        assert len(fine) > 4 * len(coarse)
+
+    @unittest.skipIf(easymunk is None, "easymunk não está instalado")
+    def test_memoized(self):
+        src = "M0 0C0 50 50 50 50 0"
+        a, b = svg_path.mk_path(src), svg_path.mk_path(src)
+        assert a == b and a is not b
+        assert svg_path._mk_path.cache_info().hits >= 1
+
+    def test_simplify_merges_collinear(self):
+        square = [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2), (0, 2), (0, 1)]
+        assert svg_path.simplify_path(square, 0, closed=True) == [(0, 0), (2, 0), (2, 2), (0, 2)]
+
+    def test_simplify_respects_tolerance(self):
+        line = [(0, 0), (1, 0.1), (2, 0), (3, 0.5), (4, 0)]
+        assert svg_path.simplify_path(line, 0.2) == [(0, 0), (2, 0), (3, 0.5), (4, 0)]
+        assert svg_path.simplify_path(line, 1) == [(0, 0), (4, 0)]
+
+    def test_invalid_command(self):
+        with self.assertRaises(ValueError):
+            svg_path.parse_path("M0 0 X 1 1")
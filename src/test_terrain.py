@@ -0,0 +1,34 @@
+import unittest
+from terrain import Terrain, ChunkStreamer
+
+
+class TestTerrain(unittest.TestCase):
+    def test_chunks_are_deterministic(self):
+        a, b = Terrain(seed=7), Terrain(seed=7)
+        for index in [-3, 0, 5, 1000]:
+            assert a.chunk(index) == b.chunk(index)
+        assert a.chunk(0) != Terrain(seed=8).chunk(0)
+
+    def test_neighbor_chunks_connect(self):
+        terrain = Terrain(seed=1)
+        for index in range(-2, 3):
+            ground, _ = terrain.chunk(index)
+            following, _ = terrain.chunk(index + 1)
+            assert ground[-1] == following[0]
+            assert ground[0][0] == index * terrain.chunk_width
+
+    def test_streamer_keeps_bounded_window(self):
+        terrain = Terrain(seed=3)
+        built, destroyed = [], []
+        streamer = ChunkStreamer(terrain, lambda k: (built.append(k), terrain.chunk(k))[1], destroyed.append)
+        first = None
+        for x in range(0, 50_000, 100):
+            streamer.update(x)
+            assert len(streamer.live) <= streamer.ahead + streamer.behind + 1
+            if first is None:
+                first = streamer.live[0]
+        assert len(built) - len(destroyed) == len(streamer.live)
+
+        # Voltar ao começo gera o mesmo terreno
+        streamer.update(0)
+        assert streamer.live[0] == first
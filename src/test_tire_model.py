@@ -0,0 +1,41 @@
+import unittest
+from math import copysign, cos, sin
+import numpy as np
+from tire_model import TireModel, lateral_forces
+
+
+class Wheel:
+    def __init__(self, angle, velocity):
+        self.rotation_vector = (cos(angle), sin(angle))
+        self.velocity = velocity
+        self.forces = []
+
+    def apply_force_at_local_point(self, force):
+        self.forces.append(force)
+
+
+def reference(wheel, mass, mu=0.5, delta_vt=50, dt=1 / 30):
+    # Cálculo por roda de veiculos-topdown.py
+    (ux, uy), (vx, vy) = wheel.rotation_vector, wheel.velocity
+    vt = ux * vy - uy * vx
+    return copysign(mass * min(mu * 300, 0.25 * min(abs(vt), delta_vt) / dt), -vt)
+
+
+class TestTireModel(unittest.TestCase):
+    def test_matches_scalar_model(self):
+        rng = np.random.default_rng(0)
+        wheels = [Wheel(a, tuple(v)) for a, v in zip(rng.uniform(0, 6, 40), rng.normal(0, 80, (40, 2)))]
+        tires = TireModel()
+        for k in range(10):
+            tires.add_vehicle(wheels[4 * k : 4 * k + 4], mass=1 + k, driven=[2, 3])
+
+        throttle = np.arange(10) * 100.0
+        tires.step(throttle)
+        for i, w in enumerate(wheels):
+            (fx, fy), = w.forces
+            assert abs(fy - reference(w, 1 + i // 4)) < 1e-9
+            assert fx == (throttle[i // 4] if i % 4 >= 2 else 0)
+
+    def test_lateral_force_saturates(self):
+        force = lateral_forces(np.ones(3), np.zeros(3), np.zeros(3), np.array([-1e3, 0, 1e3]), np.ones(3))
+        assert list(force) == [150, 0, -150]
@@ -0,0 +1,90 @@
+import unittest
+from math import atan2, cos, degrees, hypot, sin
+from types import SimpleNamespace
+import numpy as np
+from wing_model import DEFAULT_COEFFS, RHO, ClCd, Wing, apply_wings
+
+
+class Body:
+    """
+    Corpo rígido mínimo com a interface usada por apply_wings.
+    """
+
+    def __init__(self, angle, velocity, omega=0.0, mass=10.0):
+        self.angle = angle
+        self.velocity = velocity
+        self.omega = omega
+        self.mass = mass
+        self.space = SimpleNamespace(gravity=(0, -200))
+        self.forces = []
+
+    @property
+    def rotation_vector(self):
+        return cos(self.angle), sin(self.angle)
+
+    def velocity_at_local_point(self, point):
+        c, s = self.rotation_vector
+        x, y = point
+        rx, ry = c * x - s * y, s * x + c * y
+        vx, vy = self.velocity
+        return vx - self.omega * ry, vy + self.omega * rx
+
+    def apply_force_at_local_point(self, force, point):
+        self.forces.append((force, point))
+
+
+def reference(wing, rho=RHO):
+    # Uma asa de cada vez, com a consulta escalar da tabela
+    c, s = wing.body.rotation_vector
+    wx, wy = wing.body.velocity_at_local_point(wing.offset)
+    vx, vy = c * wx + s * wy, -s * wx + c * wy
+    alpha = wing.AoA - degrees(atan2(vy, vx))
+    Cl, Cd = wing.coeffs.Cl(alpha), wing.coeffs.Cd(alpha)
+    q = 0.5 * rho * hypot(vx, vy) * wing.area
+    return q * (-Cl * vy - Cd * vx), q * (Cl * vx - Cd * vy)
+
+
+class TestWings(unittest.TestCase):
+    def test_batch_matches_scalar_lookup(self):
+        rng = np.random.default_rng(0)
+        custom = ClCd(Cl_0=0.2, stall_angle=12, LD_max=15, Cl_max=1.4)
+        flat = ClCd(Cl_max=0.5)
+        wings = []
+        for k in range(30):
+            body = Body(rng.uniform(-3, 3), tuple(rng.normal(0, 50, 2)), rng.normal(0, 1))
+            coeffs = [None, custom, flat][k % 3]
+            offset = tuple(rng.uniform(-20, 20, 2))
+            wings.append(Wing(body, offset, AoA=rng.uniform(-10, 10), coeffs=coeffs, area=rng.uniform(0.1, 2)))
+
+        apply_wings(wings)
+        for w in wings:
+            (force, point), = w.body.forces
+            assert point == w.offset
+            np.testing.assert_allclose(force, reference(w), rtol=1e-9, atol=1e-9)
+
+    def test_default_coefficients_are_shared(self):
+        a, b = Wing(Body(0, (1, 0))), Wing(Body(0, (1, 0)))
+        assert a.coeffs is b.coeffs is DEFAULT_COEFFS
+        custom = ClCd(Cl_max=2.0)
+        assert Wing(Body(0, (1, 0)), coeffs=custom).coeffs is custom
+
+    def test_cruise_speed_sizes_area(self):
+        wing = Wing(Body(0, (60, 0)), AoA=5, cruise_speed=60)
+        wing.apply()
+        (fx, fy), _ = wing.body.forces[0]
+        assert np.isclose(fy, 10 * 200)
+
+    def test_cruise_speed_needs_positive_lift(self):
+        for AoA, speed in [(0.0, 60), (-5, 60), (5, 0), (5, -60)]:
+            with self.assertRaises(ValueError):
+                Wing(Body(0, (60, 0)), AoA=AoA, cruise_speed=speed)
+        assert Wing(Body(0, (60, 0)), AoA=0.0).area == 1.0
+
+    def test_wing_at_rest_has_no_force(self):
+        wing = Wing(Body(0.3, (0, 0)))
+        wing.apply()
+        assert wing.body.forces == [((0.0, 0.0), (0, 0))]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+#
+# Modelo de pneus vetorizado
+#
+# Em veiculos-topdown.py cada roda calcula o próprio atrito lateral em Python
+# a cada passo. Aqui as rodas de todos os veículos são registradas em um
+# TireModel, que lê os estados (direção e velocidade) para vetores, calcula
+# as forças longitudinais (tração) e laterais (atrito) de uma vez com o
+# NumPy e aplica o resultado com uma única chamada por roda.
+#
+# Uso:
+#
+#   tires = TireModel(dt=1 / 30)
+#   tires.add_vehicle(wheels, mass, driven=[2, 3])
+#
+#   @space.before_step()
+#   def _():
+#       tires.step(throttle)
+#
+from itertools import chain
+import numpy as np
+
+
+def lateral_forces(ux, uy, vx, vy, mass, mu=0.5, grip=300, delta_vt=50, dt=1 / 30):
+    """
+    Atrito lateral de cada roda: cancela parte da velocidade perpendicular à
+    roda, limitado por mu * grip * mass (a roda derrapa acima disso).
+
+    (ux, uy) é a direção da roda e (vx, vy) a sua velocidade.
+    """
+    vt = ux * vy - uy * vx
+    force = mass * np.minimum(mu * grip, 0.25 * np.minimum(np.abs(vt), delta_vt) / dt)
+    return -np.sign(vt) * force
+
+
+class TireModel:
+    """
+    Forças dos pneus de uma frota de veículos.
+
+    As rodas são corpos com rotation_vector, velocity e
+    apply_force_at_local_point (como os segmentos de veiculos-topdown.py).
+    A massa usada no atrito de cada roda é a do veículo inteiro.
+    """
+
+    def __init__(self, mu=0.5, grip=300, delta_vt=50, dt=1 / 30):
+        self.mu = mu
+        self.grip = grip
+        self.delta_vt = delta_vt
+        self.dt = dt
+        self.wheels = []
+        self.vehicles = 0
+        self.mass = np.zeros(0)
+        self.vehicle = np.zeros(0, dtype=np.int64)
+        self.driven = np.zeros(0, dtype=bool)
+
+    def add_vehicle(self, wheels, mass, driven=()):
+        """
+        Registra as rodas de um veículo e retorna seu índice. `driven` são as
+        posições (em wheels) das rodas com tração.
+        """
+        index = self.vehicles
+        driven_mask = np.zeros(len(wheels), dtype=bool)
+        driven_mask[list(driven)] = True
+
+        self.wheels.extend(wheels)
+        self.mass = np.concatenate([self.mass, np.full(len(wheels), float(mass))])
+        self.vehicle = np.concatenate([self.vehicle, np.full(len(wheels), index)])
+        self.driven = np.concatenate([self.driven, driven_mask])
+        self.vehicles += 1
+        return index
+
+    def gather(self):
+        """
+        Vetores (ux, uy, vx, vy) com a direção e a velocidade de cada roda.
+        """
+        n = len(self.wheels)
+        u = np.fromiter(chain.from_iterable(w.rotation_vector for w in self.wheels), float, 2 * n)
+        v = np.fromiter(chain.from_iterable(w.velocity for w in self.wheels), float, 2 * n)
+        return u[0::2], u[1::2], v[0::2], v[1::2]
+
+    def forces(self, throttle=0.0):
+        """
+        Forças (longitudinal, lateral) de cada roda, no referencial da roda.
+
+        throttle é a força de tração por roda motriz: um número para todos
+        os veículos ou um vetor com um valor por veículo.
+        """
+        ux, uy, vx, vy = self.gather()
+        throttle = np.broadcast_to(np.asarray(throttle, dtype=float), (self.vehicles,))
+        longitudinal = np.where(self.driven, throttle[self.vehicle], 0.0)
+        lateral = lateral_forces(ux, uy, vx, vy, self.mass, self.mu, self.grip, self.delta_vt, self.dt)
+        return longitudinal, lateral
+
+    def step(self, throttle=0.0):
+        """
+        Calcula e aplica as forças em todas as rodas.
+        """
+        longitudinal, lateral = self.forces(throttle)
+        for w, fx, fy in zip(self.wheels, longitudinal.tolist(), lateral.tolist()):
+            w.apply_force_at_local_point((fx, fy))
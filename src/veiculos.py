@@ -1,10 +1,10 @@
 #
 # Veículos (visão lateral)
 #
-import random
 import pyxel
-from easymunk import pyxel as phys, Vec2d
+from easymunk import pyxel as phys
 from svg_path import mk_path
+from terrain import Terrain, ChunkStreamer
 
 palette = pyxel.DEFAULT_PALETTE.copy()
 palette[pyxel.COLOR_RED] = 0xAA0000
@@ -13,6 +13,7 @@ pyxel.mouse(True)
 
 # Cria objetos no espaço
 L = 5000
+SEED = 42
 space = phys.space(
     camera=phys.Camera(flip_y=True),
     gravity=(0, -300),
@@ -23,15 +24,29 @@ space = phys.space(
     bg=pyxel.COLOR_CYAN,
 )
 r = 100
-phys.margin(-L, 0, 2 * L, 500, elasticity=0, radius=r, color=pyxel.COLOR_BROWN)
 
-# Obstáculos aleatórios
-for _ in range(150):
-    x = random.uniform(-L + 100, L - 100)
-    w = random.uniform(50, 100)
-    w_ = random.uniform(50, 100)
-    h = random.uniform(2, 10)
-    phys.tri(x, r, x + w + w_, r, x + w, r + h, body_type="static", color=pyxel.COLOR_BROWN)
+# Chão e obstáculos gerados em pedaços à medida que o carro avança (as
+# colinas ficam abaixo da altura original do chão, y = r)
+terrain = Terrain(seed=SEED, base=r - 25, amplitude=20)
+
+
+def build_chunk(index):
+    ground, triangles = terrain.chunk(index)
+    segments = []
+    for a, b in zip(ground, ground[1:]):
+        segments.append(space.static_body.create_segment(a, b, radius=4, elasticity=0, color=pyxel.COLOR_BROWN))
+    bodies = [phys.tri(*tri, body_type="static", color=pyxel.COLOR_BROWN) for tri in triangles]
+    return segments, bodies
+
+
+def destroy_chunk(chunk):
+    segments, bodies = chunk
+    space.remove(*segments)
+    for b in bodies:
+        space.remove(b, *b.shapes)
+
+
+streamer = ChunkStreamer(terrain, build_chunk, destroy_chunk)
 
 
 # Cria carro
@@ -39,6 +54,7 @@ p = "m 64,100 l 20,26 43,2 21,-21 -1,-3 -51,-17 -20,0 z"
 vertices = [(x, 196 - y) for x, y in mk_path(p)]
 body = phys.poly(vertices, pyxel.COLOR_RED, offset=(-10, -5 ))  #1
 body.position -= (L / 2, 50 - r)
+streamer.update(body.position.x)
 x, y = body.position
 w1 = phys.circ(x - 45, y - 23, 15, pyxel.COLOR_BLACK, friction=1.5)
 w2 = phys.circ(x + 40, y - 25, 13, pyxel.COLOR_BLACK, friction=1.5)
@@ -74,6 +90,7 @@ def f1():
     vx, vy = body.velocity
     space.camera.offset += (vx / 20, vy / 10 + 0.5)  
     space.camera.follow(body.position, tol=(64, 48))
+    streamer.update(body.position.x)
     pyxel.text(0, 0, f'v: {int(body.velocity.x)}', pyxel.COLOR_BLACK)
 
 
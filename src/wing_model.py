@@ -0,0 +1,187 @@
+#
+# Aerodinâmica das asas
+#
+# Coeficientes de sustentação e arrasto tabelados (ClCd) e asas presas a
+# corpos do motor de física. As forças de muitas asas são calculadas de uma
+# vez com o NumPy (apply_wings): os estados são lidos para vetores, cada
+# tabela de coeficientes é consultada uma vez para todas as asas que a usam
+# e cada asa recebe uma única força.
+#
+# Uso (ver mk-planes.py):
+#
+#   wings = [Wing(plane, offset=(-1, 5), AoA=6), Wing(plane, offset=(-23, 3), area=0.25)]
+#
+#   @space.before_step()
+#   def _():
+#       apply_wings(wings)
+#
+from typing import NamedTuple
+import numpy as np
+
+RHO = 0.1
+
+
+class ClCdResult(NamedTuple):
+    Cl: float
+    Cd: float
+
+
+class ClCd:
+    """
+    Coeficientes de sustentação e arrasto em função do ângulo de ataque (em
+    graus).
+
+    Antes do estol, Cl cresce linearmente de Cl_0 até Cl_max em stall_angle
+    e Cd segue a polar parabólica Cd_0 + k Cl² com razão L/D máxima LD_max.
+    Depois do estol, os dois convergem para os de uma placa plana
+    (Cl = sin 2α, Cd = 2 sin² α). O modelo é calculado uma vez em uma tabela
+    densa de -180 a 180 graus, e a avaliação é uma interpolação linear que
+    aceita vetores de ângulos.
+    """
+
+    STEP = 0.25
+    ANGLES = np.arange(-180, 180 + STEP, STEP)
+
+    args = property(lambda self: {"Cl": self.Cl, "Cd": self.Cd})
+
+    def __init__(self, Cl_0=0.0, stall_angle=20, LD_max=10.0, Cl_max=1.0, ):
+        self.Cl_0 = Cl_0
+        self.stall_angle = stall_angle
+        self.LD_max = LD_max
+        self.Cl_max = Cl_max
+        self.Cl_table, self.Cd_table = self._tables(self.ANGLES)
+
+    def _tables(self, alpha):
+        rad = np.radians(alpha)
+        slope = (self.Cl_max - self.Cl_0) / self.stall_angle
+        Cl_linear = self.Cl_0 + slope * alpha
+
+        # Polar parabólica: L/D é máxima (= LD_max) em Cl = Cl_max / 2
+        Cl_best = self.Cl_max / 2
+        Cd_0 = Cl_best / (2 * self.LD_max)
+        k = Cd_0 / Cl_best**2
+        Cd_linear = Cd_0 + k * Cl_linear**2
+
+        # Transição suave para a placa plana em torno do ângulo de estol
+        stalled = 1 / (1 + np.exp(-(np.abs(alpha) - self.stall_angle) / 2))
+        Cl = (1 - stalled) * Cl_linear + stalled * np.sin(2 * rad)
+        Cd = (1 - stalled) * Cd_linear + stalled * np.maximum(2 * np.sin(rad) ** 2, Cd_0)
+        return Cl, Cd
+
+    @classmethod
+    def index(cls, alpha):
+        """
+        Posição (fracionária) de cada ângulo na tabela.
+        """
+        alpha = (np.asarray(alpha, dtype=float) + 180) % 360 - 180
+        pos = (alpha + 180) / cls.STEP
+        i = np.minimum(pos.astype(np.int64), len(cls.ANGLES) - 2)
+        return i, pos - i
+
+    def lookup(self, table, alpha):
+        i, t = self.index(alpha)
+        value = table[i] * (1 - t) + table[i + 1] * t
+        return value if value.ndim else float(value)
+
+    def __call__(self, alpha):
+        return ClCdResult(self.Cl(alpha), self.Cd(alpha))
+
+    def __iter__(self):
+        yield self.Cl
+        yield self.Cd
+
+    def Cl(self, alpha):
+        return self.lookup(self.Cl_table, alpha)
+
+    def Cd(self, alpha):
+        return self.lookup(self.Cd_table, alpha)
+
+    def plot(self):
+        import matplotlib.pyplot as plt
+
+        angles = np.linspace(-45, 45, 361)
+        plt.plot(angles, self.Cl(angles), label="Cl")
+        plt.plot(angles, self.Cd(angles), label="Cd")
+        plt.xlabel("ângulo de ataque (graus)")
+        plt.legend()
+        plt.show()
+
+
+# Tabela padrão, compartilhada pelas asas que não definem a sua
+DEFAULT_COEFFS = ClCd()
+
+
+class Wing:
+    """
+    Superfície de sustentação presa a um corpo.
+
+    offset é o ponto de aplicação (centro de pressão) nas coordenadas do
+    corpo e AoA o ângulo de incidência da corda em relação ao eixo x do
+    corpo. coeffs é a tabela ClCd da asa; asas com a mesma tabela são
+    consultadas juntas em apply_wings(). Se cruise_speed for dado, a área é
+    escolhida para que a asa sustente o peso do corpo nessa velocidade em
+    voo nivelado (o que exige cruise_speed > 0 e Cl(AoA) > 0).
+    """
+
+    def __init__(self, body, offset=(0, 0), AoA=0.0, cruise_speed=None, coeffs=None, area=1.0, rho=RHO):
+        self.body = body
+        self.offset = tuple(offset)
+        self.AoA = AoA
+        self.coeffs = DEFAULT_COEFFS if coeffs is None else coeffs
+        self.area = area
+        if cruise_speed is not None:
+            Cl = float(self.coeffs.Cl(AoA))
+            if cruise_speed <= 0 or Cl <= 0:
+                raise ValueError(
+                    f"cruise_speed exige velocidade e Cl(AoA) positivos (cruise_speed={cruise_speed}, "
+                    f"Cl({AoA})={Cl:.3g}); aumente o ângulo de incidência ou informe a área."
+                )
+            weight = body.mass * abs(body.space.gravity[1])
+            self.area = weight / (0.5 * rho * cruise_speed**2 * Cl)
+
+    def apply(self, rho=RHO):
+        apply_wings([self], rho)
+
+
+def apply_wings(wings, rho=RHO):
+    """
+    Aplica sustentação e arrasto em várias asas de uma vez: os estados são
+    lidos para vetores, os coeficientes vêm das tabelas de ClCd e cada asa
+    recebe uma única força no seu ponto de aplicação.
+    """
+    n = len(wings)
+    if n == 0:
+        return
+
+    # Velocidade de cada asa no referencial do corpo
+    vel = np.empty((n, 2))
+    rot = np.empty((n, 2))
+    for k, w in enumerate(wings):
+        vel[k] = w.body.velocity_at_local_point(w.offset)
+        rot[k] = w.body.rotation_vector
+    cos, sin = rot[:, 0], rot[:, 1]
+    vx = cos * vel[:, 0] + sin * vel[:, 1]
+    vy = -sin * vel[:, 0] + cos * vel[:, 1]
+    speed = np.hypot(vx, vy)
+    moving = speed > 1e-9
+
+    # Ângulo de ataque: da velocidade até a corda
+    aoa = np.radians([w.AoA for w in wings])
+    cx, cy = np.cos(aoa), np.sin(aoa)
+    alpha = np.degrees(np.arctan2(vx * cy - vy * cx, vx * cx + vy * cy))
+
+    # Índice da tabela de cada asa; cada tabela é consultada uma vez
+    tables = {}
+    group = np.array([tables.setdefault(id(w.coeffs), (len(tables), w.coeffs))[0] for w in wings])
+    Cl = np.empty(n)
+    Cd = np.empty(n)
+    for g, coeffs in tables.values():
+        sel = np.flatnonzero(group == g)
+        Cl[sel], Cd[sel] = coeffs(alpha[sel])
+
+    # Sustentação perpendicular à velocidade e arrasto contrário a ela
+    q = 0.5 * rho * speed * np.array([w.area for w in wings])
+    fx = np.where(moving, q * (-Cl * vy - Cd * vx), 0.0)
+    fy = np.where(moving, q * (Cl * vx - Cd * vy), 0.0)
+    for w, f in zip(wings, zip(fx.tolist(), fy.tolist())):
+        w.body.apply_force_at_local_point(f, w.offset)